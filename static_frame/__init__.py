@@ -21,6 +21,7 @@ from static_frame.core.exception import ErrorInitSeries
 from static_frame.core.exception import ErrorInitStore
 from static_frame.core.exception import ErrorInitStoreConfig
 from static_frame.core.exception import ErrorInitTypeBlocks
+from static_frame.core.exception import ErrorNPYEncode
 from static_frame.core.exception import LocEmpty
 from static_frame.core.exception import LocInvalid
 from static_frame.core.exception import StoreFileMutation
@@ -64,11 +65,14 @@ from static_frame.core.node_dt import InterfaceDatetime
 from static_frame.core.node_iter import IterNodeApplyType as IterNodeApplyType
 from static_frame.core.node_iter import IterNodeAxis
 from static_frame.core.node_iter import IterNodeDelegate as IterNodeDelegate
+from static_frame.core.node_iter import IterNodeDelegateReducible as IterNodeDelegateReducible
 from static_frame.core.node_iter import IterNodeDepthLevel
 from static_frame.core.node_iter import IterNodeDepthLevelAxis
 from static_frame.core.node_iter import IterNodeGroup
 from static_frame.core.node_iter import IterNodeGroupAxis
 from static_frame.core.node_iter import IterNodeNoArg
+from static_frame.core.node_iter import IterNodeReduce as IterNodeReduce
+from static_frame.core.node_iter import IterNodeReduceWindow as IterNodeReduceWindow
 from static_frame.core.node_iter import IterNodeType as IterNodeType
 from static_frame.core.node_iter import IterNodeWindow
 from static_frame.core.node_selector import InterfaceAssignQuartet
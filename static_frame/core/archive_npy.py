@@ -0,0 +1,311 @@
+'''
+Tools for writing and reading a Frame as a collection of NPY arrays, one per block and one per depth of the index and columns, described by a small JSON header.
+'''
+import contextlib
+import json
+import os
+import typing as tp
+from io import BytesIO
+
+import numpy as np
+
+from static_frame.core.exception import ErrorInitFrame
+from static_frame.core.exception import ErrorNPYEncode
+from static_frame.core.index import Index
+from static_frame.core.index import IndexGO
+from static_frame.core.index_base import IndexBase
+from static_frame.core.index_datetime import IndexDate
+from static_frame.core.index_datetime import IndexDateGO
+from static_frame.core.index_datetime import IndexHour
+from static_frame.core.index_datetime import IndexHourGO
+from static_frame.core.index_datetime import IndexMicrosecond
+from static_frame.core.index_datetime import IndexMicrosecondGO
+from static_frame.core.index_datetime import IndexMillisecond
+from static_frame.core.index_datetime import IndexMillisecondGO
+from static_frame.core.index_datetime import IndexMinute
+from static_frame.core.index_datetime import IndexMinuteGO
+from static_frame.core.index_datetime import IndexNanosecond
+from static_frame.core.index_datetime import IndexNanosecondGO
+from static_frame.core.index_datetime import IndexSecond
+from static_frame.core.index_datetime import IndexSecondGO
+from static_frame.core.index_datetime import IndexYear
+from static_frame.core.index_datetime import IndexYearGO
+from static_frame.core.index_datetime import IndexYearMonth
+from static_frame.core.index_datetime import IndexYearMonthGO
+from static_frame.core.index_hierarchy import IndexHierarchy
+from static_frame.core.index_hierarchy import IndexHierarchyGO
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.core.util import DTYPE_OBJECT_KIND
+from static_frame.core.util import PathSpecifier
+from static_frame.core.util import path_filter
+from static_frame.core.util import path_replace_manager
+
+if tp.TYPE_CHECKING:
+    from static_frame.core.frame import Frame #pylint: disable=W0611 #pragma: no cover
+
+
+NPY_HEADER = '__header__.json'
+NPY_EXT = '.npy'
+
+ArrayWriter = tp.Callable[[str, np.ndarray], None]
+ArrayReader = tp.Callable[[str], np.ndarray]
+
+_INDEX_CLASSES: tp.Dict[str, tp.Type[IndexBase]] = {cls.__name__: cls for cls in (
+        Index,
+        IndexGO,
+        IndexYear,
+        IndexYearGO,
+        IndexYearMonth,
+        IndexYearMonthGO,
+        IndexDate,
+        IndexDateGO,
+        IndexHour,
+        IndexHourGO,
+        IndexMinute,
+        IndexMinuteGO,
+        IndexSecond,
+        IndexSecondGO,
+        IndexMillisecond,
+        IndexMillisecondGO,
+        IndexMicrosecond,
+        IndexMicrosecondGO,
+        IndexNanosecond,
+        IndexNanosecondGO,
+        IndexHierarchy,
+        IndexHierarchyGO,
+        )}
+
+
+def npy_file_name(part: str, position: int) -> str:
+    '''
+    Return the name of the NPY file storing the array at ``position`` of ``part``, where ``part`` is one of "blocks", "index", or "columns".
+    '''
+    return f'__{part}_{position}__{NPY_EXT}'
+
+def _label_to_json(label: tp.Hashable) -> str:
+    try:
+        post = json.dumps(label)
+    except TypeError:
+        raise ErrorNPYEncode(f'cannot encode {label!r} as JSON; names must be None, bool, int, float, str, or tuples of these.') from None
+    return post
+
+def _json_to_label(value: tp.Any) -> tp.Hashable:
+    # JSON returns tuples as lists; as labels are hashable, all lists were tuples
+    if value.__class__ is list:
+        return tuple(_json_to_label(v) for v in value)
+    return value #type: ignore
+
+def _array_validate(array: np.ndarray) -> np.ndarray:
+    if array.dtype.kind == DTYPE_OBJECT_KIND:
+        raise ErrorNPYEncode('cannot encode object arrays without pickling; convert object columns and labels to a non-object dtype.')
+    return array
+
+#-------------------------------------------------------------------------------
+
+def _index_to_npy(
+        index: IndexBase,
+        part: str,
+        write_array: ArrayWriter,
+        ) -> tp.Dict[str, tp.Any]:
+    if index._recache:
+        index._update_array_cache()
+
+    header: tp.Dict[str, tp.Any] = {
+            'cls': index.__class__.__name__,
+            'name': json.loads(_label_to_json(index.name)),
+            'depth': index.depth,
+            }
+    if index.depth == 1:
+        write_array(npy_file_name(part, 0), _array_validate(index.values))
+        # an index that has no mapping can be restored without hashing its labels
+        header['loc_is_iloc'] = index._map is None #type: ignore
+    else:
+        for depth in range(index.depth):
+            write_array(npy_file_name(part, depth),
+                    _array_validate(index.values_at_depth(depth)))
+        header['index_types'] = [cls.__name__ for cls in index.index_types.values]
+    return header
+
+def _index_from_npy(
+        header: tp.Dict[str, tp.Any],
+        part: str,
+        read_array: ArrayReader,
+        ) -> IndexBase:
+    cls = _INDEX_CLASSES[header['cls']]
+    name = _json_to_label(header['name'])
+    depth = header['depth']
+
+    if depth == 1:
+        labels = read_array(npy_file_name(part, 0))
+        if header['loc_is_iloc']:
+            return cls(labels, name=name, loc_is_iloc=True)
+        return cls(labels, name=name)
+    blocks = TypeBlocks.from_blocks(
+            read_array(npy_file_name(part, d)) for d in range(depth))
+    return cls._from_type_blocks(blocks, #type: ignore
+            name=name,
+            index_constructors=[_INDEX_CLASSES[n] for n in header['index_types']],
+            own_blocks=True,
+            )
+
+def frame_to_npy(
+        frame: 'Frame',
+        write_array: ArrayWriter,
+        ) -> str:
+    '''
+    Pass each array of ``frame`` to ``write_array`` with the file name it is to be stored under, and return the JSON header needed to restore the Frame.
+    '''
+    blocks = frame._blocks._blocks
+    for i, array in enumerate(blocks):
+        write_array(npy_file_name('blocks', i), _array_validate(array))
+
+    header = {
+            'name': json.loads(_label_to_json(frame.name)),
+            'blocks': len(blocks),
+            'shape': frame.shape,
+            'index': _index_to_npy(frame.index, 'index', write_array),
+            'columns': _index_to_npy(frame.columns, 'columns', write_array),
+            }
+    return json.dumps(header)
+
+def frame_from_npy(
+        constructor: tp.Type['Frame'],
+        header: str,
+        read_array: ArrayReader,
+        ) -> 'Frame':
+    '''
+    Given a JSON header produced by ``frame_to_npy``, create a Frame from the arrays returned by ``read_array``. Arrays are used without a copy.
+    '''
+    try:
+        spec = json.loads(header)
+        blocks = TypeBlocks.from_blocks(
+                (read_array(npy_file_name('blocks', i)) for i in range(spec['blocks'])),
+                shape_reference=tuple(spec['shape']),
+                )
+        index = _index_from_npy(spec['index'], 'index', read_array)
+        columns = _index_from_npy(spec['columns'], 'columns', read_array)
+    except (KeyError, ValueError) as e:
+        raise ErrorInitFrame(f'invalid NPY archive: {e}') from e
+
+    return constructor(blocks,
+            index=index,
+            columns=columns,
+            name=_json_to_label(spec['name']),
+            own_data=True,
+            own_index=True,
+            )
+
+def frame_labels_from_npy(
+        header: str,
+        read_array: ArrayReader,
+        ) -> tp.Tuple[IndexBase, IndexBase]:
+    '''
+    Given a JSON header produced by ``frame_to_npy``, return the index and columns of the Frame, reading only the arrays of those labels.
+    '''
+    try:
+        spec = json.loads(header)
+        index = _index_from_npy(spec['index'], 'index', read_array)
+        columns = _index_from_npy(spec['columns'], 'columns', read_array)
+    except (KeyError, ValueError) as e:
+        raise ErrorInitFrame(f'invalid NPY archive: {e}') from e
+    return index, columns
+
+def npy_array_to_bytes(array: np.ndarray) -> bytes:
+    '''
+    Return the NPY encoding of ``array``.
+    '''
+    f = BytesIO()
+    np.lib.format.write_array(f, array, allow_pickle=False)
+    return f.getvalue()
+
+def npy_array_from_buffer(
+        buffer: tp.Any,
+        offset: int,
+        ) -> np.ndarray:
+    '''
+    Return an immutable array that views the NPY encoding found at ``offset`` of ``buffer``, an object supporting the buffer protocol (such as an ``mmap``), without copying its data.
+    '''
+    # the header length follows the six-byte magic string and two version bytes
+    prefix = np.lib.format.MAGIC_LEN
+    version = (buffer[offset + prefix - 2], buffer[offset + prefix - 1])
+    if version == (1, 0):
+        length_size = 2
+        read_header = np.lib.format.read_array_header_1_0
+    elif version == (2, 0):
+        length_size = 4
+        read_header = np.lib.format.read_array_header_2_0
+    else:
+        raise ErrorInitFrame(f'unsupported NPY version: {version}')
+
+    length = int.from_bytes(
+            buffer[offset + prefix: offset + prefix + length_size],
+            'little')
+    start = offset + prefix + length_size + length
+
+    f = BytesIO(buffer[offset + prefix: start])
+    shape, fortran_order, dtype = read_header(f)
+    count = 1
+    for size in shape:
+        count *= size
+
+    array = np.frombuffer(buffer, dtype=dtype, count=count, offset=start)
+    if len(shape) != 1:
+        array = array.reshape(shape, order='F' if fortran_order else 'C')
+    array.flags.writeable = False
+    return array
+
+#-------------------------------------------------------------------------------
+
+def frame_to_npy_dir(
+        frame: 'Frame',
+        fp: PathSpecifier,
+        ) -> None:
+    '''
+    Write ``frame`` to the directory ``fp`` as NPY files and a JSON header. The directory is created if it does not exist; existing files are replaced, not overwritten in place, such that Frames memory mapped from them remain valid.
+    '''
+    fp = path_filter(fp)
+    os.makedirs(fp, exist_ok=True)
+
+    # files are replaced rather than overwritten, as they may be memory mapped; all files are written to temporary paths and, only if all are written without error, replace existing files on exit, the header last
+    with contextlib.ExitStack() as stack:
+        fp_header = stack.enter_context(path_replace_manager(os.path.join(fp, NPY_HEADER)))
+
+        def write_array(file_name: str, array: np.ndarray) -> None:
+            fp_temp = stack.enter_context(path_replace_manager(os.path.join(fp, file_name)))
+            with open(fp_temp, 'wb') as f:
+                np.lib.format.write_array(f, array, allow_pickle=False)
+
+        header = frame_to_npy(frame, write_array)
+        with open(fp_header, 'w') as f:
+            f.write(header)
+
+def frame_from_npy_dir(
+        constructor: tp.Type['Frame'],
+        fp: PathSpecifier,
+        *,
+        memory_map: bool = False,
+        ) -> 'Frame':
+    '''
+    Read a Frame written by ``frame_to_npy_dir``. If ``memory_map`` is True, arrays are memory-mapped read-only rather than loaded.
+    '''
+    fp = path_filter(fp)
+    mmap_mode = 'r' if memory_map else None
+
+    def read_array(file_name: str) -> np.ndarray:
+        array = np.load(os.path.join(fp, file_name),
+                mmap_mode=mmap_mode,
+                allow_pickle=False,
+                )
+        if memory_map:
+            # a plain ndarray view keeps a reference to the memory map while passing class identity checks
+            array = array.view(np.ndarray)
+        array.flags.writeable = False
+        return array
+
+    try:
+        with open(os.path.join(fp, NPY_HEADER)) as f:
+            header = f.read()
+    except FileNotFoundError:
+        raise ErrorInitFrame(f'no NPY archive found in {fp}') from None
+
+    return frame_from_npy(constructor, header, read_array)
@@ -1,4 +1,10 @@
+import contextlib
+import functools
+import sys
 import typing as tp
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import Future
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import ThreadPoolExecutor
 
@@ -24,6 +30,7 @@ from static_frame.core.store_hdf5 import StoreHDF5
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
 from static_frame.core.store_zip import StoreZipCSV
+from static_frame.core.store_zip import StoreZipNPY
 from static_frame.core.store_zip import StoreZipParquet
 from static_frame.core.store_zip import StoreZipPickle
 from static_frame.core.store_zip import StoreZipTSV
@@ -40,10 +47,15 @@ from static_frame.core.util import NameType
 from static_frame.core.util import PathSpecifier
 from static_frame.core.util import UFunc
 
+if tp.TYPE_CHECKING:
+    from static_frame.core.shared_memory import SharedMemoryFuture # pylint: disable=W0611 #pragma: no cover
+
 
 FrameOrSeries = tp.Union[Frame, Series]
 IteratorFrameItems = tp.Iterator[tp.Tuple[tp.Hashable, FrameOrSeries]]
 GeneratorFrameItems = tp.Callable[..., IteratorFrameItems]
+# a caller taking a single tuple of args, paired with the args, other than the container (and label), it is to be called with
+Stage = tp.Tuple[AnyCallable, tp.Tuple[tp.Any, ...]]
 
 
 #-------------------------------------------------------------------------------
@@ -63,6 +75,11 @@ def normalize_container(post: tp.Any
         return Series.from_element(post, index=ELEMENT_TUPLE)
     return post
 
+def pool_initializer() -> None:
+    '''Called when a process worker starts, such that the cost of importing static_frame (and its dependencies) is not paid on the first task.
+    '''
+    import static_frame #pylint: disable=W0611,C0415
+
 def call_func(bundle: tp.Tuple[FrameOrSeries, AnyCallable]
         ) -> FrameOrSeries:
     container, func = bundle
@@ -79,6 +96,33 @@ def call_attr(bundle: tp.Tuple[FrameOrSeries, str, tp.Any, tp.Any]
     func = getattr(container, attr)
     return normalize_container(func(*args, **kwargs))
 
+def call_stages(bundle: tp.Tuple[FrameOrSeries, tp.Hashable, tp.Tuple[Stage, ...]]
+        ) -> FrameOrSeries:
+    # call each stage on the result of the previous stage, such that a chain of operations is evaluated in a single task
+    container, label, stages = bundle
+    for caller, args in stages:
+        if caller is call_func_items:
+            container = caller((container, *args, label))
+        else:
+            container = caller((container, *args))
+    return container
+
+def call_stages_except(bundle: tp.Tuple[FrameOrSeries, tp.Hashable, tp.Tuple[Stage, ...], tp.Type[Exception]]
+        ) -> tp.Optional[FrameOrSeries]:
+    # as call_stages, but return None if the last stage raises the exception; exceptions raised by prior stages are not silenced
+    container, label, stages, exception = bundle
+    container = call_stages((container, label, stages[:-1]))
+    try:
+        return call_stages((container, label, stages[-1:]))
+    except exception:
+        return None
+
+def call_reduce(bundle: tp.Tuple[AnyCallable, tp.List[tp.Tuple[FrameOrSeries, tp.Hashable, tp.Tuple[Stage, ...]]]]
+        ) -> tp.Any:
+    # evaluate the stages of each part and combine the results
+    func, parts = bundle
+    return functools.reduce(func, (call_stages(part) for part in parts))
+
 #-------------------------------------------------------------------------------
 class Batch(ContainerOperand, StoreClientMixin):
     '''
@@ -92,9 +136,13 @@ class Batch(ContainerOperand, StoreClientMixin):
             '_max_workers',
             '_chunksize',
             '_use_threads',
+            '_use_shared_memory',
+            '_executor',
+            '_source_stages',
             )
 
     _config: StoreConfigMap
+    _source_stages: tp.Optional[tp.Tuple[IteratorFrameItems, tp.Tuple[Stage, ...]]]
 
     @classmethod
     def from_frames(cls,
@@ -105,6 +153,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
+            executor: tp.Optional[Executor] = None,
             ) -> 'Batch':
         '''Return a :obj:`Batch` from an iterable of :obj:`Frame`; labels will be drawn from :obj:`Frame.name`.
         '''
@@ -114,6 +164,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
+                executor=executor,
                 )
 
     #---------------------------------------------------------------------------
@@ -127,6 +179,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
+            executor: tp.Optional[Executor] = None,
             ) -> 'Batch':
         config_map = StoreConfigMap.from_initializer(config)
 
@@ -138,6 +192,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
+                executor=executor,
                                 )
 
 
@@ -150,6 +206,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
+            executor: tp.Optional[Executor] = None,
             ) -> 'Batch':
         '''
         Given a file path to zipped TSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -162,6 +220,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
+                executor=executor,
                                 )
 
     @classmethod
@@ -173,6 +233,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
+            executor: tp.Optional[Executor] = None,
             ) -> 'Batch':
         '''
         Given a file path to zipped CSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -185,6 +247,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
+                executor=executor,
                                 )
 
     @classmethod
@@ -196,6 +260,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
+            executor: tp.Optional[Executor] = None,
             ) -> 'Batch':
         '''
         Given a file path to zipped pickle :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -208,9 +274,38 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
+                executor=executor,
                                 )
 
 
+    @classmethod
+    @doc_inject(selector='batch_constructor')
+    def from_zip_npy(cls,
+            fp: PathSpecifier,
+            *,
+            config: StoreConfigMapInitializer = None,
+            max_workers: tp.Optional[int] = None,
+            chunksize: int = 1,
+            use_threads: bool = False,
+            use_shared_memory: bool = False,
+            executor: tp.Optional[Executor] = None,
+            ) -> 'Batch':
+        '''
+        Given a file path to zipped NPY :obj:`Batch` store, return a :obj:`Batch` instance.
+
+        {args}
+        '''
+        store = StoreZipNPY(fp)
+        return cls._from_store(store,
+                config=config,
+                max_workers=max_workers,
+                chunksize=chunksize,
+                use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
+                executor=executor,
+                                )
+
     @classmethod
     @doc_inject(selector='batch_constructor')
     def from_zip_parquet(cls,
@@ -220,6 +315,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
+            executor: tp.Optional[Executor] = None,
             ) -> 'Batch':
         '''
         Given a file path to zipped parquet :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -232,6 +329,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
+                executor=executor,
                                 )
 
 
@@ -244,6 +343,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
+            executor: tp.Optional[Executor] = None,
             ) -> 'Batch':
         '''
         Given a file path to an XLSX :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -257,6 +358,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
+                executor=executor,
                                 )
 
 
@@ -269,6 +372,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
+            executor: tp.Optional[Executor] = None,
             ) -> 'Batch':
         '''
         Given a file path to an SQLite :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -281,6 +386,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
+                executor=executor,
                                 )
 
 
@@ -293,6 +400,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
+            executor: tp.Optional[Executor] = None,
             ) -> 'Batch':
         '''
         Given a file path to a HDF5 :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -305,6 +414,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
+                executor=executor,
                                 )
 
     #---------------------------------------------------------------------------
@@ -318,6 +429,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
+            executor: tp.Optional[Executor] = None,
             ):
         '''
         Default constructor of a :obj:`Batch`.
@@ -332,6 +445,9 @@ class Batch(ContainerOperand, StoreClientMixin):
         self._max_workers = max_workers
         self._chunksize = chunksize
         self._use_threads = use_threads
+        self._use_shared_memory = use_shared_memory
+        self._executor = executor
+        self._source_stages = None
 
     #---------------------------------------------------------------------------
     def _derive(self,
@@ -346,6 +462,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=self._max_workers,
                 chunksize=self._chunksize,
                 use_threads=self._use_threads,
+                use_shared_memory=self._use_shared_memory,
+                executor=self._executor,
                 )
 
     #---------------------------------------------------------------------------
@@ -401,48 +519,140 @@ class Batch(ContainerOperand, StoreClientMixin):
             header = self.__class__.__name__
         return f'<{header} at {hex(id(self))}>'
 
+    #---------------------------------------------------------------------------
+    # executor management
+
+    def _executor_new(self) -> Executor:
+        '''Create an executor as configured by ``max_workers`` and ``use_threads``; process workers import static_frame when started.
+        '''
+        if self._use_threads:
+            return ThreadPoolExecutor(max_workers=self._max_workers)
+        if sys.version_info < (3, 7): # initializer is not supported
+            return ProcessPoolExecutor(max_workers=self._max_workers)
+        return ProcessPoolExecutor(max_workers=self._max_workers,
+                initializer=pool_initializer,
+                )
+
+    @contextlib.contextmanager
+    def _executor_context(self) -> tp.Iterator[Executor]:
+        '''Provide the executor given at initialization, which is left open; otherwise, provide a new executor that is shut down on exit.
+        '''
+        if self._executor is not None:
+            yield self._executor
+        else:
+            with self._executor_new() as executor:
+                yield executor
+
+    def _use_shared_memory_active(self) -> bool:
+        if not self._use_shared_memory:
+            return False
+        if self._executor is not None:
+            return not isinstance(self._executor, ThreadPoolExecutor)
+        return not self._use_threads
+
+    @contextlib.contextmanager
+    def pool(self) -> tp.Iterator['Batch']:
+        '''
+        Context manager that starts a single executor, as configured by ``max_workers`` and ``use_threads``, and provides a new :obj:`Batch` that uses that executor for all operations, including those of :obj:`Batch` derived from it. The executor is shut down on exit; as :obj:`Batch` operations are lazy, results must be evaluated within the context.
+        '''
+        if self._executor is not None:
+            yield self
+            return
+
+        executor = self._executor_new()
+        try:
+            yield self.__class__(self._items,
+                    name=self._name,
+                    config=self._config,
+                    max_workers=self._max_workers,
+                    chunksize=self._chunksize,
+                    use_threads=self._use_threads,
+                    use_shared_memory=self._use_shared_memory,
+                    executor=executor,
+                    )
+        finally:
+            executor.shutdown(wait=True)
+
     #---------------------------------------------------------------------------
     # core function application routines
 
+    def _stages_extend(self,
+            stage: Stage,
+            ) -> tp.Tuple[IteratorFrameItems, tp.Tuple[Stage, ...]]:
+        '''Return the items and stages to be evaluated for a new stage: if this Batch is itself the unevaluated product of pool stages, extend those stages and draw from their source, such that the chain is evaluated in one worker task per Frame.
+        '''
+        if self._source_stages is not None:
+            source, stages = self._source_stages
+            return source, stages + (stage,)
+        return self._items, (stage,)
+
     def _apply_pool(self,
-            labels: tp.List[tp.Hashable],
-            arg_iter: tp.Iterator[tp.Tuple[tp.Any, ...]],
-            caller: tp.Callable[..., FrameOrSeries],
+            stage: Stage,
             ) -> 'Batch':
 
-        pool_executor = ThreadPoolExecutor if self._use_threads else ProcessPoolExecutor
+        source, stages = self._stages_extend(stage)
+        use_shared_memory = self._use_shared_memory_active()
+
+        labels = []
+        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, tp.Hashable, tp.Tuple[Stage, ...]]]:
+            for label, frame in source:
+                labels.append(label)
+                yield frame, label, stages
 
         def gen_pool() -> IteratorFrameItems:
-            with pool_executor(max_workers=self._max_workers) as executor:
-                yield from zip(labels,
-                        executor.map(caller, arg_iter, chunksize=self._chunksize)
-                        )
-        return self._derive(gen_pool)
+            with self._executor_context() as executor:
+                if use_shared_memory:
+                    from static_frame.core.shared_memory import shared_memory_map #pylint: disable=C0415
+                    results = shared_memory_map(executor,
+                            call_stages,
+                            arg_gen(),
+                            chunksize=self._chunksize,
+                            )
+                else:
+                    results = executor.map(call_stages, arg_gen(), chunksize=self._chunksize)
+                yield from zip(labels, results)
+
+        post = self._derive(gen_pool)
+        post._source_stages = (source, stages)
+        return post
 
     def _apply_pool_except(self,
-            labels: tp.List[tp.Hashable],
-            arg_iter: tp.Iterator[tp.Tuple[tp.Any, ...]],
-            caller: tp.Callable[..., FrameOrSeries],
+            stage: Stage,
             exception: tp.Type[Exception],
             ) -> 'Batch':
 
         if self._chunksize != 1:
             raise NotImplementedError('Cannot use apply_except idioms with chunksize other than 1')
 
-        pool_executor = ThreadPoolExecutor if self._use_threads else ProcessPoolExecutor
+        source, stages = self._stages_extend(stage)
+        use_shared_memory = self._use_shared_memory_active()
 
         def gen_pool() -> IteratorFrameItems:
-            futures = []
-            with pool_executor(max_workers=self._max_workers) as executor:
-                for args in arg_iter:
-                    futures.append(executor.submit(caller, args))
-
-                for label, future in zip(labels, futures):
-                    try:
+            futures: tp.Deque[tp.Tuple[tp.Hashable, tp.Union[Future, 'SharedMemoryFuture']]] = deque()
+            with self._executor_context() as executor:
+                if use_shared_memory:
+                    from static_frame.core.shared_memory import shared_memory_submit #pylint: disable=C0415
+                try:
+                    for label, frame in source:
+                        args = (frame, label, stages, exception)
+                        if use_shared_memory:
+                            futures.append((label, shared_memory_submit(executor, call_stages_except, args)))
+                        else:
+                            futures.append((label, executor.submit(call_stages_except, args)))
+
+                    while futures:
+                        label, future = futures.popleft()
                         container = future.result()
-                    except exception:
-                        continue
-                    yield label, container
+                        if container is not None:
+                            yield label, container
+                finally:
+                    # if not fully consumed, or on error, discard remaining results
+                    while futures:
+                        _, future = futures.popleft()
+                        if use_shared_memory:
+                            future.release() #type: ignore
+                        else:
+                            future.cancel()
 
         return self._derive(gen_pool)
 
@@ -454,37 +664,25 @@ class Batch(ContainerOperand, StoreClientMixin):
         '''
         Apply a method on a Frame given as an attr string.
         '''
-        if self._max_workers is None:
+        if self._max_workers is None and self._executor is None:
             def gen() -> IteratorFrameItems:
                 for label, frame in self._items:
                     yield label, call_attr((frame, attr, args, kwargs))
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, str, tp.Any, tp.Any]]:
-            for label, frame in self._items:
-                labels.append(label)
-                yield frame, attr, args, kwargs
-
-        return self._apply_pool(labels, arg_gen(), call_attr)
+        return self._apply_pool((call_attr, (attr, args, kwargs)))
 
     def apply(self, func: AnyCallable) -> 'Batch':
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the :obj:`Frame` as an argument.
         '''
-        if self._max_workers is None:
+        if self._max_workers is None and self._executor is None:
             def gen() -> IteratorFrameItems:
                 for label, frame in self._items:
                     yield label, call_func((frame, func))
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable]]:
-            for label, frame in self._items:
-                labels.append(label)
-                yield frame, func
-
-        return self._apply_pool(labels, arg_gen(), call_func)
+        return self._apply_pool((call_func, (func,)))
 
     def apply_except(self,
             func: AnyCallable,
@@ -493,7 +691,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the :obj:`Frame` as an argument. Exceptions raised that matching the `except` argument will be silenced.
         '''
-        if self._max_workers is None:
+        if self._max_workers is None and self._executor is None:
             def gen() -> IteratorFrameItems:
                 for label, frame in self._items:
                     try:
@@ -502,35 +700,19 @@ class Batch(ContainerOperand, StoreClientMixin):
                         pass
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable]]:
-            for label, frame in self._items:
-                labels.append(label)
-                yield frame, func
-
-        return self._apply_pool_except(labels,
-                arg_gen(),
-                call_func,
-                exception,
-                )
+        return self._apply_pool_except((call_func, (func,)), exception)
 
     def apply_items(self, func: AnyCallable) -> 'Batch':
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the pair of label, :obj:`Frame` as an argument.
         '''
-        if self._max_workers is None:
+        if self._max_workers is None and self._executor is None:
             def gen() -> IteratorFrameItems:
                 for label, frame in self._items:
                     yield label, call_func_items((frame, func, label))
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable, tp.Hashable]]:
-            for label, frame in self._items:
-                labels.append(label)
-                yield frame, func, label
-
-        return self._apply_pool(labels, arg_gen(), call_func_items)
+        return self._apply_pool((call_func_items, (func,)))
 
     def apply_items_except(self,
             func: AnyCallable,
@@ -539,7 +721,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the pair of label, :obj:`Frame` as an argument. Exceptions raised that matching the `except` argument will be silenced.
         '''
-        if self._max_workers is None:
+        if self._max_workers is None and self._executor is None:
             def gen() -> IteratorFrameItems:
                 for label, frame in self._items:
                     try:
@@ -548,17 +730,68 @@ class Batch(ContainerOperand, StoreClientMixin):
                         pass
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable, tp.Hashable]]:
-            for label, frame in self._items:
-                labels.append(label)
-                yield frame, func, label
+        return self._apply_pool_except((call_func_items, (func,)), exception)
 
-        return self._apply_pool_except(labels,
-                arg_gen(),
-                call_func_items,
-                exception,
-                )
+    #---------------------------------------------------------------------------
+    # reduction
+
+    def reduce(self,
+            func: AnyCallable,
+            *,
+            initial: tp.Any = None,
+            ) -> tp.Any:
+        '''
+        Combine the :obj:`Frame` contained in this :obj:`Batch` into a single value, where ``func`` is given two values (each a contained :obj:`Frame` or a prior result) and returns one. If ``initial`` is given, it is combined before all other values. When using a pool, values are combined in adjacent pairs within the pool, forming a tree of log depth; ``func`` must be associative.
+        '''
+        if self._max_workers is None and self._executor is None:
+            values = (frame for _, frame in self._items)
+            if initial is None:
+                initial = next(values, None)
+                if initial is None:
+                    raise RuntimeError('cannot reduce an empty Batch without an initial value')
+            return functools.reduce(func, values, initial)
+
+        if self._source_stages is not None:
+            source, stages = self._source_stages
+        else:
+            source, stages = self._items, ()
+
+        parts = [(frame, label, stages) for label, frame in source]
+        if not parts:
+            if initial is None:
+                raise RuntimeError('cannot reduce an empty Batch without an initial value')
+            return initial
+
+        use_shared_memory = self._use_shared_memory_active()
+
+        with self._executor_context() as executor:
+            while True:
+                # the first level must be evaluated to apply stages, even if there is only one part
+                bundles = [(func, parts[i: i+2]) for i in range(0, len(parts), 2)]
+                if use_shared_memory:
+                    from static_frame.core.shared_memory import shared_memory_map #pylint: disable=C0415
+                    results = shared_memory_map(executor, call_reduce, bundles)
+                else:
+                    results = executor.map(call_reduce, bundles)
+                parts = [(post, None, ()) for post in results]
+                if len(parts) == 1:
+                    break
+
+        post = parts[0][0]
+        if initial is None:
+            return post
+        return func(initial, post)
+
+    def map_reduce(self,
+            map_func: AnyCallable,
+            reduce_func: AnyCallable,
+            *,
+            initial: tp.Any = None,
+            ) -> tp.Any:
+        '''
+        Apply ``map_func`` to each :obj:`Frame` contained in this :obj:`Batch` and combine the results with ``reduce_func``, as with :obj:`Batch.reduce`. When using a pool, each :obj:`Frame` is mapped and combined within the pool, and only the final result is returned to the calling process.
+        '''
+        return self.apply(map_func).reduce(reduce_func, initial=initial)
 
     #---------------------------------------------------------------------------
     # extraction
@@ -1,4 +1,6 @@
 
+import queue
+import threading
 import typing as tp
 
 import numpy as np
@@ -13,6 +15,7 @@ from static_frame.core.exception import ErrorInitBus
 from static_frame.core.frame import Frame
 from static_frame.core.index_auto import RelabelInput
 from static_frame.core.index_base import IndexBase
+from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.node_iter import IterNodeNoArg
 from static_frame.core.node_iter import IterNodeType
 from static_frame.core.node_selector import InterfaceGetItem
@@ -21,11 +24,13 @@ from static_frame.core.series import Series
 from static_frame.core.store import Store
 from static_frame.core.store import StoreConfigMap
 from static_frame.core.store import StoreConfigMapInitializer
+from static_frame.core.store import StoreManifest
 from static_frame.core.store_client_mixin import StoreClientMixin
 from static_frame.core.store_hdf5 import StoreHDF5
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
 from static_frame.core.store_zip import StoreZipCSV
+from static_frame.core.store_zip import StoreZipNPY
 from static_frame.core.store_zip import StoreZipParquet
 from static_frame.core.store_zip import StoreZipPickle
 from static_frame.core.store_zip import StoreZipTSV
@@ -53,7 +58,7 @@ class FrameDeferred(metaclass=FrameDeferredMeta):
 #-------------------------------------------------------------------------------
 class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
     '''
-    A randomly-accessible container of :obj:`Frame`. When created from a multi-table storage format (such as a zip-pickle or XLSX), a Bus will lazily read in components as they are accessed. When combined with the ``max_persist`` parameter, a Bus will not hold on to more than ``max_persist`` references, permitting low-memory reading of collections of :obj:`Frame`.
+    A randomly-accessible container of :obj:`Frame`. When created from a multi-table storage format (such as a zip-pickle or XLSX), a Bus will lazily read in components as they are accessed. When combined with the ``max_persist`` parameter, a Bus will not hold on to more than ``max_persist`` references, permitting low-memory reading of collections of :obj:`Frame`. Similarly, the ``max_persist_bytes`` parameter bounds the total :obj:`Frame.nbytes` held.
     '''
 
     __slots__ = (
@@ -64,6 +69,9 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         '_config',
         '_last_accessed',
         '_max_persist',
+        '_max_persist_bytes',
+        '_persist_bytes',
+        '_prefetch',
         )
 
     _series: Series
@@ -150,11 +158,15 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: tp.Optional[int] = None,
             ) -> 'Bus':
         return cls(cls._deferred_series(store.labels(config=config)),
                 store=store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 )
 
 
@@ -165,6 +177,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: tp.Optional[int] = None,
             ) -> 'Bus':
         '''
         Given a file path to zipped TSV :obj:`Bus` store, return a :obj:`Bus` instance.
@@ -175,6 +189,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 )
 
     @classmethod
@@ -184,6 +200,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: tp.Optional[int] = None,
             ) -> 'Bus':
         '''
         Given a file path to zipped CSV :obj:`Bus` store, return a :obj:`Bus` instance.
@@ -194,6 +212,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 )
 
     @classmethod
@@ -203,6 +223,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: tp.Optional[int] = None,
             ) -> 'Bus':
         '''
         Given a file path to zipped pickle :obj:`Bus` store, return a :obj:`Bus` instance.
@@ -213,6 +235,31 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
+                )
+
+    @classmethod
+    @doc_inject(selector='bus_constructor')
+    def from_zip_npy(cls,
+            fp: PathSpecifier,
+            *,
+            config: StoreConfigMapInitializer = None,
+            max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: tp.Optional[int] = None,
+            ) -> 'Bus':
+        '''
+        Given a file path to zipped NPY :obj:`Bus` store, return a :obj:`Bus` instance.
+
+        {args}
+        '''
+        store = StoreZipNPY(fp)
+        return cls._from_store(store,
+                config=config,
+                max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 )
 
     @classmethod
@@ -222,6 +269,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: tp.Optional[int] = None,
             ) -> 'Bus':
         '''
         Given a file path to zipped parquet :obj:`Bus` store, return a :obj:`Bus` instance.
@@ -232,6 +281,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 )
 
     @classmethod
@@ -241,6 +292,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: tp.Optional[int] = None,
             ) -> 'Bus':
         '''
         Given a file path to an XLSX :obj:`Bus` store, return a :obj:`Bus` instance.
@@ -252,6 +305,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 )
 
     @classmethod
@@ -261,6 +316,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: tp.Optional[int] = None,
             ) -> 'Bus':
         '''
         Given a file path to an SQLite :obj:`Bus` store, return a :obj:`Bus` instance.
@@ -271,6 +328,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 )
 
     @classmethod
@@ -280,6 +339,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: tp.Optional[int] = None,
             ) -> 'Bus':
         '''
         Given a file path to a HDF5 :obj:`Bus` store, return a :obj:`Bus` instance.
@@ -290,6 +351,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                prefetch=prefetch,
                 )
 
     #---------------------------------------------------------------------------
@@ -300,6 +363,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
             store: tp.Optional[Store] = None,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            prefetch: tp.Optional[int] = None,
             ):
         '''
         Default Bus constructor.
@@ -311,16 +376,21 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
             raise ErrorInitBus(
                     f'Series passed to initializer must have dtype object, not {series.dtype}')
 
-        if max_persist is not None:
+        persist_active = max_persist is not None or max_persist_bytes is not None
+        if persist_active:
             # use an (ordered) dictionary to give use an ordered set, simply pointing to None for all keys
             self._last_accessed: tp.Dict[str, None] = {}
+        persist_bytes = 0
 
         # do a one time iteration of series
         def gen() -> tp.Iterator[bool]:
+            nonlocal persist_bytes
             for label, value in series.items():
                 if isinstance(value, Frame):
-                    if max_persist is not None:
+                    if persist_active:
                         self._last_accessed[label] = None
+                    if max_persist_bytes is not None:
+                        persist_bytes += value.nbytes
                     yield True
                 elif value is FrameDeferred:
                     yield False
@@ -335,7 +405,14 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         # Not handling cases of max_persist being greater than the length of the Series (might floor to length)
         if max_persist is not None and max_persist < self._loaded.sum():
             raise ErrorInitBus('max_persis cannot be less than the number of already loaded Frames')
+        # NOTE: loaded Frames may exceed max_persist_bytes, as the most-recently accessed Frame is always retained; Frames will be evicted on the next load
         self._max_persist = max_persist
+        self._max_persist_bytes = max_persist_bytes
+        self._persist_bytes = persist_bytes
+
+        if prefetch is not None and prefetch < 1:
+            raise ErrorInitBus('prefetch must be greater than zero')
+        self._prefetch = prefetch
 
         # providing None will result in default; providing a StoreConfig or StoreConfigMap will return an appropriate map
         self._config = StoreConfigMap.from_initializer(config)
@@ -350,6 +427,8 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
                 store=self._store,
                 config=self._config,
                 max_persist=self._max_persist,
+                max_persist_bytes=self._max_persist_bytes,
+                prefetch=self._prefetch,
                 )
 
     # ---------------------------------------------------------------------------
@@ -555,14 +634,94 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
                 yield store.read(label, config=config[labels])
 
 
-    def _update_series_cache_iloc(self, key: GetItemKeyType) -> None:
+    @staticmethod
+    def _store_reader_prefetch(
+            store: Store,
+            config: StoreConfigMap,
+            labels: tp.Sequence[tp.Hashable],
+            prefetch: int,
+            ) -> tp.Generator[tp.Optional[Frame], tp.Optional[tp.Hashable], None]:
+        '''
+        Read Frames for ``labels`` with ``Store.read_many`` in a background thread, holding up to ``prefetch`` Frames ahead of the consumer. The returned generator must first be started with ``next``; thereafter, ``next`` returns Frames in the order of ``labels``, while ``send`` with a label returns the Frame for that label, read in the background thread in preference to prefetching. Exceptions raised when reading are raised to the consumer.
+        '''
+        results: queue.Queue = queue.Queue(maxsize=prefetch) #type: ignore
+        requests: queue.Queue = queue.Queue() #type: ignore
+        responses: queue.Queue = queue.Queue() #type: ignore
+        stop = threading.Event()
+
+        def respond(label: tp.Hashable) -> None:
+            try:
+                frame, = store.read_many((label,), config=config)
+                responses.put((frame, None))
+            except BaseException as e: #pylint: disable=W0703
+                responses.put((None, e))
+
+        def respond_all() -> None:
+            while True:
+                try:
+                    label = requests.get_nowait()
+                except queue.Empty:
+                    return
+                respond(label)
+
+        def put(item: tp.Tuple[tp.Optional[Frame], tp.Optional[BaseException]]) -> bool:
+            while not stop.is_set():
+                respond_all()
+                try:
+                    results.put(item, timeout=0.05)
+                    return True
+                except queue.Full:
+                    pass
+            return False # the consumer has stopped
+
+        def read() -> None:
+            try:
+                for frame in store.read_many(labels, config=config):
+                    if not put((frame, None)):
+                        return
+            except BaseException as e: #pylint: disable=W0703
+                if not put((None, e)):
+                    return
+            while not stop.is_set():
+                try:
+                    respond(requests.get(timeout=0.05))
+                except queue.Empty:
+                    pass
+
+        thread = threading.Thread(target=read, daemon=True)
+        thread.start()
+        try:
+            remaining = len(labels)
+            label = yield None
+            while True:
+                if label is not None:
+                    requests.put(label)
+                    frame, exception = responses.get()
+                elif remaining:
+                    remaining -= 1
+                    frame, exception = results.get()
+                else:
+                    return
+                if exception is not None:
+                    raise exception
+                label = yield frame
+        finally:
+            stop.set()
+            thread.join()
+
+    def _update_series_cache_iloc(self,
+            key: GetItemKeyType,
+            store_reader: tp.Optional[tp.Iterator[Frame]] = None,
+            ) -> None:
         '''
         Update the Series cache with the key specified, where key can be any iloc GetItemKeyType.
 
         Args:
             key: always an iloc key.
+            store_reader: optionally, an iterator of the deferred Frame selected by ``key``, in order, to use in place of reading from the Store.
         '''
-        max_persist_active = self._max_persist is not None
+        max_persist_active = (self._max_persist is not None
+                or self._max_persist_bytes is not None)
 
         load = False if self._loaded_all else not self._loaded[key].all()
         if not load and not max_persist_active:
@@ -579,6 +738,7 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
             raise RuntimeError('no store defined')
         if max_persist_active:
             loaded_count = self._loaded.sum()
+            max_persist = self._max_persist if self._max_persist is not None else len(index)
 
         array = self._series.values.copy() # not a deepcopy
         targets = self._series.iloc[key] # key is iloc key
@@ -586,14 +746,16 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         if not isinstance(targets, Series):
             label = index[key] #type: ignore [unreachable]
             targets_items = ((label, targets),) # present element as items
-            store_reader = (self._store.read(label, config=self._config[label]) for _ in  range(1))
+            if store_reader is None:
+                store_reader = (self._store.read(label, config=self._config[label]) for _ in  range(1))
         else: # more than one Frame
-            store_reader = self._store_reader(
-                    store=self._store,
-                    config=self._config,
-                    labels=(label for label, f in targets.items() if f is FrameDeferred),
-                    max_persist=self._max_persist,
-                    )
+            if store_reader is None:
+                store_reader = self._store_reader(
+                        store=self._store,
+                        config=self._config,
+                        labels=(label for label, f in targets.items() if f is FrameDeferred),
+                        max_persist=self._max_persist,
+                        )
             targets_items = targets.items()
 
         for label, frame in targets_items:
@@ -611,11 +773,19 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
                 self._loaded[idx] = True # update loaded status
                 if max_persist_active:
                     loaded_count += 1
-
-            if max_persist_active and loaded_count > self._max_persist:
+                    if self._max_persist_bytes is not None:
+                        self._persist_bytes += frame.nbytes
+
+            # evict the least-recently accessed Frame until within limits, never evicting the Frame just accessed
+            while max_persist_active and (loaded_count > max_persist
+                    or (self._max_persist_bytes is not None
+                    and self._persist_bytes > self._max_persist_bytes
+                    and loaded_count > 1)):
                 label_remove = next(iter(self._last_accessed))
                 del self._last_accessed[label_remove]
                 idx_remove = index._loc_to_iloc(label_remove)
+                if self._max_persist_bytes is not None:
+                    self._persist_bytes -= array[idx_remove].nbytes
                 self._loaded[idx_remove] = False
                 array[idx_remove] = FrameDeferred
                 loaded_count -= 1
@@ -706,10 +876,58 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
     #---------------------------------------------------------------------------
     # dictionary-like interface; these will force loadings contained Frame
 
+    def _items_prefetch(self) -> tp.Iterator[tp.Tuple[tp.Hashable, Frame]]:
+        '''Iterator of pairs of label and :obj:`Frame`, where deferred :obj:`Frame` are read ahead of iteration in a background thread.
+        '''
+        if self._store is None: # there has to be a Store defined if we are partially loaded
+            raise RuntimeError('no store defined')
+
+        index = self._series._index
+        labels_all = list(index)
+        # only Frames deferred at the start are prefetched; Frames evicted before being reached are read when reached
+        pending = set(np.nonzero(~self._loaded)[0].tolist())
+        labels = [labels_all[i] for i in sorted(pending)]
+        prefetch = self._prefetch
+        if self._max_persist is not None:
+            # do not hold more Frame in reserve than may be held in the Bus
+            prefetch = min(prefetch, self._max_persist) #type: ignore
+
+        store_reader = self._store_reader_prefetch(
+                store=self._store,
+                config=self._config,
+                labels=labels,
+                prefetch=prefetch, #type: ignore
+                )
+        next(store_reader) # start the reader
+        try:
+            for i, label in enumerate(labels_all):
+                if i in pending:
+                    pending.remove(i)
+                    if self._loaded[i]:
+                        # a reference was retained elsewhere; discard the read Frame
+                        next(store_reader)
+                        self._update_series_cache_iloc(i)
+                    else:
+                        self._update_series_cache_iloc(i, store_reader=store_reader)
+                elif self._loaded[i]:
+                    self._update_series_cache_iloc(i)
+                else: # evicted before being reached; read in the reader thread
+                    frame = store_reader.send(label)
+                    self._update_series_cache_iloc(i, store_reader=iter((frame,)))
+                yield label, self._series.values[i]
+        finally:
+            store_reader.close()
+
     def items(self) -> tp.Iterator[tp.Tuple[tp.Hashable, Frame]]:
         '''Iterator of pairs of :obj:`Bus` label and contained :obj:`Frame`.
         '''
-        if self._max_persist is None: # load all at once if possible
+        if (self._prefetch is not None
+                and not self._loaded_all
+                and self._store is not None
+                and self._store._THREAD_SAFE):
+            yield from self._items_prefetch()
+
+        elif self._max_persist is None and self._max_persist_bytes is None: # load all at once if possible
             if not self._loaded_all:
                 self._update_series_cache_iloc(key=NULL_SLICE)
             yield from self._series.items()
@@ -720,19 +938,46 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
 
     _items_store = items
 
+    def _index_columns_items(self) -> tp.Iterator[tp.Tuple[tp.Hashable, IndexBase, IndexBase]]:
+        '''Iterator of triples of :obj:`Bus` label, and the index and columns of the contained :obj:`Frame`. Deferred :obj:`Frame` are not loaded; their labels are read from the Store.
+        '''
+        if self._loaded_all:
+            for label, f in self._series.items():
+                yield label, f.index, f.columns
+            return
+
+        if self._store is None: # there has to be a Store defined if we are partially loaded
+            raise RuntimeError('no store defined')
+
+        index = self._series._index
+        loaded = self._loaded.copy()
+        values = self._series.values.copy()
+        store_labels = self._store.read_labels_many(
+                index.values[~loaded].tolist(),
+                config=self._config,
+                )
+        for i, label in enumerate(index):
+            if loaded[i]:
+                f = values[i]
+                yield label, f.index, f.columns
+            else:
+                yield (label, *next(store_labels))
+
     @property
     def values(self) -> np.ndarray:
         '''A 1D object array of all Frame contained in the Bus.
         '''
-        if self._max_persist is None: # load all at once if possible
+        if (self._max_persist is None
+                and self._max_persist_bytes is None
+                and self._prefetch is None): # load all at once if possible
             if not self._loaded_all:
                 self._update_series_cache_iloc(key=NULL_SLICE)
             return self._series.values
 
-        # force new iteration to account for max_persist
+        # force new iteration to account for max_persist and prefetch
         post = np.empty(self.__len__(), dtype=object)
-        for i, _ in enumerate(self._series._index):
-            post[i] = self._extract_iloc(i)
+        for i, (_, frame) in enumerate(self.items()):
+            post[i] = frame
         post.flags.writeable = False
 
         return post
@@ -778,28 +1023,67 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
 
         return Series.from_items(gen())
 
+    def _manifest(self) -> tp.Dict[tp.Hashable, StoreManifest]:
+        '''Return a mapping of label to :obj:`StoreManifest` for unloaded :obj:`Frame` described by the Store; the mapping is empty if the Store has no manifest.
+        '''
+        if self._loaded_all or self._store is None:
+            return {}
+        return self._store.manifest(config=self._config) or {}
+
     @property
     def dtypes(self) -> Frame:
-        '''Returns a Frame of dtypes for all loaded Frames.
+        '''Returns a Frame of dtypes for all loaded Frames, and for unloaded Frames described by a Store manifest.
         '''
-        if not self._loaded.any():
+        manifest = self._manifest()
+
+        def gen() -> tp.Iterator[Series]:
+            for label, f in zip(self._series._index, self._series.values):
+                if f is not FrameDeferred:
+                    yield f.dtypes
+                    continue
+                m = manifest.get(label)
+                if m is None or m.dtypes is None:
+                    continue
+                columns = [c for c, _ in m.dtypes]
+                yield Series((dt for _, dt in m.dtypes),
+                        index=(IndexHierarchy.from_labels(columns)
+                                if m.columns_depth > 1 else columns),
+                        dtype=DTYPE_OBJECT,
+                        name=label,
+                        )
+
+        dtypes = list(gen())
+        if not dtypes:
             return Frame(index=self._series.index)
 
         f = Frame.from_concat(
-                frames=(f.dtypes for f in self._series.values if f is not FrameDeferred),
+                frames=dtypes,
                 fill_value=None,
                 ).reindex(index=self._series.index, fill_value=None)
         return tp.cast(Frame, f)
 
+    def _shapes(self,
+            manifest: tp.Dict[tp.Hashable, StoreManifest],
+            ) -> tp.Iterator[tp.Optional[tp.Tuple[int, int]]]:
+        for label, f in zip(self._series._index, self._series.values):
+            if f is not FrameDeferred:
+                yield f.shape
+            else:
+                m = manifest.get(label)
+                yield None if m is None else m.shape
+
     @property
     def shapes(self) -> Series:
-        '''A :obj:`Series` describing the shape of each loaded :obj:`Frame`. Unloaded :obj:`Frame` will have a shape of None.
+        '''A :obj:`Series` describing the shape of each loaded :obj:`Frame`, and of unloaded :obj:`Frame` described by a Store manifest. Other unloaded :obj:`Frame` will have a shape of None.
 
         Returns:
             :obj:`tp.Tuple[int]`
         '''
-        values = (f.shape if f is not FrameDeferred else None for f in self._series.values)
-        return Series(values, index=self._series._index, dtype=object, name='shape')
+        return Series(self._shapes(self._manifest()),
+                index=self._series._index,
+                dtype=object,
+                name='shape',
+                )
 
     @property
     def nbytes(self) -> int:
@@ -810,24 +1094,32 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
     @property
     def status(self) -> Frame:
         '''
-        Return a :obj:`Frame` indicating loaded status, size, bytes, and shape of all loaded :obj:`Frame`.
+        Return a :obj:`Frame` indicating loaded status, size, bytes, and shape of all loaded :obj:`Frame`, and of unloaded :obj:`Frame` described by a Store manifest.
         '''
+        manifest = self._manifest()
+        index = self._series._index
+
         def gen() -> tp.Iterator[Series]:
 
             yield Series(self._loaded,
-                    index=self._series._index,
+                    index=index,
                     dtype=DTYPE_BOOL,
                     name='loaded')
 
-            for attr, dtype, missing in (
-                    ('size', DTYPE_FLOAT_DEFAULT, np.nan),
-                    ('nbytes', DTYPE_FLOAT_DEFAULT, np.nan),
-                    ('shape', DTYPE_OBJECT, None)
-                    ):
+            size = (np.nan if shape is None else shape[0] * shape[1]
+                    for shape in self._shapes(manifest))
+            yield Series(size, index=index, dtype=DTYPE_FLOAT_DEFAULT, name='size')
+
+            def nbytes() -> tp.Iterator[float]:
+                for label, f in zip(index, self._series.values):
+                    if f is not FrameDeferred:
+                        yield f.nbytes
+                    else:
+                        m = manifest.get(label)
+                        yield np.nan if m is None or m.nbytes is None else m.nbytes
 
-                values = (getattr(f, attr) if f is not FrameDeferred
-                        else missing for f in self._series.values)
-                yield Series(values, index=self._series._index, dtype=dtype, name=attr)
+            yield Series(nbytes(), index=index, dtype=DTYPE_FLOAT_DEFAULT, name='nbytes')
+            yield Series(self._shapes(manifest), index=index, dtype=DTYPE_OBJECT, name='shape')
 
         return tp.cast(Frame, Frame.from_concat(gen(), axis=1))
 
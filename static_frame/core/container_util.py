@@ -3,6 +3,7 @@ This module us for utilty functions that take as input and / or return Container
 '''
 
 from collections import defaultdict
+from itertools import islice
 from itertools import zip_longest
 from functools import partial
 import datetime
@@ -13,6 +14,7 @@ import numpy as np
 from numpy import char as npc
 
 from static_frame.core.index_base import IndexBase
+from static_frame.core.index_correspondence import IndexCorrespondence
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import Bloc2DKeyType
 from static_frame.core.util import column_2d_filter
@@ -20,6 +22,7 @@ from static_frame.core.util import concat_resolved
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DepthLevelSpecifier
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_STR
 from static_frame.core.util import DTYPE_STR_KINDS
@@ -30,6 +33,10 @@ from static_frame.core.util import IndexConstructor
 from static_frame.core.util import IndexConstructors
 from static_frame.core.util import IndexInitializer
 from static_frame.core.util import iterable_to_array_1d
+from static_frame.core.util import join_arrays_to_ilocs
+from static_frame.core.util import array_window_reduce
+from static_frame.core.util import array_window_view
+from static_frame.core.util import window_positions
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import slice_to_ascending_slice
 from static_frame.core.util import STATIC_ATTR
@@ -39,8 +46,10 @@ from static_frame.core.util import INT_TYPES
 from static_frame.core.util import NameType
 from static_frame.core.util import is_dtype_specifier
 from static_frame.core.util import is_mapping
+from static_frame.core.util import str_array_to_array
 
 from static_frame.core.exception import AxisInvalid
+from static_frame.core.exception import ErrorInitFrame
 
 if tp.TYPE_CHECKING:
     import pandas as pd #pylint: disable=W0611 #pragma: no cover
@@ -50,6 +59,7 @@ if tp.TYPE_CHECKING:
     from static_frame.core.index_hierarchy import IndexHierarchy #pylint: disable=W0611,C0412 #pragma: no cover
     from static_frame.core.index_auto import IndexAutoFactoryType #pylint: disable=W0611,C0412 #pragma: no cover
     from static_frame.core.quilt import Quilt #pylint: disable=W0611,C0412 #pragma: no cover
+    from static_frame.core.store_filter import StoreFilter #pylint: disable=W0611,C0412 #pragma: no cover
 
 
 
@@ -441,9 +451,11 @@ def axis_window_items( *,
     else:
         labels = source._index if axis == 0 else source._columns #type: ignore
 
-        if isinstance(source, Frame) and axis == 0 and as_array:
-            # for a Frame, when collecting rows, it is more efficient to pre-consolidate blocks prior to slicing. Note that this results in the same block coercion necessary for each window (which is not the same for axis 1, where block coercion is not required)
+        if isinstance(source, Frame) and as_array and (axis == 0
+                or all(b.dtype == source._blocks._row_dtype for b in source._blocks._blocks)):
+            # for a Frame, it is more efficient to pre-consolidate blocks prior to slicing, such that each window is a read-only view of the consolidated values. Note that, when collecting rows, this results in the same block coercion necessary for each window; when collecting columns, block coercion is not required, so this is only done if blocks share a dtype
             values = source._blocks.values
+            values.flags.writeable = False
 
     if start_shift >= 0:
         count_window_max = len(labels)
@@ -478,7 +490,9 @@ def axis_window_items( *,
                 else: # use low level iloc selector
                     window = source._extract(row_key=key) #type: ignore
             else: # extract columns
-                if as_array:
+                if as_array and values is not None:
+                    window = values[NULL_SLICE, key]
+                elif as_array:
                     window = source._extract_array(NULL_SLICE, key) #type: ignore
                 else:
                     window = source._extract(column_key=key) #type: ignore
@@ -510,6 +524,137 @@ def axis_window_items( *,
         if count > count_window_max or idx_left > idx_left_max or size < 0:
             break
 
+def _axis_window_apply( *,
+        source: tp.Union['Series', 'Frame'],
+        func: AnyCallable,
+        size: int,
+        axis: int,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        index: IndexBase,
+        ) -> tp.Union['Series', 'Frame']:
+    '''Call ``func`` with all windows as a single array of views, returning a Series for one value per window, or a Frame for one row of values per window.
+    '''
+    from static_frame.core.frame import Frame
+    from static_frame.core.series import Series
+
+    if ((stops - starts) != size).any():
+        raise RuntimeError('windows must all be of the same size; set window_sized to True')
+
+    if source.ndim == 1:
+        values = source.values
+    else:
+        values = source._blocks.values #type: ignore
+
+    post = func(array_window_view(values, starts, size=size, axis=axis))
+
+    if not isinstance(post, np.ndarray) or len(post) != len(starts):
+        raise RuntimeError('func must return an array with one value, or row of values, per window')
+    if post.ndim == 1:
+        return Series(post, index=index, own_index=True)
+    if post.ndim == 2:
+        columns = None
+        if source.ndim == 2:
+            columns = source._columns if axis == 0 else source._index #type: ignore
+            if len(columns) != post.shape[1]:
+                columns = None
+        constructor = source.__class__ if source.ndim == 2 else Frame
+        return constructor(post, index=index, columns=columns, own_index=True) #type: ignore
+    raise RuntimeError('func must return a 1D or 2D array')
+
+
+def axis_window_reduce( *,
+        source: tp.Union['Series', 'Frame'],
+        size: int,
+        axis: int = 0,
+        step: int = 1,
+        window_sized: bool = True,
+        window_func: tp.Optional[AnyCallable] = None,
+        window_valid: tp.Optional[AnyCallable] = None,
+        label_shift: int = 0,
+        start_shift: int = 0,
+        size_increment: int = 0,
+        func: tp.Union[str, AnyCallable],
+        skipna: bool = True,
+        ddof: int = 0,
+        ) -> tp.Union['Series', 'Frame']:
+    '''Reduce all windows with vectorized operations, returning a container with the same labels as produced by ``axis_window_items``. When ndim is 2, axis 0 reduces windows of rows, axis 1 reduces windows of columns.
+
+    Args:
+        func: either the name of a reduction, or a callable that is given all windows as a single array of views.
+    '''
+    from static_frame.core.frame import Frame
+    from static_frame.core.series import Series
+    from static_frame.core.type_blocks import TypeBlocks
+
+    if window_func is not None or window_valid is not None or size_increment != 0:
+        raise RuntimeError('reduce does not support window_func, window_valid, or size_increment')
+
+    if source.ndim == 1:
+        labels = source._index
+    elif axis == 0:
+        labels = source._index
+    elif axis == 1:
+        labels = source._columns #type: ignore
+    else:
+        raise AxisInvalid(f'invalid axis: {axis}')
+
+    starts, stops, ilocs_label = window_positions(len(labels),
+            size=size,
+            step=step,
+            window_sized=window_sized,
+            label_shift=label_shift,
+            start_shift=start_shift,
+            )
+
+    if callable(func):
+        return _axis_window_apply(
+                source=source,
+                func=func,
+                size=size,
+                axis=axis,
+                starts=starts,
+                stops=stops,
+                index=labels[ilocs_label],
+                )
+
+    def reduce(array: np.ndarray) -> np.ndarray:
+        return array_window_reduce(array,
+                starts,
+                stops,
+                size=size,
+                func=func,
+                skipna=skipna,
+                ddof=ddof,
+                )
+
+    if source.ndim == 1:
+        assert isinstance(source, Series) # for mypy
+        return Series(reduce(source.values),
+                index=labels[ilocs_label],
+                own_index=True,
+                )
+
+    assert isinstance(source, Frame) # for mypy
+    if axis == 0:
+        return source.__class__(
+                TypeBlocks.from_blocks(reduce(b) for b in source._blocks._blocks),
+                index=labels[ilocs_label],
+                columns=source._columns,
+                own_index=True,
+                own_columns=source.STATIC,
+                own_data=True,
+                )
+    # reduce windows of columns of consolidated rows
+    return source.__class__(
+            reduce(source._blocks.values.T).T,
+            index=source._index,
+            columns=labels[ilocs_label],
+            own_index=True,
+            own_columns=True,
+            )
+
+
 def get_block_match(
         width: int,
         values_source: tp.List[np.ndarray],
@@ -834,6 +979,31 @@ def arrays_from_index_frame(
         yield from container._blocks._slice_blocks(column_key=column_key)
 
 
+def index_to_ilocs(
+        index_src: IndexBase,
+        index_dst: IndexBase,
+        ) -> np.ndarray:
+    '''
+    For each label in ``index_dst``, return the iloc position of that label in ``index_src``, or -1 where the label is not found. Where depths are equal, labels are matched by depth-level arrays, without per-label lookups.
+    '''
+    ilocs = np.full(len(index_dst), -1, dtype=DTYPE_INT_DEFAULT)
+    if not len(index_dst) or not len(index_src):
+        return ilocs
+
+    if index_src.depth == index_dst.depth:
+        depths = range(index_dst.depth)
+        iloc_dst, iloc_src = join_arrays_to_ilocs(
+                [index_dst.values_at_depth(d) for d in depths],
+                [index_src.values_at_depth(d) for d in depths],
+                )
+        ilocs[iloc_dst] = iloc_src
+    else:
+        ic = IndexCorrespondence.from_correspondence(index_src, index_dst)
+        if ic.has_common:
+            ilocs[ic.iloc_dst] = ic.iloc_src
+    return ilocs
+
+
 def key_from_container_key(
         index: IndexBase,
         key: GetItemKeyType,
@@ -1021,6 +1191,144 @@ def apex_to_name(
     raise AxisInvalid(f'invalid axis: {axis}')
 
 
+class DelimitedHeader(tp.NamedTuple):
+    '''
+    The result of reading the header rows of a delimited file, defining how the remaining rows are to be loaded.
+    '''
+    first: tp.Optional[tp.Sequence[str]] # the first data row, if found
+    count: int # the number of fields in each row
+    positions: tp.Sequence[int] # field positions to load, including index positions
+    index_positions: tp.Sequence[int]
+    columns_labels: tp.Sequence[tp.Hashable] # labels of loaded, non-index positions
+    apex_rows: tp.Sequence[tp.Sequence[tp.Hashable]]
+    dtypes: tp.Sequence[DtypeSpecifier] # per loaded position
+    str_positions: tp.FrozenSet[int] # positions not to be evaluated
+
+
+def delimited_header(
+        rows: tp.Iterator[tp.Sequence[str]],
+        *,
+        index_depth: int,
+        index_column_first: tp.Optional[tp.Union[int, str]],
+        columns_depth: int,
+        columns_select: tp.Optional[tp.Iterable[tp.Hashable]],
+        dtypes: DtypesSpecifier,
+        store_filter: tp.Optional['StoreFilter'],
+        ) -> DelimitedHeader:
+    '''
+    Consume header rows, and the first data row, from an iterator of rows parsed from a delimited file (after any skipped rows). Header cells are evaluated independently, as types align by row.
+    '''
+    columns_rows = list(islice(rows, columns_depth))
+
+    # the first non-empty row defines the count of fields; rows with a different count are discarded
+    first = next((row for row in rows if row), None)
+    if first is not None:
+        count = len(first)
+    elif columns_rows:
+        count = len(columns_rows[0])
+    else:
+        count = 0
+
+    labels_rows = [
+            [cell if cell == '' else str_array_to_array(
+                    np.array((cell,), dtype=DTYPE_STR)).tolist()[0]
+                    for cell in row]
+            for row in columns_rows]
+
+    index_start_pos = 0
+    if index_column_first is not None:
+        if index_depth <= 0:
+            raise ErrorInitFrame('index_column_first specified but index_depth is 0')
+        if isinstance(index_column_first, INT_TYPES):
+            index_start_pos = index_column_first
+        elif labels_rows:
+            index_start_pos = labels_rows[0].index(index_column_first)
+        else:
+            raise ErrorInitFrame('index_column_first can only be a label if columns_depth is greater than 0')
+    index_positions = range(index_start_pos, index_start_pos + index_depth)
+
+    # collect apex and columns labels from header rows, excluding index positions
+    apex_rows = [[row[pos] for pos in index_positions if pos < len(row)]
+            for row in labels_rows]
+    columns_arrays = [[label for pos, label in enumerate(row)
+            if pos not in index_positions]
+            for row in labels_rows]
+
+    if columns_depth == 0:
+        labels: tp.List[tp.Hashable] = list(range(count - index_depth))
+    elif columns_depth == 1:
+        labels = columns_arrays[0]
+    else:
+        labels = list(zip(*(store_filter.to_type_filter_iterable(x) #type: ignore
+                for x in columns_arrays)))
+
+    # determine the positions to load, retaining file order
+    positions = []
+    columns_labels = []
+    columns_by_col_idx: tp.List[tp.Hashable] = []
+    index_field_placeholder = object()
+    labels_iter = iter(labels)
+    if columns_select is not None:
+        if columns_depth == 0:
+            raise ErrorInitFrame('cannot use columns_select when columns_depth is 0')
+        columns_select = set(columns_select)
+        found = set()
+
+    for pos in range(count):
+        if pos in index_positions:
+            positions.append(pos)
+            columns_by_col_idx.append(index_field_placeholder)
+            continue
+        label = next(labels_iter, None)
+        if columns_select is not None:
+            if label not in columns_select:
+                continue
+            found.add(label)
+        positions.append(pos)
+        columns_labels.append(label)
+        columns_by_col_idx.append(label)
+
+    if columns_select is not None and len(found) < len(columns_select): #type: ignore
+        missing = columns_select - found #type: ignore
+        raise ErrorInitFrame(f'cannot load all columns in columns_select: missing {missing}')
+
+    get_col_dtype = None if dtypes is None else get_col_dtype_factory(
+            dtypes,
+            columns_by_col_idx)
+    dtypes_final = [None if get_col_dtype is None else get_col_dtype(i)
+            for i in range(len(positions))]
+    # columns that are to be str are not evaluated, preserving the original text
+    str_positions = frozenset(pos for pos, dtype in zip(positions, dtypes_final)
+            if dtype is not None and np.dtype(dtype).kind in DTYPE_STR_KINDS)
+
+    return DelimitedHeader(
+            first=first,
+            count=count,
+            positions=positions,
+            index_positions=index_positions,
+            columns_labels=columns_labels,
+            apex_rows=apex_rows,
+            dtypes=dtypes_final,
+            str_positions=str_positions,
+            )
+
+
+def delimited_array_filter(
+        array: np.ndarray,
+        *,
+        dtype: DtypeSpecifier,
+        store_filter: tp.Optional['StoreFilter'],
+        ) -> np.ndarray:
+    '''
+    Apply a StoreFilter, and then an optional dtype, to an array read from a delimited file, returning an immutable array.
+    '''
+    if store_filter is not None:
+        array = store_filter.to_type_filter_array(array)
+    if dtype is not None and array.dtype != dtype:
+        array = array.astype(dtype)
+    array.flags.writeable = False
+    return array
+
 def container_to_exporter_attr(container_type: tp.Type['Frame']) -> str:
     from static_frame.core.frame import Frame
     from static_frame.core.frame import FrameGO
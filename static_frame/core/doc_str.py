@@ -34,12 +34,16 @@ DTYPE_SPECIFIER = '''dtype: A value suitable for specyfying a NumPy dtype, such
 
 DTYPES = "dtypes: Optionally provide an iterable of dtypes, equal in length to the length of each row, or a mapping by column name. If a dtype is given as None, NumPy's default type determination will be used."
 
+EXECUTOR = 'executor: An already-started executor to use for all parallel operations, including those of derived containers, in place of creating a new executor per operation; the executor is not shut down by the container.'
+
 FP = 'fp: A string file path or :obj:`Path` instance.'
 
 INDEX_CONSTRUCTOR = "index_constructor: Optional class or constructor function to create the :obj:`Index` applied to the rows."
 
 MAX_PERSIST = 'max_persist: When loading :obj:`Frame` from a :obj:`Store`, optionally define the maximum number of :obj:`Frame` to remain in the :obj:`Bus`, regardless of the size of the :obj:`Bus`. If more than ``max_persist`` number of :obj:`Frame` are loaded, least-recently loaded :obj:`Frame` will be replaced by ``FrameDeferred``. A ``max_persist`` of 1, for example, permits reading one :obj:`Frame` at a time without ever holding in memory more than 1 :obj:`Frame`.'
 
+MAX_PERSIST_BYTES = 'max_persist_bytes: When loading :obj:`Frame` from a :obj:`Store`, optionally define the maximum total :obj:`Frame.nbytes` to remain in the :obj:`Bus`. When loaded :obj:`Frame` exceed this budget, least-recently accessed :obj:`Frame` are replaced by ``FrameDeferred`` until the total fits; the most-recently accessed :obj:`Frame` is always retained. May be combined with ``max_persist``.'
+
 MAX_WORKERS = 'max_workers: Number of parallel executors, as passed to the Thread- or ProcessPoolExecutor; ``None`` defaults to the max number of machine processes.'
 
 NAME = 'name: A hashable object to label the container.'
@@ -50,6 +54,8 @@ OWN_DATA = '''own_data: Flag the data values as ownable by this :obj:`static_fra
 
 OWN_INDEX = '''own_index: Flag the passed index as ownable by this :obj:`static_frame.{class_name}`. Primarily used by internal clients.'''
 
+PREFETCH = 'prefetch: When iterating over :obj:`Frame` loaded from a :obj:`Store`, optionally define the number of :obj:`Frame` to read ahead of iteration in a background thread. If ``max_persist`` is set, no more than ``max_persist`` :obj:`Frame` are read ahead.'
+
 RETAIN_LABELS = 'retain_labels: Boolean to determine if, along the axis of virtual concatentation, if component :obj:`Frame` labels should be used to form the outer depth of an :obj:`IndexHierarchy`. This is required to be ``True`` if component :obj:`Frame` labels are not globally unique along the axis of concatenation.'
 
 STORE = 'store: A :obj:`Store` subclass.'
@@ -57,6 +63,7 @@ STORE = 'store: A :obj:`Store` subclass.'
 STORE_CONFIG_MAP = 'config: A :obj:`StoreConfig`, or a mapping of label ot :obj:`StoreConfig`'
 
 USE_THREADS = 'use_threads: Use the ThreadPoolExecutor instead of the ProcessPoolExecutor.'
+USE_SHARED_MEMORY = 'use_shared_memory: When using the ProcessPoolExecutor, pass arrays to and from workers in shared memory segments rather than in the pickle stream.'
 
 class DOC_TEMPLATE:
 
@@ -126,6 +133,7 @@ class DOC_TEMPLATE:
             max_workers=MAX_WORKERS,
             chunksize=CHUNKSIZE,
             use_threads=USE_THREADS,
+            use_shared_memory=USE_SHARED_MEMORY,
             )
 
     argminmax = dict(
@@ -146,6 +154,8 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {USE_SHARED_MEMORY}
+            {EXECUTOR}
             '''
             )
 
@@ -157,6 +167,8 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {USE_SHARED_MEMORY}
+            {EXECUTOR}
             '''
             )
 
@@ -166,6 +178,8 @@ class DOC_TEMPLATE:
             {FP}
             {STORE_CONFIG_MAP}
             {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
+            {PREFETCH}
             '''
             )
 
@@ -175,6 +189,8 @@ class DOC_TEMPLATE:
             {STORE}
             {STORE_CONFIG_MAP}
             {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
+            {PREFETCH}
             '''
             )
 
@@ -293,7 +309,9 @@ class DOC_TEMPLATE:
             right_template="right_template: Provide a format string for naming right columns in the joined result.",
             fill_value='fill_value: A value to be used to fill space created in the join.',
             composite_index='composite_index: If True, an index of tuples will be returned, formed from the left index label and the right index label; if False, an index of matching labels, if unique, will be returned.',
-            composite_index_fill_value='composite_index_fill_value: Value to be used when forming a composite index when a label is missing.'
+            composite_index_fill_value='composite_index_fill_value: Value to be used when forming a composite index when a label is missing.',
+            direction='direction: One of "backward" (the default), to use the last label in ``other`` less than or equal to each label; "forward", to use the first label greater than or equal to each label; or "nearest", to use the closest label.',
+            tolerance='tolerance: Optionally provide a maximum distance between joined labels, as a ``np.timedelta64`` or ``datetime.timedelta`` for datetime indices.',
             )
 
     mloc = dict(
@@ -330,6 +348,7 @@ class DOC_TEMPLATE:
             {RETAIN_LABELS}
             {DEEPCOPY_FROM_BUS}
             {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
             '''
             )
 
@@ -352,6 +371,16 @@ class DOC_TEMPLATE:
             own_columns=OWN_COLUMNS
             )
 
+    reindex_asof = dict(
+            doc='''Return a new :obj:`{class_name}` with labels defined by the provided index, where each new label is aligned to the data of a label from the sorted index of this :obj:`{class_name}` (an as-of alignment), as determined by ``direction``. New labels that are not aligned will be filled with ``fill_value``. No union of the indices is created.
+            ''',
+            index_initializer=INDEX_INITIALIZER,
+            direction='''direction: One of "backward" (the default), to use the last label less than or equal to each new label; "forward", to use the first label greater than or equal to each new label; or "nearest", to use the closest label.''',
+            tolerance='''tolerance: Optionally provide a maximum distance between aligned labels, as a ``np.timedelta64`` or ``datetime.timedelta`` for datetime indices.''',
+            fill_value='''fill_value: A value to be used to fill space created by new labels that are not aligned.''',
+            own_index=OWN_INDEX,
+            )
+
     relabel = dict(
             doc ='''Return a new :obj:`{class_name}` with transformed labels on the index. The size and ordering of the data is never changed in a relabeling operation. The resulting index must be unique.
             ''',
@@ -67,6 +67,11 @@ class StoreParameterConflict(RuntimeError):
     A Stores file was mutated in an unexpected way.
     '''
 
+class ErrorNPYEncode(RuntimeError):
+    '''
+    A container could not be encoded as NPY arrays.
+    '''
+
 class NotImplementedAxis(NotImplementedError):
     def __init__(self) -> None:
         super().__init__('iteration along this axis is too inefficient; create a consolidated Frame with Quilt.to_frame()')
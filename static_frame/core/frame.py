@@ -1,4 +1,6 @@
 
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 from io import StringIO
 from io import BytesIO
@@ -10,7 +12,6 @@ import csv
 import json
 import sqlite3
 import typing as tp
-import warnings
 
 import numpy as np
 from numpy.ma import MaskedArray #type: ignore
@@ -20,10 +21,12 @@ from static_frame.core.container import ContainerOperand
 from static_frame.core.container_util import array_from_value_iter
 from static_frame.core.container_util import arrays_from_index_frame
 from static_frame.core.container_util import axis_window_items
+from static_frame.core.container_util import axis_window_reduce
 from static_frame.core.container_util import bloc_key_normalize
 from static_frame.core.container_util import get_col_dtype_factory
 from static_frame.core.container_util import index_constructor_empty
 from static_frame.core.container_util import index_from_optional_constructor
+from static_frame.core.container_util import index_to_ilocs
 from static_frame.core.container_util import index_many_concat
 from static_frame.core.container_util import index_many_set
 from static_frame.core.container_util import key_to_ascending_key
@@ -33,6 +36,9 @@ from static_frame.core.container_util import pandas_version_under_1
 from static_frame.core.container_util import rehierarch_from_index_hierarchy
 from static_frame.core.container_util import rehierarch_from_type_blocks
 from static_frame.core.container_util import apex_to_name
+from static_frame.core.container_util import delimited_array_filter
+from static_frame.core.container_util import delimited_header
+from static_frame.core.container_util import DelimitedHeader
 from static_frame.core.container_util import MessagePackElement
 from static_frame.core.container_util import sort_index_for_order
 
@@ -73,6 +79,7 @@ from static_frame.core.node_transpose import InterfaceTranspose
 from static_frame.core.series import Series
 from static_frame.core.store_filter import STORE_FILTER_DEFAULT
 from static_frame.core.store_filter import StoreFilter
+from static_frame.core.store_filter import array_to_str_list
 from static_frame.core.type_blocks import TypeBlocks
 from static_frame.core.pivot import pivot_derive_constructors
 from static_frame.core.pivot import pivot_index_map
@@ -84,6 +91,7 @@ from static_frame.core.util import _gen_skip_middle
 from static_frame.core.util import _read_url
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import argmax_2d
+from static_frame.core.util import asof_ilocs
 from static_frame.core.util import argmin_2d
 from static_frame.core.util import array_to_duplicated
 from static_frame.core.util import array_to_groups_and_locations
@@ -93,8 +101,10 @@ from static_frame.core.util import CallableOrCallableMap
 from static_frame.core.util import column_1d_filter
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DepthLevelSpecifier
+from static_frame.core.util import DTYPE_BOOL
 from static_frame.core.util import DTYPE_FLOAT_DEFAULT
 from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import DTYPE_STR_KINDS
 from static_frame.core.util import dtype_to_fill_value
 from static_frame.core.util import DtypeSpecifier
 from static_frame.core.util import DtypesSpecifier
@@ -118,6 +128,7 @@ from static_frame.core.util import isna_array
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import iterable_to_array_nd
 from static_frame.core.util import Join
+from static_frame.core.util import join_arrays_to_ilocs
 from static_frame.core.util import KEY_MULTIPLE_TYPES
 from static_frame.core.util import key_normalize
 from static_frame.core.util import KeyOrKeys
@@ -143,7 +154,20 @@ from static_frame.core.util import DT64_NS
 from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import STORE_LABEL_DEFAULT
 from static_frame.core.util import file_like_manager
+from static_frame.core.util import DELIMITED_CHUNK_SIZE
+from static_frame.core.util import delimited_bytes_to_rows
+from static_frame.core.util import delimited_chunks
+from static_frame.core.util import delimited_range_to_parts
+from static_frame.core.util import delimited_parts_conflict
+from static_frame.core.util import delimited_ranges
+from static_frame.core.util import delimited_records
+from static_frame.core.util import delimited_rows_to_parts
+from static_frame.core.util import delimited_chunk_to_arrays
+from static_frame.core.util import delimited_parts_to_array
 from static_frame.core.util import array2d_to_array1d
+from static_frame.core.util import arrays_to_codes
+from static_frame.core.util import codes_to_group_positions
+from static_frame.core.util import array_group_reduce
 
 
 if tp.TYPE_CHECKING:
@@ -1430,6 +1454,7 @@ class Frame(ContainerOperand):
             query: str,
             *,
             connection: sqlite3.Connection,
+            parameters: tp.Sequence[tp.Any] = (),
             index_depth: int = 0,
             columns_depth: int = 1,
             columns_select: tp.Optional[tp.Iterable[str]] = None,
@@ -1443,6 +1468,7 @@ class Frame(ContainerOperand):
         Args:
             query: A query string.
             connection: A DBAPI2 (PEP 249) Connection object, such as those returned from SQLite (via the sqlite3 module) or PyODBC.
+            parameters: An optional sequence of values bound to placeholders in the query.
             {dtypes}
             columns_select: An optional iterable of field names to extract from the results of the query.
             {name}
@@ -1455,7 +1481,7 @@ class Frame(ContainerOperand):
         cursor = None
         try:
             cursor = connection.cursor()
-            cursor.execute(query)
+            cursor.execute(query, parameters)
 
             if columns_select:
                 columns_select = set(columns_select)
@@ -1600,6 +1626,194 @@ class Frame(ContainerOperand):
                 consolidate_blocks=consolidate_blocks
                 )
 
+    @classmethod
+    def _from_delimited_arrays(cls,
+            arrays: tp.Optional[tp.Iterable[np.ndarray]],
+            *,
+            header: DelimitedHeader,
+            index: tp.Optional[IndexInitializer] = None,
+            index_depth: int,
+            index_name_depth_level: tp.Optional[DepthLevelSpecifier],
+            columns_depth: int,
+            columns_name_depth_level: tp.Optional[DepthLevelSpecifier],
+            name: tp.Hashable,
+            consolidate_blocks: bool,
+            ) -> 'Frame':
+        '''
+        Private constructor used for creating a Frame from arrays, one per loaded position, read from a delimited file. If ``arrays`` is None, no data rows were found. If ``index_depth`` is 0, an optional ``index`` can be provided.
+        '''
+        columns_name = None if index_depth == 0 or columns_depth == 0 else apex_to_name(
+                rows=header.apex_rows,
+                depth_level=columns_name_depth_level,
+                axis=1,
+                axis_depth=columns_depth)
+
+        if columns_depth == 0:
+            columns = None
+        else:
+            columns_constructor = (cls._COLUMNS_CONSTRUCTOR if columns_depth == 1
+                    else cls._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels)
+            columns = columns_constructor(header.columns_labels, name=columns_name)
+
+        index_arrays: tp.List[tp.Sequence[tp.Any]] = []
+        if arrays is not None:
+            def blocks() -> tp.Iterator[np.ndarray]:
+                for pos, array in zip(header.positions, arrays): #type: ignore
+                    if pos in header.index_positions:
+                        index_arrays.append(array)
+                        continue
+                    yield array
+
+            if consolidate_blocks:
+                data = TypeBlocks.from_blocks(TypeBlocks.consolidate_blocks(blocks()))
+            else:
+                data = TypeBlocks.from_blocks(blocks())
+        else: # only column data in table
+            if index_depth > 0:
+                # no data is found an index depth was given; simulate empty index_arrays to create a empty index
+                index_arrays = [EMPTY_TUPLE] * index_depth
+            data = FRAME_INITIALIZER_DEFAULT
+
+        kwargs = dict(
+                data=data,
+                own_data=True,
+                columns=columns,
+                own_columns=columns is not None,
+                name=name
+                )
+
+        if index_depth == 0:
+            return cls(index=index, **kwargs)
+
+        index_name = None if columns_depth == 0 else apex_to_name(
+                rows=header.apex_rows,
+                depth_level=index_name_depth_level,
+                axis=0,
+                axis_depth=index_depth)
+
+        if index_depth == 1:
+            index_constructor = partial(Index, name=index_name)
+            return cls(
+                index=index_arrays[0],
+                index_constructor=index_constructor,
+                **kwargs)
+
+        index_constructor = partial(IndexHierarchy.from_labels, name=index_name)
+        return cls(
+                index=zip(*index_arrays),
+                index_constructor=index_constructor,
+                **kwargs
+                )
+
+    @staticmethod
+    def _delimited_to_parts_pool(
+            fp: str,
+            *,
+            delimiter: str,
+            index_depth: int,
+            index_column_first: tp.Optional[tp.Union[int, str]],
+            columns_depth: int,
+            columns_select: tp.Optional[tp.Iterable[tp.Hashable]],
+            skip_header: int,
+            skip_footer: int,
+            quote_char: str,
+            encoding: tp.Optional[str],
+            dtypes: DtypesSpecifier,
+            store_filter: tp.Optional[StoreFilter],
+            max_workers: int,
+            ) -> tp.Tuple[DelimitedHeader, tp.List[tp.List[tp.Optional[np.ndarray]]], tp.List[int]]:
+        '''
+        Read the header of a delimited file in the calling process, then evaluate ranges of the remaining records in a ProcessPoolExecutor. Returns the header and, per loaded position, the arrays of all ranges in order, as well as the sizes of those arrays.
+        '''
+        data_start = 0
+
+        with open(fp, 'rb') as f:
+            records = delimited_records(f, quote_char=quote_char)
+            for _ in range(skip_header):
+                next(records, None)
+
+            def rows() -> tp.Iterator[tp.List[str]]:
+                nonlocal data_start
+                for offset, record in records:
+                    data_start = offset # the last offset is that of the first data row
+                    yield next(delimited_bytes_to_rows(record,
+                            delimiter=delimiter,
+                            quote_char=quote_char,
+                            encoding=encoding,
+                            ), [])
+
+            header = delimited_header(rows(),
+                    index_depth=index_depth,
+                    index_column_first=index_column_first,
+                    columns_depth=columns_depth,
+                    columns_select=columns_select,
+                    dtypes=dtypes,
+                    store_filter=store_filter,
+                    )
+
+        parts: tp.List[tp.List[tp.Optional[np.ndarray]]] = [[] for _ in header.positions]
+        sizes: tp.List[int] = []
+        if header.first is None or not header.positions:
+            return header, parts, sizes
+
+        ranges = delimited_ranges(fp,
+                start=data_start,
+                count=max_workers,
+                quote_char=quote_char,
+                )
+        # only the last range can have footer rows
+        skip_footers = [0] * (len(ranges) - 1) + [skip_footer]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            def submit(
+                    index: int,
+                    positions: tp.Sequence[int],
+                    str_positions: tp.AbstractSet[int],
+                    ) -> Future:
+                start, stop = ranges[index]
+                return executor.submit(delimited_range_to_parts,
+                        fp,
+                        start,
+                        stop,
+                        delimiter=delimiter,
+                        quote_char=quote_char,
+                        encoding=encoding,
+                        count=header.count,
+                        positions=positions,
+                        str_positions=str_positions,
+                        skip_footer=skip_footers[index],
+                        )
+
+            futures = [submit(i, header.positions, header.str_positions)
+                    for i in range(len(ranges))]
+            ranges_parts = []
+            for future in futures:
+                range_parts, range_sizes = future.result()
+                sizes.extend(range_sizes)
+                ranges_parts.append(range_parts)
+
+            # columns for which ranges evaluated to kinds that, evaluated as a whole, would have resulted in a str array, are read again as str from the ranges that are not str
+            conflicts = [i for i in range(len(header.positions))
+                    if delimited_parts_conflict(chain.from_iterable(
+                    range_parts[i] for range_parts in ranges_parts))]
+            if conflicts:
+                positions = [header.positions[i] for i in conflicts]
+                futures_str = {r: submit(r, positions, frozenset(positions))
+                        for r, range_parts in enumerate(ranges_parts)
+                        if any(p is None or p.dtype.kind != 'U'
+                        for i in conflicts for p in range_parts[i])
+                        }
+                for r, future in futures_str.items():
+                    range_parts_str, _ = future.result()
+                    for i, range_part in zip(conflicts, range_parts_str):
+                        ranges_parts[r][i] = range_part
+
+        for range_parts in ranges_parts:
+            for part, range_part in zip(parts, range_parts):
+                part.extend(range_part)
+
+        return header, parts, sizes
+
     @classmethod
     @doc_inject(selector='constructor_frame')
     def from_delimited(cls,
@@ -1611,6 +1825,7 @@ class Frame(ContainerOperand):
             index_name_depth_level: tp.Optional[DepthLevelSpecifier] = None,
             columns_depth: int = 1,
             columns_name_depth_level: tp.Optional[DepthLevelSpecifier] = None,
+            columns_select: tp.Optional[tp.Iterable[tp.Hashable]] = None,
             skip_header: int = 0,
             skip_footer: int = 0,
             quote_char: str = '"',
@@ -1618,7 +1833,8 @@ class Frame(ContainerOperand):
             dtypes: DtypesSpecifier = None,
             name: tp.Hashable = None,
             consolidate_blocks: bool = False,
-            store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT
+            store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
+            max_workers: tp.Optional[int] = None,
             ) -> 'Frame':
         '''
         Create a Frame from a file path or a file-like object defining a delimited (CSV, TSV) data file.
@@ -1631,9 +1847,11 @@ class Frame(ContainerOperand):
             index_name_depth_level: If columns_depth is greater than 0, interpret values over index as the index name.
             columns_depth: Specify the number of rows after the skip_header used to create the column labels. A value of 0 will be no header; a value greater than 1 will attempt to create a hierarchical index.
             columns_name_depth_level: If index_depth is greater than 0, interpret values over index as the columns name.
+            columns_select: An optional iterable of column labels to load, retaining the order found in the file; index columns are always loaded, and columns not selected are not evaluated.
             skip_header: Number of leading lines to skip.
             skip_footer: Number of trailing lines to skip.
             store_filter: A StoreFilter instance, defining translation between unrepresentable types. Presently nly the ``to_nan`` attributes is used.
+            max_workers: If greater than 1 and ``fp`` is a file path, divide the file into ranges of records evaluated in a ProcessPoolExecutor with this many workers; the encoding must be ASCII compatible. If ``None``, records are evaluated in the calling process.
             {dtypes}
             {name}
             {consolidate_blocks}
@@ -1641,166 +1859,191 @@ class Frame(ContainerOperand):
         Returns:
             :obj:`static_frame.Frame`
         '''
-        # https://docs.scipy.org/doc/numpy/reference/generated/numpy.loadtxt.html
-        # https://docs.scipy.org/doc/numpy/reference/generated/numpy.genfromtxt.html
-
-        # TODO: add columns_select as usecols styles selective loading
+        # https://docs.python.org/3/library/csv.html
 
         if skip_header < 0:
             raise ErrorInitFrame('skip_header must be greater than or equal to 0')
+        if skip_footer < 0:
+            raise ErrorInitFrame('skip_footer must be greater than or equal to 0')
 
         fp = path_filter(fp)
-        delimiter_native = '\t'
-
-        if delimiter != delimiter_native:
-            # this is necessary if there are quoted cells that include the delimiter
-            def file_like() -> tp.Iterator[str]:
-                if isinstance(fp, str):
-                    with open(fp, 'r') as f:
-                        for row in csv.reader(f, delimiter=delimiter, quotechar=quote_char):
-                            yield delimiter_native.join(row)
-                else: # handling file like object works for stringio but not for bytesio
-                    for row in csv.reader(fp, delimiter=delimiter, quotechar=quote_char):
-                        yield delimiter_native.join(row)
-        else:
-            def file_like() -> tp.Iterator[str]: # = fp
-                if isinstance(fp, str):
-                    with open(fp, 'r') as f:
-                        for row in f:
-                            yield row
-                else: # iterable of string lines, StringIO
-                    for row in fp:
-                        yield row
-
-        # always accumulate columns rows, as np.genfromtxt will mutate the headers: adding enderscore, removing invalid characters, etc.
-        apex_rows = []
-        columns_rows = []
-
-        def row_source() -> tp.Iterator[str]:
-            # set equal to skip header unless column depth is > 1
-            column_max = skip_header + columns_depth
-            for i, row in enumerate(file_like()):
-                if i < skip_header:
-                    continue
-                if i < column_max:
-                    columns_rows.append(row)
-                    continue
-                yield row
-
-        # genfromtxt takes missing_values, but this can only be a list, and does not work under some condition (i.e., a cell with no value). thus, this is deferred to from_sructured_array
-
-        with warnings.catch_warnings():
-            # silence: UserWarning: genfromtxt: Empty input file
-            warnings.simplefilter('ignore', UserWarning)
-
-            array = np.genfromtxt(
-                    row_source(),
-                    delimiter=delimiter_native,
-                    skip_header=0, # done in row_source
+        if max_workers is not None and max_workers > 1 and isinstance(fp, str):
+            header, parts, sizes = cls._delimited_to_parts_pool(fp,
+                    delimiter=delimiter,
+                    index_depth=index_depth,
+                    index_column_first=index_column_first,
+                    columns_depth=columns_depth,
+                    columns_select=columns_select,
+                    skip_header=skip_header,
                     skip_footer=skip_footer,
-                    comments=None,
-                    # strange NP convention for this parameter: False is not supported, must use None to not parase headers
-                    names= None,
-                    dtype=None,
+                    quote_char=quote_char,
                     encoding=encoding,
-                    invalid_raise=False,
+                    dtypes=dtypes,
+                    store_filter=store_filter,
+                    max_workers=max_workers,
                     )
-        array.flags.writeable = False
-
-        # construct columns prior to preparing data from structured array, as need columns to map dtypes
-        # columns_constructor = None
-        if columns_depth == 0:
-            columns = None
-            own_columns = False
         else:
-            # Process each row one at a time, as types align by row.
-            columns_arrays = []
-            for row in columns_rows:
-                columns_array = np.genfromtxt(
-                        (row,),
-                        delimiter=delimiter_native,
-                        comments=None,
-                        names=None,
-                        dtype=None,
-                        encoding=encoding,
-                        invalid_raise=False,
+            with file_like_manager(fp, encoding=encoding) as f:
+                rows = iter(csv.reader(f, delimiter=delimiter, quotechar=quote_char))
+                for _ in range(skip_header):
+                    next(rows, None)
+
+                header = delimited_header(rows,
+                        index_depth=index_depth,
+                        index_column_first=index_column_first,
+                        columns_depth=columns_depth,
+                        columns_select=columns_select,
+                        dtypes=dtypes,
+                        store_filter=store_filter,
                         )
-                # the array might be ndim=1, or ndim=0; must get a list before slicing
-                # using the array directly for a string type might not hold the rights size after slicing
-                columns_list = columns_array.tolist()
-                apex_rows.append(columns_list[:index_depth])
-                columns_arrays.append(columns_list[index_depth:])
-
-            columns_name = None if index_depth == 0 else apex_to_name(
-                    rows=apex_rows,
-                    depth_level=columns_name_depth_level,
-                    axis=1,
-                    axis_depth=columns_depth)
+                parts, sizes = [], []
+                if header.first is not None and header.positions:
+                    parts, sizes = delimited_rows_to_parts(chain((header.first,), rows),
+                            count=header.count,
+                            positions=header.positions,
+                            str_positions=header.str_positions,
+                            skip_footer=skip_footer,
+                            )
 
-            if columns_depth == 1:
-                columns_constructor = cls._COLUMNS_CONSTRUCTOR
-                columns = columns_constructor(columns_arrays[0], name=columns_name)
-            else:
-                columns_constructor = cls._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels
-                columns = columns_constructor(
-                        zip(*(store_filter.to_type_filter_iterable(x) for x in columns_arrays)),
-                        name=columns_name,
-                        )
-            own_columns = True
+        arrays = None
+        if sizes:
+            arrays = (delimited_array_filter(
+                    delimited_parts_to_array(part, sizes),
+                    dtype=dtype,
+                    store_filter=None if pos in header.str_positions else store_filter,
+                    )
+                    for pos, part, dtype in zip(header.positions, parts, header.dtypes))
 
-        if array.dtype.names is None: # not a structured array
-            # genfromtxt may, in some situations, not return a structured array
-            if array.ndim == 1:
-                # got a single row
-                array = array.reshape((1, len(array)))
-            # NOTE: genfromtxt will return a one column input file as a 2D array with the vertical data as a horizontal row. There does not appear to be a way to distinguish this from a single row file
+        return cls._from_delimited_arrays(arrays,
+                header=header,
+                index_depth=index_depth,
+                index_name_depth_level=index_name_depth_level,
+                columns_depth=columns_depth,
+                columns_name_depth_level=columns_name_depth_level,
+                name=name,
+                consolidate_blocks=consolidate_blocks,
+                )
 
-        if array.size > 0: # an empty, or column only table
-            data, index_arrays, _ = cls._structured_array_to_d_ia_cl(
-                    array=array,
+    @classmethod
+    @doc_inject(selector='constructor_frame')
+    def from_delimited_iter(cls,
+            fp: PathSpecifierOrFileLikeOrIterator,
+            *,
+            delimiter: str,
+            chunksize: int = DELIMITED_CHUNK_SIZE,
+            index_depth: int = 0,
+            index_column_first: tp.Optional[tp.Union[int, str]] = None,
+            index_name_depth_level: tp.Optional[DepthLevelSpecifier] = None,
+            columns_depth: int = 1,
+            columns_name_depth_level: tp.Optional[DepthLevelSpecifier] = None,
+            columns_select: tp.Optional[tp.Iterable[tp.Hashable]] = None,
+            skip_header: int = 0,
+            skip_footer: int = 0,
+            quote_char: str = '"',
+            encoding: tp.Optional[str] = None,
+            dtypes: DtypesSpecifier = None,
+            consolidate_blocks: bool = False,
+            store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT
+            ) -> tp.Iterator['Frame']:
+        '''
+        Create an iterator of Frames, each of at most ``chunksize`` rows, from a file path or a file-like object defining a delimited (CSV, TSV) data file. Only one chunk of rows is loaded at a time. Each Frame has the same columns and is named by its integer chunk position, permitting direct usage with :obj:`Batch.from_frames` or :obj:`Bus.from_frames`. If ``index_depth`` is 0, the index of each Frame continues the row positions of the preceding Frame.
+
+        The dtypes of each Frame are fixed by ``dtypes`` or, if not given for a column, by the first Frame: values that cannot be safely cast to the dtype of the first Frame raise; str columns may vary in width.
+
+        Args:
+            fp: A file path or a file-like object.
+            delimiter: The character used to seperate row elements.
+            chunksize: The maximum number of rows in each Frame.
+            index_depth: Specify the number of columns used to create the index labels; a value greater than 1 will attempt to create a hierarchical index.
+            index_column_first: Optionally specify a column, by position or name, to become the start of the index if index_depth is greater than 0. If not set and index_depth is greater than 0, the first column will be used.
+            index_name_depth_level: If columns_depth is greater than 0, interpret values over index as the index name.
+            columns_depth: Specify the number of rows after the skip_header used to create the column labels. A value of 0 will be no header; a value greater than 1 will attempt to create a hierarchical index.
+            columns_name_depth_level: If index_depth is greater than 0, interpret values over index as the columns name.
+            columns_select: An optional iterable of column labels to load, retaining the order found in the file; index columns are always loaded, and columns not selected are not evaluated.
+            skip_header: Number of leading lines to skip.
+            skip_footer: Number of trailing lines to skip.
+            store_filter: A StoreFilter instance, defining translation between unrepresentable types. Presently nly the ``to_nan`` attributes is used.
+            {dtypes}
+            {consolidate_blocks}
+
+        Returns:
+            Iterator of :obj:`static_frame.Frame`
+        '''
+        if skip_header < 0:
+            raise ErrorInitFrame('skip_header must be greater than or equal to 0')
+        if skip_footer < 0:
+            raise ErrorInitFrame('skip_footer must be greater than or equal to 0')
+
+        with file_like_manager(fp, encoding=encoding) as f:
+            rows = iter(csv.reader(f, delimiter=delimiter, quotechar=quote_char))
+            for _ in range(skip_header):
+                next(rows, None)
+
+            header = delimited_header(rows,
                     index_depth=index_depth,
                     index_column_first=index_column_first,
+                    columns_depth=columns_depth,
+                    columns_select=columns_select,
                     dtypes=dtypes,
-                    consolidate_blocks=consolidate_blocks,
                     store_filter=store_filter,
-                    columns=columns
                     )
-        else: # only column data in table
-            if index_depth > 0:
-                # no data is found an index depth was given; simulate empty index_arrays to create a empty index
-                index_arrays = [EMPTY_TUPLE] * index_depth
-            data = FRAME_INITIALIZER_DEFAULT
-
-        kwargs = dict(
-                data=data,
-                own_data=True,
-                columns=columns,
-                own_columns=own_columns,
-                name=name
-                )
-
-        if index_depth == 0:
-            return cls(index=None, **kwargs)
-
-        index_name = None if columns_depth == 0 else apex_to_name(
-                rows=apex_rows,
-                depth_level=index_name_depth_level,
-                axis=0,
-                axis_depth=index_depth)
+            if header.first is None or not header.positions:
+                return
 
-        if index_depth == 1:
-            index_constructor = partial(Index, name=index_name)
-            return cls(
-                index=index_arrays[0],
-                index_constructor=index_constructor,
-                **kwargs)
+            dtypes_pinned: tp.List[tp.Optional[np.dtype]] = [None if dtype is None
+                    else np.dtype(dtype) for dtype in header.dtypes]
+            dtypes_given = [dtype is not None for dtype in dtypes_pinned]
+            labels = iter(header.columns_labels)
+            labels_by_col_idx = [None if pos in header.index_positions else next(labels)
+                    for pos in header.positions]
+
+            def filter_and_pin(col_idx: int, part: tp.Optional[np.ndarray], size: int) -> np.ndarray:
+                pos = header.positions[col_idx]
+                dtype = dtypes_pinned[col_idx]
+                if part is None and dtype is not None and dtype.kind == 'U':
+                    part = np.full(size, '')
+                array = delimited_array_filter(
+                        delimited_parts_to_array((part,), (size,)),
+                        dtype=dtype if dtypes_given[col_idx] else None,
+                        store_filter=None if pos in header.str_positions else store_filter,
+                        )
+                if dtype is None:
+                    dtypes_pinned[col_idx] = array.dtype
+                elif array.dtype != dtype and not dtypes_given[col_idx]:
+                    if array.dtype.kind in DTYPE_STR_KINDS and dtype.kind in DTYPE_STR_KINDS:
+                        return array
+                    if not np.can_cast(array.dtype, dtype, casting='safe'):
+                        label = labels_by_col_idx[col_idx]
+                        label = pos if label is None else label
+                        raise ErrorInitFrame(f'cannot convert values of {label!r} from {array.dtype} to {dtype}; provide dtypes to load this column')
+                    array = array.astype(dtype)
+                    array.flags.writeable = False
+                return array
 
-        index_constructor = partial(IndexHierarchy.from_labels, name=index_name)
-        return cls(
-                index=zip(*index_arrays),
-                index_constructor=index_constructor,
-                **kwargs
-                )
+            start = 0
+            for count, chunk in enumerate(delimited_chunks(chain((header.first,), rows),
+                    count=header.count,
+                    chunksize=chunksize,
+                    skip_footer=skip_footer,
+                    )):
+                size = len(chunk)
+                parts = delimited_chunk_to_arrays(chunk,
+                        positions=header.positions,
+                        str_positions=header.str_positions,
+                        )
+                arrays = [filter_and_pin(col_idx, part, size)
+                        for col_idx, part in enumerate(parts)]
+                yield cls._from_delimited_arrays(arrays,
+                        header=header,
+                        index=None if index_depth else range(start, start + size),
+                        index_depth=index_depth,
+                        index_name_depth_level=index_name_depth_level,
+                        columns_depth=columns_depth,
+                        columns_name_depth_level=columns_name_depth_level,
+                        name=count,
+                        consolidate_blocks=consolidate_blocks,
+                        )
+                start += size
 
     @classmethod
     def from_csv(cls,
@@ -1811,6 +2054,7 @@ class Frame(ContainerOperand):
             index_name_depth_level: tp.Optional[DepthLevelSpecifier] = None,
             columns_depth: int = 1,
             columns_name_depth_level: tp.Optional[DepthLevelSpecifier] = None,
+            columns_select: tp.Optional[tp.Iterable[tp.Hashable]] = None,
             skip_header: int = 0,
             skip_footer: int = 0,
             quote_char: str = '"',
@@ -1818,7 +2062,8 @@ class Frame(ContainerOperand):
             dtypes: DtypesSpecifier = None,
             name: tp.Hashable = None,
             consolidate_blocks: bool = False,
-            store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT
+            store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
+            max_workers: tp.Optional[int] = None,
             ) -> 'Frame':
         '''
         Specialized version of :obj:`Frame.from_delimited` for CSV files.
@@ -1833,6 +2078,7 @@ class Frame(ContainerOperand):
                 index_name_depth_level=index_name_depth_level,
                 columns_depth=columns_depth,
                 columns_name_depth_level=columns_name_depth_level,
+                columns_select=columns_select,
                 skip_header=skip_header,
                 skip_footer=skip_footer,
                 quote_char=quote_char,
@@ -1841,6 +2087,7 @@ class Frame(ContainerOperand):
                 name=name,
                 consolidate_blocks=consolidate_blocks,
                 store_filter=store_filter,
+                max_workers=max_workers,
                 )
 
     @classmethod
@@ -1852,6 +2099,7 @@ class Frame(ContainerOperand):
             index_name_depth_level: tp.Optional[DepthLevelSpecifier] = None,
             columns_depth: int = 1,
             columns_name_depth_level: tp.Optional[DepthLevelSpecifier] = None,
+            columns_select: tp.Optional[tp.Iterable[tp.Hashable]] = None,
             skip_header: int = 0,
             skip_footer: int = 0,
             quote_char: str = '"',
@@ -1859,7 +2107,8 @@ class Frame(ContainerOperand):
             dtypes: DtypesSpecifier = None,
             name: tp.Hashable = None,
             consolidate_blocks: bool = False,
-            store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT
+            store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
+            max_workers: tp.Optional[int] = None,
             ) -> 'Frame':
         '''
         Specialized version of :obj:`Frame.from_delimited` for TSV files.
@@ -1874,6 +2123,7 @@ class Frame(ContainerOperand):
                 index_name_depth_level=index_name_depth_level,
                 columns_depth=columns_depth,
                 columns_name_depth_level=columns_name_depth_level,
+                columns_select=columns_select,
                 skip_header=skip_header,
                 skip_footer=skip_footer,
                 quote_char=quote_char,
@@ -1882,6 +2132,7 @@ class Frame(ContainerOperand):
                 name=name,
                 consolidate_blocks=consolidate_blocks,
                 store_filter=store_filter,
+                max_workers=max_workers,
                 )
 
     @classmethod
@@ -1893,6 +2144,7 @@ class Frame(ContainerOperand):
             index_name_depth_level: tp.Optional[DepthLevelSpecifier] = None,
             columns_depth: int = 1,
             columns_name_depth_level: tp.Optional[DepthLevelSpecifier] = None,
+            columns_select: tp.Optional[tp.Iterable[tp.Hashable]] = None,
             skip_header: int = 0,
             skip_footer: int = 0,
             quote_char: str = '"',
@@ -1924,6 +2176,7 @@ class Frame(ContainerOperand):
                 index_name_depth_level=index_name_depth_level,
                 columns_depth=columns_depth,
                 columns_name_depth_level=columns_name_depth_level,
+                columns_select=columns_select,
                 skip_header=skip_header,
                 skip_footer=skip_footer,
                 quote_char=quote_char,
@@ -2038,6 +2291,22 @@ class Frame(ContainerOperand):
                 # store_filter=store_filter,
                 )
 
+    @classmethod
+    def from_npy_dir(cls,
+            fp: PathSpecifier,
+            *,
+            memory_map: bool = False,
+            ) -> 'Frame':
+        '''
+        Load Frame from a directory of NPY files written by :obj:`Frame.to_npy_dir`.
+
+        Args:
+            fp: A path to the directory.
+            memory_map: If True, memory-map each array read-only rather than loading it; the returned Frame can then be created in time independent of its size and shares pages with any other process mapping the same files.
+        '''
+        from static_frame.core.archive_npy import frame_from_npy_dir
+        return frame_from_npy_dir(cls, fp, memory_map=memory_map)
+
     #---------------------------------------------------------------------------
 
     @classmethod
@@ -2231,10 +2500,14 @@ class Frame(ContainerOperand):
 
                 yield array_final
 
+        # if all columns are index columns, there are no blocks from which to derive a row count
+        shape_reference = (value.num_rows, 0)
         if consolidate_blocks:
-            data = TypeBlocks.from_blocks(TypeBlocks.consolidate_blocks(blocks()))
+            data = TypeBlocks.from_blocks(TypeBlocks.consolidate_blocks(blocks()),
+                    shape_reference=shape_reference,
+                    )
         else:
-            data = TypeBlocks.from_blocks(blocks())
+            data = TypeBlocks.from_blocks(blocks(), shape_reference=shape_reference)
 
         # will be none if name_depth_level is None
         columns_name = None if not apex_labels else apex_to_name(rows=(apex_labels,),
@@ -2316,21 +2589,25 @@ class Frame(ContainerOperand):
         '''
         import pyarrow.parquet as pq #type: ignore
 
-        if columns_select and index_depth != 0:
-            raise ErrorInitFrame(f'cannot load index_depth {index_depth} when columns_select is specified.')
-
         fp = path_filter(fp)
 
-        # NOTE: the order of columns_select will determine their order
+        columns: tp.Optional[tp.List[str]] = None
+        if columns_select:
+            # NOTE: the order of columns_select will determine their order
+            columns = list(columns_select)
+            names = pq.read_schema(fp).names
+            # versions of pq.read_table differ in raising for or ignoring requested columns that are not found; check against the schema
+            missing = set(columns) - set(names)
+            if missing:
+                raise ErrorInitFrame(f'cannot load all columns in columns_select: missing {missing}')
+            if index_depth != 0:
+                # index fields are the leading fields; only those and the selected fields are read
+                columns = names[:index_depth] + columns
+
         table = pq.read_table(fp,
-                columns=columns_select,
+                columns=columns,
                 use_pandas_metadata=False,
                 )
-        if columns_select:
-            # pq.read_table will silently accept requested columns that are not found; this can be identified if we got back fewer columns than requested
-            if len(table.column_names) < len(columns_select):
-                missing = set(columns_select) - set(table.column_names)
-                raise ErrorInitFrame(f'cannot load all columns in columns_select: missing {missing}')
 
         return cls.from_arrow(table,
                 index_depth=index_depth,
@@ -2564,6 +2841,32 @@ class Frame(ContainerOperand):
 
     #---------------------------------------------------------------------------
 
+    def __reduce_ex__(self, protocol: int) -> tp.Tuple[tp.Any, ...]:
+        '''
+        With protocol 5 and greater, pickle through the component containers, each of which provides contiguous arrays for out-of-band transfer. Lower protocols use default pickling, such that pickles can be read by prior versions.
+        '''
+        if protocol < 5:
+            return object.__reduce_ex__(self, protocol) #type: ignore
+        return (self.__class__._from_pickle,
+                (self._blocks, self._index, self._columns, self._name),
+                )
+
+    @classmethod
+    def _from_pickle(cls,
+            blocks: TypeBlocks,
+            index: IndexBase,
+            columns: IndexBase,
+            name: NameType,
+            ) -> 'Frame':
+        return cls(blocks,
+                index=index,
+                columns=columns,
+                name=name,
+                own_data=True,
+                own_index=True,
+                own_columns=True,
+                )
+
     def __deepcopy__(self, memo: tp.Dict[int, tp.Any]) -> 'Frame':
         obj = self.__new__(self.__class__)
         obj._blocks = deepcopy(self._blocks, memo)
@@ -2816,6 +3119,7 @@ class Frame(ContainerOperand):
                 function_items=self._axis_group_loc_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_FLAT,
+                function_reduce=self._axis_group_reduce,
                 )
 
     @property
@@ -2829,6 +3133,7 @@ class Frame(ContainerOperand):
                 function_items=self._axis_group_loc_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_FLAT,
+                function_reduce=self._axis_group_reduce,
                 )
 
     @property
@@ -2873,7 +3178,8 @@ class Frame(ContainerOperand):
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
-                yield_type=IterNodeType.VALUES
+                yield_type=IterNodeType.VALUES,
+                function_reduce=partial(axis_window_reduce, source=self),
                 )
 
     @property
@@ -2890,7 +3196,8 @@ class Frame(ContainerOperand):
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
-                yield_type=IterNodeType.ITEMS
+                yield_type=IterNodeType.ITEMS,
+                function_reduce=partial(axis_window_reduce, source=self),
                 )
 
     @property
@@ -2907,7 +3214,8 @@ class Frame(ContainerOperand):
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
-                yield_type=IterNodeType.VALUES
+                yield_type=IterNodeType.VALUES,
+                function_reduce=partial(axis_window_reduce, source=self),
                 )
 
     @property
@@ -2924,7 +3232,8 @@ class Frame(ContainerOperand):
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
-                yield_type=IterNodeType.ITEMS
+                yield_type=IterNodeType.ITEMS,
+                function_reduce=partial(axis_window_reduce, source=self),
                 )
 
     #---------------------------------------------------------------------------
@@ -4433,6 +4742,69 @@ class Frame(ContainerOperand):
             ) -> tp.Iterator['Frame']:
         yield from (x for _, x in self._axis_group_loc_items(key=key, axis=axis))
 
+    def _axis_group_reduce(self,
+            key: GetItemKeyType,
+            *,
+            axis: int = 0,
+            func: str,
+            skipna: bool = True,
+            ) -> 'Frame':
+        '''
+        Reduce all groups with vectorized operations, returning a Frame with a label per group on the grouped axis. The key is factorized once and values are reduced per block with ``ufunc.reduceat``; the key columns (axis 0) or rows (axis 1) are excluded from the result, as are rows or columns with a NaN or NaT key.
+        '''
+        if axis == 0: # row groups, selecting columns for group by
+            iloc_key = self._columns._loc_to_iloc(key)
+            group_source = self._blocks._extract_array(column_key=iloc_key)
+            # column arrays of the key
+            key_arrays = [group_source] if group_source.ndim == 1 else list(group_source.T)
+            is_value = np.full(self._blocks._shape[1], True, dtype=DTYPE_BOOL)
+        elif axis == 1: # column groups, selecting rows for group by
+            iloc_key = self._index._loc_to_iloc(key)
+            group_source = self._blocks._extract_array(row_key=iloc_key)
+            key_arrays = [group_source] if group_source.ndim == 1 else list(group_source)
+            is_value = np.full(self._blocks._shape[0], True, dtype=DTYPE_BOOL)
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        is_value[iloc_key] = False
+        codes, count = arrays_to_codes(key_arrays)
+        order, starts, counts = codes_to_group_positions(codes, count)
+
+        first = order[starts]
+        if group_source.ndim == 1:
+            labels = group_source[first]
+        else: # make the groups hashable for usage in index construction
+            labels = list(zip(*(a[first] for a in key_arrays)))
+
+        def reduce(array: np.ndarray) -> np.ndarray:
+            return array_group_reduce(array,
+                    order,
+                    starts,
+                    counts,
+                    func=func,
+                    skipna=skipna,
+                    )
+
+        if axis == 0:
+            blocks = self._blocks._extract(column_key=is_value)
+            return self.__class__(
+                    TypeBlocks.from_blocks(reduce(b) for b in blocks._blocks),
+                    index=Index(labels),
+                    columns=self._columns[is_value],
+                    own_index=True,
+                    own_columns=True,
+                    own_data=True,
+                    )
+        # reduce columns of consolidated rows
+        values = self._blocks._extract(row_key=is_value).values
+        return self.__class__(
+                reduce(values.T).T,
+                index=self._index[is_value],
+                columns=self._COLUMNS_CONSTRUCTOR(labels),
+                own_index=True,
+                own_columns=True,
+                )
+
 
     def _axis_group_labels_items(self,
             depth_level: DepthLevelSpecifier = 0,
@@ -5760,165 +6132,130 @@ class Frame(ContainerOperand):
         if right_depth_level is None and right_columns is None:
             raise RuntimeError('Must specify one or both of right_depth_level and right_columns.')
 
-        # for now we reduce the targets to arrays; possible coercion in some cases, but seems inevitable as we will be doing row-wise comparisons
+        # NOTE: keys are taken one column at a time, without row-wise coercion, and factorized together to get all matching pairs in O(n log n) time (from sorting in factorization), rather than by comparing all pairs of rows
         target_left = TypeBlocks.from_blocks(
-                arrays_from_index_frame(self, left_depth_level, left_columns)).values
+                arrays_from_index_frame(self, left_depth_level, left_columns))
         target_right = TypeBlocks.from_blocks(
-                arrays_from_index_frame(other, right_depth_level, right_columns)).values
+                arrays_from_index_frame(other, right_depth_level, right_columns))
 
         if target_left.shape[1] != target_right.shape[1]:
             raise RuntimeError('left and right selections must be the same width.')
 
-        # Find matching pairs. Get iloc of left to iloc of right.
-        # If composite_index is True, is_many is True, if False, need to check if it is possible to not havea composite index.
-        is_many = composite_index # one to many or many to many
-
-        map_iloc = {}
-        seen = set()
-
-        # NOTE: this could be optimized by always iterating over the shorter target
-        for idx_left, row_left in enumerate(target_left):
-            # Get 1D vector showing matches along right's full heigh
-            matched = row_left == target_right
-            if matched is False:
-                continue
-            matched = matched.all(axis=1)
-            if not matched.any():
-                continue
-            matched_idx = np.flatnonzero(matched)
-            if not is_many:
-                if len(matched_idx) > 1:
-                    is_many = True
-                elif len(matched_idx) == 1:
-                    if matched_idx[0] in seen:
-                        is_many = True
-                    seen.add(matched_idx[0])
+        # Find matching pairs, ordered by left iloc and then by right iloc.
+        iloc_left, iloc_right = join_arrays_to_ilocs(
+                tuple(target_left.axis_values(0)),
+                tuple(target_right.axis_values(0)),
+                )
+        # ilocs of left rows with one or more matches, in order
+        iloc_left_matched = ufunc_unique(iloc_left)
 
-            map_iloc[idx_left] = matched_idx
+        # If composite_index is True, is_many is True, if False, need to check if it is possible to not havea composite index.
+        is_many = (composite_index # one to many or many to many
+                or len(iloc_left_matched) < len(iloc_left)
+                or len(ufunc_unique(iloc_right)) < len(iloc_right)
+                )
 
         if not composite_index and is_many:
             raise RuntimeError('A composite index is required in this join.')
 
         #-----------------------------------------------------------------------
-        # store collections of matches, derive final index
-
-        left_loc_set = set()
-        right_loc_set = set()
-        many_loc = []
-        many_iloc = []
+        # derive final index, as well as the ilocs from left and right to be taken for each row (-1 where a row is filled)
 
         cifv = composite_index_fill_value
 
-        # NOTE: doing selection and using iteration (from set, and with zip, below) reduces chances for type coercion in IndexHierarchy
-        left_loc = left_index[list(map_iloc.keys())]
-
-        for (k, v), left_loc_element in zip(map_iloc.items(), left_loc):
-            left_loc_set.add(left_loc_element)
-            # right at v is an array
-            right_loc_part = right_index[v] # iloc to loc
-            right_loc_set.update(right_loc_part)
-
-            if is_many:
-                many_loc.extend(Pair(p) for p in product((left_loc_element,), right_loc_part))
-                many_iloc.extend(Pair(p) for p in product((k,), v))
-
-        if join_type is Join.INNER:
-            if is_many:
-                final_index = Index(many_loc)
-            else: # just those matched from the left, which are also on right
-                final_index = Index(left_loc)
-        elif join_type is Join.LEFT:
-            if is_many:
-                extend = (PairLeft((x, cifv))
-                        for x in left_index if x not in left_loc_set)
-                # What if we are extending an index that already has a tuple
-                final_index = Index(chain(many_loc, extend))
-            else:
+        if is_many:
+            if join_type not in (Join.INNER, Join.LEFT, Join.RIGHT, Join.OUTER):
+                raise NotImplementedError(f'index source must be one of {tuple(Join)}')
+
+            is_left_unmatched = np.full(len(left_index), True, dtype=DTYPE_BOOL)
+            is_left_unmatched[iloc_left] = False
+            is_right_unmatched = np.full(len(right_index), True, dtype=DTYPE_BOOL)
+            is_right_unmatched[iloc_right] = False
+
+            # NOTE: using iteration of labels reduces chances for type coercion in IndexHierarchy
+            labels_left = list(left_index)
+            labels_right = list(right_index)
+            many_loc = [Pair((labels_left[k], labels_right[v]))
+                    for k, v in zip(iloc_left, iloc_right)]
+
+            iloc_left_parts = [iloc_left]
+            iloc_right_parts = [iloc_right]
+            extend_left: tp.Iterable[Pair] = ()
+            extend_right: tp.Iterable[Pair] = ()
+
+            if join_type is Join.LEFT or join_type is Join.OUTER:
+                iloc_left_extend = np.flatnonzero(is_left_unmatched)
+                extend_left = [PairLeft((labels_left[k], cifv))
+                        for k in iloc_left_extend]
+                iloc_left_parts.append(iloc_left_extend)
+                iloc_right_parts.append(np.full(len(iloc_left_extend), -1))
+            if join_type is Join.RIGHT or join_type is Join.OUTER:
+                iloc_right_extend = np.flatnonzero(is_right_unmatched)
+                extend_right = [PairRight((cifv, labels_right[v]))
+                        for v in iloc_right_extend]
+                iloc_left_parts.append(np.full(len(iloc_right_extend), -1))
+                iloc_right_parts.append(iloc_right_extend)
+
+            final_index = Index(chain(many_loc, extend_left, extend_right))
+            final_iloc_left = np.concatenate(iloc_left_parts)
+            final_iloc_right = np.concatenate(iloc_right_parts)
+
+        else:
+            if join_type is Join.INNER:
+                # just those matched from the left, which are also on right
+                final_index = Index(left_index[iloc_left_matched])
+            elif join_type is Join.LEFT:
                 final_index = left_index
-        elif join_type is Join.RIGHT:
-            if is_many:
-                extend = (PairRight((cifv, x))
-                        for x in right_index if x not in right_loc_set)
-                final_index = Index(chain(many_loc, extend))
-            else:
+            elif join_type is Join.RIGHT:
                 final_index = right_index
-        elif join_type is Join.OUTER:
-            extend_left = (PairLeft((x, cifv))
-                    for x in left_index if x not in left_loc_set)
-            extend_right = (PairRight((cifv, x))
-                    for x in right_index if x not in right_loc_set)
-            if is_many:
-                # must revese the many_loc so as to preserent right id first
-                final_index = Index(chain(many_loc, extend_left, extend_right))
-            else:
+            elif join_type is Join.OUTER:
                 final_index = left_index.union(right_index)
-        else:
-            raise NotImplementedError(f'index source must be one of {tuple(Join)}')
+            else:
+                raise NotImplementedError(f'index source must be one of {tuple(Join)}')
+
+            # for each final label, prefer the right row matched by the left row of that label; otherwise, take the right row of that label
+            left_to_right = np.full(len(left_index), -1, dtype=DTYPE_INT_DEFAULT)
+            left_to_right[iloc_left] = iloc_right
+
+            final_iloc_left = index_to_ilocs(left_index, final_index)
+            final_iloc_right = np.full(len(final_index), -1, dtype=DTYPE_INT_DEFAULT)
+            is_left = final_iloc_left >= 0
+            final_iloc_right[is_left] = left_to_right[final_iloc_left[is_left]]
+
+            is_unmatched = final_iloc_right < 0
+            if is_unmatched.any():
+                final_iloc_right[is_unmatched] = index_to_ilocs(
+                        right_index, final_index)[is_unmatched]
 
         #-----------------------------------------------------------------------
         # construct final frame
 
+        left_columns = (left_template.format(c) for c in self.columns)
+
         if not is_many:
             final = FrameGO(index=final_index)
-            left_columns = (left_template.format(c) for c in self.columns)
             final.extend(self.relabel(columns=left_columns), fill_value=fill_value)
-            # build up a Series for each new column
-            for idx_col, col in enumerate(other.columns):
-                values = []
-                for loc in final_index:
-                    # what if loc is in both left and rihgt?
-                    if loc in left_index and left_index._loc_to_iloc(loc) in map_iloc:
-                        iloc = map_iloc[left_index._loc_to_iloc(loc)]
-                        assert len(iloc) == 1 # not is_many, so all have to be length 1
-                        values.append(other.iloc[iloc[0], idx_col])
-                    elif loc in right_index:
-                        values.append(other.loc[loc, col])
-                    else:
-                        values.append(fill_value)
-                final[right_template.format(col)] = values
-            return final.to_frame()
-
-        # From here, is_many is True
-        row_key = []
-        final_index_left = []
-        for p in final_index:
-            if p.__class__ is Pair: # in both
-                iloc = left_index._loc_to_iloc(p[0])
-                row_key.append(iloc)
-                final_index_left.append(p)
-            elif p.__class__ is PairLeft:
-                row_key.append(left_index._loc_to_iloc(p[0]))
-                final_index_left.append(p)
-
-        # extract potentially repeated rows
-        tb = self._blocks._extract(row_key=row_key)
-        left_columns = (left_template.format(c) for c in self.columns)
-
-        final = FrameGO(tb,
-                index=Index(final_index_left),
-                columns=left_columns,
-                own_data=True)
-
-        # only do this if we have PairRight above
-        if len(final_index_left) < len(final_index):
-            final = final.reindex(final_index, fill_value=fill_value)
+        else:
+            final = FrameGO(
+                    TypeBlocks.from_blocks(self._blocks.resize_blocks(
+                            index_ic=IndexCorrespondence.from_iloc_src(final_iloc_left),
+                            columns_ic=None,
+                            fill_value=fill_value,
+                            )),
+                    index=final_index,
+                    columns=left_columns,
+                    own_data=True,
+                    )
 
         # populate from right columns
-        for idx_col, col in enumerate(other.columns):
-            values = []
-            for pair in final_index:
-                if isinstance(pair, Pair):
-                    loc_left, loc_right = pair
-                    if pair.__class__ is PairRight: # get from right
-                        values.append(other.loc[loc_right, col])
-                    elif pair.__class__ is PairLeft:
-                        # get from left, but we do not have col, so fill value
-                        values.append(fill_value)
-                    else: # is this case needed?
-                        values.append(other.loc[loc_right, col])
-                else:
-                    values.append(fill_value)
+        blocks_right = TypeBlocks.from_blocks(other._blocks.resize_blocks(
+                index_ic=IndexCorrespondence.from_iloc_src(final_iloc_right),
+                columns_ic=None,
+                fill_value=fill_value,
+                ))
+        for col, values in zip(other.columns, blocks_right.axis_values(0)):
             final[right_template.format(col)] = values
+
         return final.to_frame()
 
 
@@ -6098,6 +6435,58 @@ class Frame(ContainerOperand):
                 composite_index_fill_value=composite_index_fill_value,
                 )
 
+    @doc_inject(selector='join')
+    def join_asof(self,
+            other: 'Frame',
+            *,
+            direction: str = 'backward',
+            tolerance: tp.Any = None,
+            left_template: str = '{}',
+            right_template: str = '{}',
+            fill_value: tp.Any = np.nan,
+            ) -> 'Frame':
+        '''
+        Perform an as-of join, retaining the index of this :obj:`Frame` and, for each label, adding the values of ``other`` found at the nearest label of the sorted index of ``other``, as determined by ``direction``. As only positions in ``other`` are searched for, no union of the indices is created.
+
+        Args:
+            {direction}
+            {tolerance}
+            {left_template}
+            {right_template}
+            {fill_value}
+
+        Returns:
+            :obj:`Frame`
+        '''
+        if self._index.depth != 1 or other.index.depth != 1:
+            raise RuntimeError('join_asof requires indices of depth 1.')
+
+        index_ic = IndexCorrespondence.from_iloc_src(asof_ilocs(
+                other.index.values,
+                self._index.values,
+                direction=direction,
+                tolerance=tolerance,
+                ))
+        blocks = TypeBlocks.from_blocks(chain(
+                self._blocks._blocks,
+                other._blocks.resize_blocks(
+                        index_ic=index_ic,
+                        columns_ic=None,
+                        fill_value=fill_value,
+                        ),
+                ))
+        columns = chain(
+                (left_template.format(c) for c in self._columns),
+                (right_template.format(c) for c in other.columns),
+                )
+        return self.__class__(blocks,
+                index=self._index,
+                columns=columns,
+                name=self._name,
+                own_data=True,
+                own_index=True,
+                )
+
     #---------------------------------------------------------------------------
     def _insert(self,
             key: int, # iloc positions
@@ -6589,36 +6978,23 @@ class Frame(ContainerOperand):
                     row.extend(f'{x}' for x in columns_row)
                 yield row
 
-        col_idx_last = self._blocks._shape[1] - 1
-        # avoid row creation to avoid joining types; avoide creating a list for each row
-        row_current_idx: tp.Optional[int] = None
+        if not self._blocks._shape[1]: # no elements to write
+            return
 
-        for (row_idx, col_idx), element in self._iter_element_iloc_items():
-            if row_idx != row_current_idx: # each new row
-                if row_current_idx is not None: # if not the first
-                    yield row
-                row = []
-                if include_index:
-                    if index_depth == 1:
-                        index_value = index_values[row_idx]
-                        if store_filter:
-                            row.append(f'{filter_func(index_value)}')
-                        else:
-                            row.append(f'{index_value}')
-                    else:
-                        for index_value in index_values[row_idx]:
-                            if store_filter:
-                                row.append(f'{filter_func(index_value)}')
-                            else:
-                                row.append(f'{index_value}')
-                row_current_idx = row_idx
-            if store_filter:
-                row.append(f'{filter_func(element)}')
+        arrays = []
+        if include_index:
+            if index_depth == 1:
+                arrays.append(index_values)
             else:
-                row.append(f'{element}')
+                arrays.extend(index_values[NULL_SLICE, i] for i in range(index_depth))
+        arrays.extend(self._blocks.axis_values(0))
 
-        if row_current_idx is not None:
-            yield row
+        # format each column in bulk, a chunk of rows at a time to bound memory
+        count = self._blocks._shape[0]
+        for start in range(0, count, DELIMITED_CHUNK_SIZE):
+            key = slice(start, start + DELIMITED_CHUNK_SIZE)
+            yield from map(list, zip(*(array_to_str_list(array[key], store_filter)
+                    for array in arrays)))
 
     @doc_inject(selector='delimited')
     def to_delimited(self,
@@ -6665,14 +7041,13 @@ class Frame(ContainerOperand):
                     quoting=quoting,
                     doublequote=quote_double,
                     )
-            for row in self._to_str_records(
+            csvw.writerows(self._to_str_records(
                     include_index=include_index,
                     include_index_name=include_index_name,
                     include_columns=include_columns,
                     include_columns_name=include_columns_name,
                     store_filter=store_filter,
-                    ):
-                csvw.writerow(row)
+                    ))
 
     @doc_inject(selector='delimited')
     def to_csv(self,
@@ -6918,6 +7293,18 @@ class Frame(ContainerOperand):
                 # store_filter=store_filter,
                 )
 
+    def to_npy_dir(self,
+            fp: PathSpecifier,
+            ) -> None:
+        '''
+        Write the Frame as a directory of NPY files, one for each block and for each depth of the index and columns, with a JSON header storing names and index classes. Object arrays cannot be written.
+
+        Args:
+            fp: A path to the directory, created if it does not exist.
+        '''
+        from static_frame.core.archive_npy import frame_to_npy_dir
+        frame_to_npy_dir(self, fp)
+
     #---------------------------------------------------------------------------
 
     @doc_inject(class_name='Frame')
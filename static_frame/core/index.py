@@ -36,6 +36,8 @@ from static_frame.core.node_selector import InterfaceSelectDuo
 from static_frame.core.node_selector import TContainer
 from static_frame.core.node_str import InterfaceString
 
+from static_frame.core.util import immutable_unpickle
+from static_frame.core.util import pickle_filter
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_sample
 from static_frame.core.util import array2d_to_tuples
@@ -484,6 +486,30 @@ class Index(IndexBase):
             setattr(self, key, value)
         self._labels.flags.writeable = False
 
+    def __reduce_ex__(self, protocol: int) -> tp.Tuple[tp.Any, ...]:
+        '''
+        With protocol 5 and greater, pickle only the labels and name, restoring the mapping on load; labels are contiguous such that their buffer can be passed out-of-band. Lower protocols use default pickling, such that pickles can be read by prior versions.
+        '''
+        if protocol < 5:
+            return object.__reduce_ex__(self, protocol) #type: ignore
+        if self._recache:
+            self._update_array_cache()
+        return (self.__class__._from_pickle,
+                (pickle_filter(self._labels, protocol), self._name, self._map is None),
+                )
+
+    @classmethod
+    def _from_pickle(cls: tp.Type[I],
+            labels: np.ndarray,
+            name: NameType,
+            loc_is_iloc: bool,
+            ) -> I:
+        labels = immutable_unpickle(labels)
+        if loc_is_iloc:
+            return cls(labels, name=name, loc_is_iloc=True)
+        # datetime64 indices do not take a loc_is_iloc argument
+        return cls(labels, name=name)
+
     def __deepcopy__(self: I, memo: tp.Dict[int, tp.Any]) -> I:
         if self._recache:
             self._update_array_cache()
@@ -117,6 +117,28 @@ class IndexCorrespondence:
                 size=size)
 
 
+    @classmethod
+    def from_iloc_src(cls,
+            iloc_src: np.ndarray,
+            ) -> 'IndexCorrespondence':
+        '''
+        Return an IndexCorrespondence instance from an array giving, for each destination position, the source iloc position to be taken, or -1 where the destination is to be filled.
+        '''
+        is_taken = iloc_src >= 0
+        if is_taken.all():
+            return cls(has_common=len(iloc_src) > 0,
+                    is_subset=True,
+                    iloc_src=iloc_src,
+                    iloc_dst=np.arange(len(iloc_src)),
+                    size=len(iloc_src),
+                    )
+        return cls(has_common=is_taken.any(),
+                is_subset=False,
+                iloc_src=iloc_src[is_taken],
+                iloc_dst=np.flatnonzero(is_taken),
+                size=len(iloc_src),
+                )
+
     def __init__(self,
             has_common: bool,
             is_subset: bool,
@@ -95,6 +95,7 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
             ) -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]:
 
         pool_executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
@@ -121,9 +122,12 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
                     yield k, v
 
         with pool_executor(max_workers=max_workers) as executor:
-            yield from zip(func_keys,
-                    executor.map(func, arg_gen(), chunksize=chunksize)
-                    )
+            if use_shared_memory and not use_threads:
+                from static_frame.core.shared_memory import shared_memory_map #pylint: disable=C0415
+                results = shared_memory_map(executor, func, arg_gen(), chunksize=chunksize)
+            else:
+                results = executor.map(func, arg_gen(), chunksize=chunksize)
+            yield from zip(func_keys, results)
 
     #---------------------------------------------------------------------------
     # public interface
@@ -344,7 +348,8 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             name: NameType = None,
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
-            use_threads: bool = False
+            use_threads: bool = False,
+            use_shared_memory: bool = False,
             ) -> FrameOrSeries:
         '''
         {doc} Employ parallel processing with either the ProcessPoolExecutor or ThreadPoolExecutor.
@@ -357,13 +362,16 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             {max_workers}
             {chunksize}
             {use_threads}
+            {use_shared_memory}
         '''
         return self._apply_constructor(
                 self._apply_iter_items_parallel(
                         func=func,
                         max_workers=max_workers,
                         chunksize=chunksize,
-                        use_threads=use_threads),
+                        use_threads=use_threads,
+                        use_shared_memory=use_shared_memory,
+                        ),
                 dtype=dtype,
                 name=name,
                 )
@@ -382,12 +390,139 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
 
 
 
+class IterNodeReduce(tp.Generic[FrameOrSeries]):
+    '''
+    Interface, returned from ``reduce`` on an :obj:`static_frame.IterNodeDelegate`, for reducing all iterated components with vectorized operations, returning a single container.
+    '''
+
+    __slots__ = (
+            '_func_reduce',
+            )
+
+    INTERFACE = (
+            'sum',
+            'mean',
+            'min',
+            'max',
+            'count',
+            'first',
+            'last',
+            )
+
+    def __init__(self,
+            func_reduce: tp.Callable[..., FrameOrSeries],
+            ) -> None:
+        '''
+        Args:
+            func_reduce: Callable that takes the name of the reduction function and ``skipna``, returning a container.
+        '''
+        self._func_reduce = func_reduce
+
+    def sum(self, *, skipna: bool = True) -> FrameOrSeries:
+        '''Return the sum of each component.'''
+        return self._func_reduce(func='sum', skipna=skipna)
+
+    def mean(self, *, skipna: bool = True) -> FrameOrSeries:
+        '''Return the mean of each component.'''
+        return self._func_reduce(func='mean', skipna=skipna)
+
+    def min(self, *, skipna: bool = True) -> FrameOrSeries:
+        '''Return the minimum of each component.'''
+        return self._func_reduce(func='min', skipna=skipna)
+
+    def max(self, *, skipna: bool = True) -> FrameOrSeries:
+        '''Return the maximum of each component.'''
+        return self._func_reduce(func='max', skipna=skipna)
+
+    def count(self, *, skipna: bool = True) -> FrameOrSeries:
+        '''Return the count of values in each component; if ``skipna`` is True, NA values are not counted.'''
+        return self._func_reduce(func='count', skipna=skipna)
+
+    def first(self) -> FrameOrSeries:
+        '''Return the first value of each component.'''
+        return self._func_reduce(func='first', skipna=False)
+
+    def last(self) -> FrameOrSeries:
+        '''Return the last value of each component.'''
+        return self._func_reduce(func='last', skipna=False)
+
+
+class IterNodeReduceWindow(IterNodeReduce[FrameOrSeries]):
+    '''
+    Interface, returned from ``reduce`` on an :obj:`static_frame.IterNodeDelegate` for windows, for reducing all windows with vectorized operations, returning a single container.
+    '''
+
+    __slots__ = ()
+
+    INTERFACE = IterNodeReduce.INTERFACE + (
+            'std',
+            'apply',
+            )
+
+    def std(self, *, skipna: bool = True, ddof: int = 0) -> FrameOrSeries:
+        '''Return the standard deviation of each window.'''
+        return self._func_reduce(func='std', skipna=skipna, ddof=ddof)
+
+    def apply(self, func: AnyCallable) -> FrameOrSeries:
+        '''
+        Call ``func`` once with all windows as a single, read-only array of strided views (without copying values), where the first axis is windows and the second axis is positions within each window. The function must reduce the second axis, returning an array with one value (or row of values) per window.
+
+        Args:
+            func: A function that takes an array of windows.
+        '''
+        return self._func_reduce(func=func, skipna=False)
+
+
+class IterNodeDelegateReducible(IterNodeDelegate[FrameOrSeries]):
+    '''
+    Delegate returned from :obj:`static_frame.IterNode` for iterators that, in addition to iteration and apply methods, support vectorized reduction with ``reduce``.
+    '''
+
+    __slots__ = (
+            '_func_reduce',
+            '_reduce_constructor',
+            )
+
+    INTERFACE = IterNodeDelegate.INTERFACE + (
+            'reduce',
+            )
+
+    def __init__(self,
+            func_values: tp.Callable[..., tp.Iterable[tp.Any]],
+            func_items: tp.Callable[..., tp.Iterable[tp.Tuple[tp.Any, tp.Any]]],
+            yield_type: IterNodeType,
+            apply_constructor: tp.Callable[..., FrameOrSeries],
+            func_reduce: tp.Callable[..., FrameOrSeries],
+            reduce_constructor: tp.Type[IterNodeReduce[FrameOrSeries]] = IterNodeReduce,
+        ) -> None:
+        '''
+        Args:
+            reduce_constructor: Class of the interface returned by ``reduce``.
+        '''
+        IterNodeDelegate.__init__(self,
+                func_values=func_values,
+                func_items=func_items,
+                yield_type=yield_type,
+                apply_constructor=apply_constructor,
+                )
+        self._func_reduce = func_reduce
+        self._reduce_constructor = reduce_constructor
+
+    @property
+    def reduce(self) -> IterNodeReduce[FrameOrSeries]:
+        '''
+        Interface for reducing all iterated components with vectorized operations, returning a single container.
+        '''
+        return self._reduce_constructor(self._func_reduce)
+
+
 #-------------------------------------------------------------------------------
 
 _ITER_NODE_SLOTS = (
         '_container',
         '_func_values',
         '_func_items',
+        '_func_reduce',
         '_yield_type',
         '_apply_type'
         )
@@ -399,21 +534,26 @@ class IterNode(tp.Generic[FrameOrSeries]):
 
     __slots__ = _ITER_NODE_SLOTS
 
+    _REDUCE_CONSTRUCTOR: tp.Type[IterNodeReduce[tp.Any]] = IterNodeReduce
+
     def __init__(self, *,
             container: FrameOrSeries,
             function_values: tp.Callable[..., tp.Iterable[tp.Any]],
             function_items: tp.Callable[..., tp.Iterable[tp.Tuple[tp.Any, tp.Any]]],
             yield_type: IterNodeType,
-            apply_type: IterNodeApplyType = IterNodeApplyType.SERIES_ITEMS
+            apply_type: IterNodeApplyType = IterNodeApplyType.SERIES_ITEMS,
+            function_reduce: tp.Optional[tp.Callable[..., FrameOrSeries]] = None,
             ) -> None:
         '''
         Args:
             function_values: will be partialed with arguments given with __call__.
             function_items: will be partialed with arguments given with __call__.
+            function_reduce: if provided, will be partialed with arguments given with __call__ and exposed as ``reduce`` on the delegate.
         '''
         self._container: FrameOrSeries = container
         self._func_values = function_values
         self._func_items = function_items
+        self._func_reduce = function_reduce
         self._yield_type = yield_type
         self._apply_type = apply_type
 
@@ -475,6 +615,16 @@ class IterNode(tp.Generic[FrameOrSeries]):
         else:
             raise NotImplementedError(self._apply_type) #pragma: no cover
 
+        if self._func_reduce is not None:
+            return IterNodeDelegateReducible(
+                    func_values=func_values,
+                    func_items=func_items,
+                    yield_type=self._yield_type,
+                    apply_constructor=tp.cast(tp.Callable[..., FrameOrSeries], apply_constructor),
+                    func_reduce=partial(self._func_reduce, **kwargs),
+                    reduce_constructor=self._REDUCE_CONSTRUCTOR,
+                    )
+
         return IterNodeDelegate(
                 func_values=func_values,
                 func_items=func_items,
@@ -574,6 +724,8 @@ class IterNodeWindow(IterNode[FrameOrSeries]):
 
     __slots__ = _ITER_NODE_SLOTS
 
+    _REDUCE_CONSTRUCTOR = IterNodeReduceWindow
+
     def __call__(self, *,
             size: int,
             axis: int = 0,
@@ -31,6 +31,7 @@ from static_frame.core.store_hdf5 import StoreHDF5
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
 from static_frame.core.store_zip import StoreZipCSV
+from static_frame.core.store_zip import StoreZipNPY
 from static_frame.core.store_zip import StoreZipParquet
 from static_frame.core.store_zip import StoreZipPickle
 from static_frame.core.store_zip import StoreZipTSV
@@ -89,27 +90,26 @@ class AxisMap:
         '''
         Given a :obj:`Bus` and an axis, derive a :obj:`Series` with an :obj:`IndexHierarchy`; also return and validate the :obj:`Index` of the opposite axis.
         '''
-        # NOTE: need to extract just axis labels, not the full Frame; need new Store/Bus loaders just for label data
-
         extractor = get_extractor(deepcopy_from_bus, is_array=False, memo_active=False)
 
         tree = {}
         opposite: tp.Optional[IndexBase] = None
 
-        for label, f in bus.items():
+        # only labels are needed: Frame not yet loaded in the Bus are not read
+        for label, index, columns in bus._index_columns_items():
             if axis == 0:
-                tree[label] = extractor(f.index)
+                tree[label] = extractor(index)
                 if opposite is None:
-                    opposite = extractor(f.columns)
+                    opposite = extractor(columns)
                 else:
-                    if not opposite.equals(f.columns):
+                    if not opposite.equals(columns):
                         raise ErrorInitQuilt('opposite axis must have equivalent indices')
             elif axis == 1:
-                tree[label] = extractor(f.columns)
+                tree[label] = extractor(columns)
                 if opposite is None:
-                    opposite = extractor(f.index)
+                    opposite = extractor(index)
                 else:
-                    if not opposite.equals(f.index):
+                    if not opposite.equals(index):
                         raise ErrorInitQuilt('opposite axis must have equivalent indices')
             else:
                 raise AxisInvalid(f'invalid axis {axis}')
@@ -221,10 +221,12 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
             ) -> 'Quilt':
         bus = Bus._from_store(store=store,
                 config=config,
                 max_persist=max_persist, # None is default
+                max_persist_bytes=max_persist_bytes,
                 )
         return cls(bus,
                 axis=axis,
@@ -243,6 +245,7 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
             ) -> 'Quilt':
         '''
         Given a file path to zipped TSV :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -256,6 +259,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
                 )
 
     @classmethod
@@ -268,6 +272,7 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
             ) -> 'Quilt':
         '''
         Given a file path to zipped CSV :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -281,6 +286,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
                 )
 
     @classmethod
@@ -293,6 +299,7 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
             ) -> 'Quilt':
         '''
         Given a file path to zipped pickle :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -306,9 +313,37 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
                 )
 
 
+    @classmethod
+    @doc_inject(selector='quilt_constructor')
+    def from_zip_npy(cls,
+            fp: PathSpecifier,
+            *,
+            config: StoreConfigMapInitializer = None,
+            axis: int = 0,
+            retain_labels: bool,
+            deepcopy_from_bus: bool = False,
+            max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            ) -> 'Quilt':
+        '''
+        Given a file path to zipped NPY :obj:`Quilt` store, return a :obj:`Quilt` instance.
+
+        {args}
+        '''
+        store = StoreZipNPY(fp)
+        return cls._from_store(store,
+                config=config,
+                axis=axis,
+                retain_labels=retain_labels,
+                deepcopy_from_bus=deepcopy_from_bus,
+                max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                )
+
     @classmethod
     @doc_inject(selector='quilt_constructor')
     def from_zip_parquet(cls,
@@ -319,6 +354,7 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
             ) -> 'Quilt':
         '''
         Given a file path to zipped parquet :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -332,6 +368,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
                 )
 
 
@@ -345,6 +382,7 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
             ) -> 'Quilt':
         '''
         Given a file path to an XLSX :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -359,6 +397,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
                 )
 
 
@@ -372,6 +411,7 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
             ) -> 'Quilt':
         '''
         Given a file path to an SQLite :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -385,6 +425,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
                 )
 
 
@@ -398,6 +439,7 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
             ) -> 'Quilt':
         '''
         Given a file path to a HDF5 :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -411,6 +453,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
                 )
 
     #---------------------------------------------------------------------------
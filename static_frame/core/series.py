@@ -10,6 +10,7 @@ from static_frame.core.assign import Assign
 from static_frame.core.container import ContainerOperand
 from static_frame.core.container_util import apply_binary_operator
 from static_frame.core.container_util import axis_window_items
+from static_frame.core.container_util import axis_window_reduce
 from static_frame.core.container_util import index_from_optional_constructor
 from static_frame.core.container_util import index_many_concat
 from static_frame.core.container_util import index_many_set
@@ -44,8 +45,11 @@ from static_frame.core.node_selector import InterfaceAssignTrio
 from static_frame.core.node_selector import InterfaceGetItem
 from static_frame.core.node_selector import InterfaceSelectTrio
 from static_frame.core.node_str import InterfaceString
+from static_frame.core.util import immutable_unpickle
+from static_frame.core.util import pickle_filter
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import argmax_1d
+from static_frame.core.util import asof_ilocs
 from static_frame.core.util import argmin_1d
 from static_frame.core.util import array_deepcopy
 from static_frame.core.util import array_shift
@@ -495,6 +499,28 @@ class Series(ContainerOperand):
             setattr(self, key, value)
         self.values.flags.writeable = False
 
+    def __reduce_ex__(self, protocol: int) -> tp.Tuple[tp.Any, ...]:
+        '''
+        With protocol 5 and greater, pickle the values, index, and name, where values are contiguous such that their buffer can be passed out-of-band. Lower protocols use default pickling, such that pickles can be read by prior versions.
+        '''
+        if protocol < 5:
+            return object.__reduce_ex__(self, protocol) #type: ignore
+        return (self.__class__._from_pickle,
+                (pickle_filter(self.values, protocol), self._index, self._name),
+                )
+
+    @classmethod
+    def _from_pickle(cls,
+            values: np.ndarray,
+            index: IndexBase,
+            name: NameType,
+            ) -> 'Series':
+        return cls(immutable_unpickle(values),
+                index=index,
+                name=name,
+                own_index=True,
+                )
+
     def __deepcopy__(self, memo: tp.Dict[int, tp.Any]) -> 'Series':
         obj = self.__new__(self.__class__)
         obj.values = array_deepcopy(self.values, memo)
@@ -737,7 +763,8 @@ class Series(ContainerOperand):
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
-                yield_type=IterNodeType.VALUES
+                yield_type=IterNodeType.VALUES,
+                function_reduce=partial(axis_window_reduce, source=self),
                 )
 
     @property
@@ -748,7 +775,8 @@ class Series(ContainerOperand):
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
-                yield_type=IterNodeType.ITEMS
+                yield_type=IterNodeType.ITEMS,
+                function_reduce=partial(axis_window_reduce, source=self),
                 )
 
 
@@ -760,7 +788,8 @@ class Series(ContainerOperand):
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
-                yield_type=IterNodeType.VALUES
+                yield_type=IterNodeType.VALUES,
+                function_reduce=partial(axis_window_reduce, source=self),
                 )
 
     @property
@@ -771,7 +800,8 @@ class Series(ContainerOperand):
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
-                yield_type=IterNodeType.ITEMS
+                yield_type=IterNodeType.ITEMS,
+                function_reduce=partial(axis_window_reduce, source=self),
                 )
     #---------------------------------------------------------------------------
     # index manipulation
@@ -840,6 +870,53 @@ class Series(ContainerOperand):
                 own_index=True,
                 name=self._name)
 
+    @doc_inject(selector='reindex_asof', class_name='Series')
+    def reindex_asof(self,
+            index: IndexInitializer,
+            *,
+            direction: str = 'backward',
+            tolerance: tp.Any = None,
+            fill_value: tp.Any = np.nan,
+            own_index: bool = False,
+            ) -> 'Series':
+        '''
+        {doc}
+
+        Args:
+            index: {index_initializer}
+            {direction}
+            {tolerance}
+            {fill_value}
+            {own_index}
+        '''
+        if self._index.depth != 1:
+            raise RuntimeError('reindex_asof requires an index of depth 1.')
+
+        if not own_index:
+            # permit labels, such as strings, to be interpreted by a datetime index
+            index = index_from_optional_constructor(index,
+                    default_constructor=self._index.__class__)
+
+        ic = IndexCorrespondence.from_iloc_src(asof_ilocs(
+                self._index.values,
+                index.values, #type: ignore
+                direction=direction,
+                tolerance=tolerance,
+                ))
+
+        if ic.is_subset:
+            values = self.values[ic.iloc_src]
+        else:
+            values = full_for_fill(self.values.dtype, ic.size, fill_value)
+            if ic.has_common:
+                values[ic.iloc_dst] = self.values[ic.iloc_src]
+        values.flags.writeable = False
+
+        return self.__class__(values,
+                index=index,
+                own_index=True,
+                name=self._name)
+
     @doc_inject(selector='relabel', class_name='Series')
     def relabel(self,
             index: tp.Optional[RelabelInput]
@@ -0,0 +1,264 @@
+'''
+Tools for passing containers to and from process pools through shared memory. Objects are pickled with protocol 5, such that array buffers are provided out-of-band; those buffers are copied into a single shared memory segment, and only the in-band pickle and the segment name are sent between processes. Buffers are copied out of a segment when restored, such that segments can be closed and unlinked immediately.
+
+Shared memory and pickle protocol 5 require Python 3.8 or greater; ``multiprocessing.shared_memory`` is only imported when these tools are used.
+'''
+import pickle
+import sys
+import typing as tp
+from collections import deque
+from itertools import islice
+from concurrent.futures import Executor
+from concurrent.futures import Future
+
+from static_frame.core.util import AnyCallable
+
+if tp.TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory # pylint: disable=W0611 #pragma: no cover
+
+# offsets of buffers within a segment are aligned to permit efficient array access
+SHARED_MEMORY_ALIGN = 64
+
+
+def shared_memory_validate() -> None:
+    '''
+    Raise if shared memory transport is not available in this Python.
+    '''
+    if sys.version_info < (3, 8):
+        raise RuntimeError('use_shared_memory requires Python 3.8 or greater')
+
+
+class SharedMemoryPayload(tp.NamedTuple):
+    '''
+    A description of an object stored in a shared memory segment; ``name`` is None if the object had no out-of-band buffers.
+    '''
+    data: bytes
+    name: tp.Optional[str]
+    spans: tp.Tuple[tp.Tuple[int, int], ...]
+
+
+def shared_memory_encode(obj: tp.Any) -> tp.Tuple[SharedMemoryPayload, tp.Optional['SharedMemory']]:
+    '''
+    Copy the out-of-band buffers of ``obj`` into a new shared memory segment; return the payload and the segment, which the caller must close and unlink (or pass on for unlinking).
+    '''
+    from multiprocessing.shared_memory import SharedMemory
+
+    buffers: tp.List['pickle.PickleBuffer'] = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    if not buffers:
+        return SharedMemoryPayload(data, None, ()), None
+
+    raws = [b.raw() for b in buffers]
+    spans = []
+    size = 0
+    for raw in raws:
+        size += -size % SHARED_MEMORY_ALIGN
+        spans.append((size, raw.nbytes))
+        size += raw.nbytes
+
+    # a segment cannot be of size zero
+    shm = SharedMemory(create=True, size=max(size, 1))
+    for (start, count), raw in zip(spans, raws):
+        shm.buf[start: start + count] = raw
+    return SharedMemoryPayload(data, shm.name, tuple(spans)), shm
+
+
+def shared_memory_decode(
+        payload: SharedMemoryPayload,
+        *,
+        unlink: bool = False,
+        ) -> tp.Any:
+    '''
+    Restore the object described by ``payload``, copying its buffers out of the shared memory segment, which is then closed. If ``unlink`` is True, the segment's name is also removed.
+    '''
+    if payload.name is None:
+        return pickle.loads(payload.data)
+
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(payload.name)
+    try:
+        buffers = []
+        for start, count in payload.spans:
+            # release each view explicitly, as the segment cannot be closed while views are exported
+            with shm.buf[start: start + count] as view:
+                buffers.append(bytearray(view))
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+
+    return pickle.loads(payload.data, buffers=buffers)
+
+
+def shared_memory_release(shm: tp.Optional['SharedMemory']) -> None:
+    '''
+    Close and unlink a segment created by ``shared_memory_encode``.
+    '''
+    if shm is not None:
+        shm.close()
+        shm.unlink()
+
+
+def shared_memory_unlink(payload: SharedMemoryPayload) -> None:
+    '''
+    Unlink the segment described by ``payload`` without restoring the object.
+    '''
+    if payload.name is not None:
+        from multiprocessing.shared_memory import SharedMemory
+        shared_memory_release(SharedMemory(payload.name))
+
+
+def shared_memory_call(bundle: tp.Tuple[AnyCallable, SharedMemoryPayload]) -> SharedMemoryPayload:
+    '''
+    Called in a worker process: restore the argument from shared memory, call the function, and return the result in a new segment. The caller unlinks both segments.
+    '''
+    func, payload = bundle
+    post = func(shared_memory_decode(payload))
+    payload_post, shm = shared_memory_encode(post)
+    if shm is not None:
+        shm.close() # the name remains until unlinked by the caller
+    return payload_post
+
+
+def shared_memory_call_many(
+        bundle: tp.Tuple[AnyCallable, tp.Sequence[SharedMemoryPayload]],
+        ) -> tp.List[SharedMemoryPayload]:
+    '''
+    Called in a worker process: call ``shared_memory_call`` for each argument. If a call raises, the segments of results already returned are unlinked before raising.
+    '''
+    func, payloads = bundle
+    post: tp.List[SharedMemoryPayload] = []
+    try:
+        for payload in payloads:
+            post.append(shared_memory_call((func, payload)))
+    except BaseException:
+        for payload in post:
+            shared_memory_unlink(payload)
+        raise
+    return post
+
+
+class SharedMemoryFuture:
+    '''
+    Wrap a Future returning one SharedMemoryPayload per argument segment. Either ``results`` or ``release`` must be called to unlink all segments.
+    '''
+    __slots__ = ('_future', '_segments')
+
+    def __init__(self,
+            future: Future,
+            segments: tp.List[tp.Optional['SharedMemory']],
+            ) -> None:
+        self._future = future
+        self._segments = segments
+
+    def _release_segments(self) -> None:
+        while self._segments:
+            shared_memory_release(self._segments.pop())
+
+    def results(self) -> tp.List[tp.Any]:
+        '''
+        Wait on the Future and restore all results, unlinking all segments.
+        '''
+        try:
+            payloads = self._future.result()
+        finally:
+            self._release_segments()
+
+        post = []
+        try:
+            for payload in payloads:
+                post.append(shared_memory_decode(payload, unlink=True))
+        except BaseException:
+            for payload in payloads[len(post) + 1:]:
+                shared_memory_unlink(payload)
+            raise
+        return post
+
+    def result(self) -> tp.Any:
+        '''
+        Wait on the Future and restore its single result, unlinking all segments.
+        '''
+        return self.results()[0]
+
+    def release(self) -> None:
+        '''
+        Discard the results: cancel the Future if not yet running; otherwise, unlink all segments when it is done, without waiting.
+        '''
+        self._future.cancel()
+        # called immediately if already done
+        self._future.add_done_callback(self._discard)
+
+    def _discard(self, future: Future) -> None:
+        self._release_segments()
+        if not future.cancelled() and future.exception() is None:
+            for payload in future.result():
+                shared_memory_unlink(payload)
+
+
+def _shared_memory_submit_many(
+        executor: Executor,
+        func: AnyCallable,
+        args_many: tp.Iterable[tp.Any],
+        ) -> SharedMemoryFuture:
+    segments: tp.List[tp.Optional['SharedMemory']] = []
+    payloads = []
+    try:
+        for args in args_many:
+            payload, shm = shared_memory_encode(args)
+            segments.append(shm)
+            payloads.append(payload)
+        future = executor.submit(shared_memory_call_many, (func, payloads))
+    except BaseException:
+        for shm in segments:
+            shared_memory_release(shm)
+        raise
+    return SharedMemoryFuture(future, segments)
+
+
+def shared_memory_submit(
+        executor: Executor,
+        func: AnyCallable,
+        args: tp.Any,
+        ) -> SharedMemoryFuture:
+    '''
+    An alternative to ``executor.submit`` that sends the argument and result through shared memory.
+    '''
+    shared_memory_validate()
+    return _shared_memory_submit_many(executor, func, (args,))
+
+
+def shared_memory_map(
+        executor: Executor,
+        func: AnyCallable,
+        iterable: tp.Iterable[tp.Any],
+        *,
+        chunksize: int = 1,
+        ) -> tp.Iterator[tp.Any]:
+    '''
+    An alternative to ``executor.map`` that sends arguments and results through shared memory. As with ``executor.map``, ``iterable`` is consumed, and all calls submitted in chunks of ``chunksize``, when called. Segments are unlinked as soon as each chunk of results is received; if the returned iterator raises or is closed before being exhausted, remaining calls are cancelled and their segments unlinked.
+    '''
+    shared_memory_validate()
+
+    futures: tp.Deque[SharedMemoryFuture] = deque()
+    iterator = iter(iterable)
+    try:
+        while True:
+            chunk = list(islice(iterator, chunksize))
+            if not chunk:
+                break
+            futures.append(_shared_memory_submit_many(executor, func, chunk))
+    except BaseException:
+        for future in futures:
+            future.release()
+        raise
+
+    def gen_results() -> tp.Iterator[tp.Any]:
+        try:
+            while futures:
+                yield from futures.popleft().results()
+        finally:
+            while futures:
+                futures.popleft().release()
+
+    return gen_results()
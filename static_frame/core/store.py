@@ -2,6 +2,7 @@
 
 import typing as tp
 import os
+import json
 
 from itertools import chain
 from functools import partial
@@ -10,12 +11,14 @@ import numpy as np
 
 from static_frame.core.interface_meta import InterfaceMeta
 
+from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorInitStore
 from static_frame.core.exception import ErrorInitStoreConfig
 from static_frame.core.exception import StoreFileMutation
 from static_frame.core.exception import StoreParameterConflict
 
 from static_frame.core.frame import Frame
+from static_frame.core.index_base import IndexBase
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import DtypesSpecifier
 from static_frame.core.util import path_filter
@@ -25,6 +28,32 @@ from static_frame.core.util import DepthLevelSpecifier
 
 #-------------------------------------------------------------------------------
 
+RowsWhere = tp.Iterable[tp.Tuple[str, str, tp.Any]]
+ROWS_WHERE_OPERATORS = frozenset(('==', '!=', '<', '<=', '>', '>='))
+
+def rows_where_filter(
+        rows_where: tp.Optional[RowsWhere],
+        ) -> tp.Optional[tp.Tuple[tp.Tuple[str, str, tp.Any], ...]]:
+    '''
+    Validate a ``rows_where`` specifier, returning a hashable tuple of triples, or None if no conditions are given.
+    '''
+    if not rows_where:
+        return None
+    post = []
+    for condition in rows_where:
+        if len(condition) != 3:
+            raise ErrorInitStoreConfig(f'rows_where conditions must be (field name, operator, value) triples, not {condition!r}')
+        field, op, value = condition
+        if not isinstance(field, str):
+            raise ErrorInitStoreConfig(f'rows_where field names must be strings, not {field!r}')
+        if op not in ROWS_WHERE_OPERATORS:
+            raise ErrorInitStoreConfig(f'unsupported rows_where operator {op!r}; use one of {sorted(ROWS_WHERE_OPERATORS)}')
+        if isinstance(value, np.generic):
+            value = value.item()
+        post.append((field, op, value))
+    return tuple(post)
+
+
 class StoreConfigHE(metaclass=InterfaceMeta):
     '''
     A read-only, hashable container used by :obj:`Store` subclasses for reading from and writing to multi-table storage formats.
@@ -40,6 +69,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
     skip_header: int
     skip_footer: int
     trim_nadir: bool
+    rows_where: tp.Optional[RowsWhere]
     include_index: bool
     include_index_name: bool
     include_columns: bool
@@ -47,8 +77,10 @@ class StoreConfigHE(metaclass=InterfaceMeta):
     merge_hierarchical_labels: bool
     read_max_workers: tp.Optional[int]
     read_chunksize: int
+    read_use_threads: bool
     write_max_workers: tp.Optional[int]
     write_chunksize: int
+    write_manifest: bool
     _hash: tp.Optional[int]
 
     __slots__ = (
@@ -62,6 +94,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             'skip_header',
             'skip_footer',
             'trim_nadir',
+            'rows_where',
             'include_index',
             'include_index_name',
             'include_columns',
@@ -69,8 +102,10 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             'merge_hierarchical_labels',
             'read_max_workers',
             'read_chunksize',
+            'read_use_threads',
             'write_max_workers',
             'write_chunksize',
+            'write_manifest',
             '_hash'
             )
 
@@ -87,6 +122,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             skip_header: int = 0,
             skip_footer: int = 0,
             trim_nadir: bool = False,
+            rows_where: tp.Optional[RowsWhere] = None,
             # exporters
             include_index: bool = True,
             include_index_name: bool = True,
@@ -97,13 +133,19 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             # multiprocessing configuration
             read_max_workers: tp.Optional[int] = None,
             read_chunksize: int = 1,
+            read_use_threads: bool = False,
             write_max_workers: tp.Optional[int] = None,
             write_chunksize: int = 1,
+            # not used by all writers
+            write_manifest: bool = False,
             ):
         '''
         Args:
             include_index: Boolean to determine if the ``index`` is included in output.
             include_columns: Boolean to determine if the ``columns`` is included in output.
+            rows_where: An optional sequence of (field name, operator, value) triples, where the operator is one of ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``; Stores that support it read only rows for which all are True.
+            read_use_threads: If True, Stores that support it read with a pool of ``read_max_workers`` threads rather than processes, avoiding pickling Frames back to the caller.
+            write_manifest: If True, zip Stores write a manifest describing each Frame, permitting shapes and dtypes to be read without loading Frames. Archives with a manifest cannot be read by versions of static-frame prior to its introduction.
         '''
         # constructor
         self.index_depth = index_depth
@@ -116,6 +158,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
         self.skip_header = skip_header
         self.skip_footer = skip_footer
         self.trim_nadir = trim_nadir
+        self.rows_where = rows_where_filter(rows_where)
 
         # exporter
         self.include_index = include_index
@@ -128,8 +171,10 @@ class StoreConfigHE(metaclass=InterfaceMeta):
 
         self.read_max_workers = read_max_workers
         self.read_chunksize = read_chunksize
+        self.read_use_threads = read_use_threads
         self.write_max_workers = write_max_workers
         self.write_chunksize = write_chunksize
+        self.write_manifest = write_manifest
 
         self._hash = None
 
@@ -177,6 +222,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
                     self.skip_header, # int
                     self.skip_footer, # int
                     self.trim_nadir, # bool
+                    self.rows_where, # Optional[Tuple[Tuple[str, str, Any], ...]]
                     self.include_index, # bool
                     self.include_index_name, # bool
                     self.include_columns, # bool
@@ -184,8 +230,10 @@ class StoreConfigHE(metaclass=InterfaceMeta):
                     self.merge_hierarchical_labels, # bool
                     self.read_max_workers, # Optional[int]
                     self.read_chunksize, # int
+                    self.read_use_threads, # bool
                     self.write_max_workers, # Optional[int]
                     self.write_chunksize, # int
+                    self.write_manifest, # bool
             ))
         return self._hash
 
@@ -230,6 +278,7 @@ class StoreConfig(StoreConfigHE):
             skip_header: int = 0,
             skip_footer: int = 0,
             trim_nadir: bool = False,
+            rows_where: tp.Optional[RowsWhere] = None,
             include_index: bool = True,
             include_index_name: bool = True,
             include_columns: bool = True,
@@ -239,8 +288,10 @@ class StoreConfig(StoreConfigHE):
             label_decoder: tp.Optional[tp.Callable[[str], tp.Hashable]] = None,
             read_max_workers: tp.Optional[int] = None,
             read_chunksize: int = 1,
+            read_use_threads: bool = False,
             write_max_workers: tp.Optional[int] = None,
             write_chunksize: int = 1,
+            write_manifest: bool = False,
             ):
         StoreConfigHE.__init__(self,
                 index_depth=index_depth,
@@ -253,6 +304,7 @@ class StoreConfig(StoreConfigHE):
                 skip_header=skip_header,
                 skip_footer=skip_footer,
                 trim_nadir=trim_nadir,
+                rows_where=rows_where,
                 include_index=include_index,
                 include_index_name=include_index_name,
                 include_columns=include_columns,
@@ -260,8 +312,10 @@ class StoreConfig(StoreConfigHE):
                 merge_hierarchical_labels=merge_hierarchical_labels,
                 read_max_workers=read_max_workers,
                 read_chunksize=read_chunksize,
+                read_use_threads=read_use_threads,
                 write_max_workers=write_max_workers,
                 write_chunksize=write_chunksize,
+                write_manifest=write_manifest,
         )
         # NOTE: if only encode is provide, should we raise?
         self.label_encoder = label_encoder
@@ -322,8 +376,10 @@ class StoreConfigMap:
             'label_decoder',
             'read_max_workers',
             'read_chunksize',
+            'read_use_threads',
             'write_max_workers',
             'write_chunksize',
+            'write_manifest',
     )
 
     @classmethod
@@ -393,6 +449,93 @@ class StoreConfigMap:
         return self._default
 
 
+#-------------------------------------------------------------------------------
+
+class StoreManifest(tp.NamedTuple):
+    '''
+    A description of a Frame as written to a Store. The depths are those of the stored index and columns, as needed to read the Frame. ``dtypes`` pairs column labels with dtypes, and is None if column labels cannot be encoded as JSON or if dtypes may change in reading; ``nbytes`` is similarly None if it may change in reading.
+    '''
+    shape: tp.Tuple[int, int]
+    dtypes: tp.Optional[tp.Tuple[tp.Tuple[tp.Hashable, np.dtype], ...]]
+    index_depth: int
+    columns_depth: int
+    nbytes: tp.Optional[int]
+    digest: str
+
+    @classmethod
+    def from_frame(cls,
+            frame: Frame,
+            *,
+            include_index: bool = True,
+            include_columns: bool = True,
+            digest: str = '',
+            ) -> 'StoreManifest':
+        return cls(
+                shape=frame.shape,
+                dtypes=tuple(zip(frame.columns, frame._blocks.dtypes)),
+                index_depth=frame.index.depth if include_index else 0,
+                columns_depth=frame.columns.depth if include_columns else 0,
+                nbytes=frame.nbytes,
+                digest=digest,
+                )
+
+
+def _manifest_label_to_json(label: tp.Hashable) -> tp.Any:
+    if isinstance(label, tuple):
+        return [_manifest_label_to_json(v) for v in label]
+    if isinstance(label, np.generic):
+        return label.item()
+    return label
+
+def _manifest_label_from_json(value: tp.Any) -> tp.Hashable:
+    # JSON returns tuples as lists; as labels are hashable, all lists were tuples
+    if value.__class__ is list:
+        return tuple(_manifest_label_from_json(v) for v in value)
+    return value #type: ignore
+
+def manifest_to_json(manifest: tp.Dict[str, StoreManifest]) -> str:
+    '''
+    Encode a mapping of encoded label to :obj:`StoreManifest` as JSON, preserving order.
+    '''
+    post = {}
+    for label, m in manifest.items():
+        dtypes: tp.Optional[tp.List[tp.Any]]
+        try:
+            # only native labels survive a round trip; others are not recorded
+            dtypes = json.loads(json.dumps([
+                    [_manifest_label_to_json(c), dt.str]
+                    for c, dt in m.dtypes])) #type: ignore
+        except (TypeError, ValueError):
+            dtypes = None
+        post[label] = {
+                'shape': m.shape,
+                'dtypes': dtypes,
+                'index_depth': m.index_depth,
+                'columns_depth': m.columns_depth,
+                'nbytes': m.nbytes,
+                'digest': m.digest,
+                }
+    return json.dumps(post)
+
+def manifest_from_json(src: str) -> tp.Dict[str, StoreManifest]:
+    '''
+    Decode a mapping of encoded label to :obj:`StoreManifest` written by ``manifest_to_json``.
+    '''
+    post = {}
+    for label, m in json.loads(src).items():
+        dtypes = m['dtypes']
+        post[label] = StoreManifest(
+                shape=tuple(m['shape']), #type: ignore
+                dtypes=None if dtypes is None else tuple(
+                        (_manifest_label_from_json(c), np.dtype(dt)) for c, dt in dtypes),
+                index_depth=m['index_depth'],
+                columns_depth=m['columns_depth'],
+                nbytes=m['nbytes'],
+                digest=m['digest'],
+                )
+    return post
+
+
 #-------------------------------------------------------------------------------
 # decorators
 
@@ -423,10 +566,13 @@ def store_coherent_write(f: AnyCallable) -> AnyCallable:
 class Store:
 
     _EXT: tp.FrozenSet[str]
+    # if False, reads must not be made from a thread other than the caller's, and Bus prefetching is not used
+    _THREAD_SAFE: bool = True
 
     __slots__ = (
             '_fp',
-            '_last_modified'
+            '_last_modified',
+            '_manifest',
             )
 
     def __init__(self, fp: PathSpecifier):
@@ -442,6 +588,8 @@ class Store:
         self._mtime_update()
 
     def _mtime_update(self) -> None:
+        # a manifest read from a previous version of the file is discarded
+        self._manifest: tp.Optional[tp.Dict[str, StoreManifest]] = None
         if os.path.exists(self._fp):
             self._last_modified = os.path.getmtime(self._fp)
         else:
@@ -590,6 +738,44 @@ class Store:
         '''
         return next(self.read_many((label,), config=config, container_type=container_type))
 
+    def manifest(self, *,
+            config: StoreConfigMapInitializer = None,
+            ) -> tp.Optional[tp.Dict[tp.Hashable, StoreManifest]]:
+        '''Return a mapping of label to :obj:`StoreManifest` for Frames whose description, as written, is valid for Frames read with ``config``; return None if the Store has no manifest.
+        '''
+        return None
+
+    def read_labels_many(self,
+            labels: tp.Iterable[tp.Hashable],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[Frame] = Frame,
+            ) -> tp.Iterator[tp.Tuple[IndexBase, IndexBase]]:
+        '''Read the index and columns of many Frame, given by `labels`, from the Store, as they would be found on Frames returned by ``read_many``. Return an iterator of pairs of index, columns. Stores that can read labels without reading values override this method; otherwise, Frames are fully read.
+        '''
+        for frame in self.read_many(labels, config=config, container_type=container_type):
+            yield frame.index, frame.columns
+
+    @store_coherent_non_write
+    def read_labels(self,
+            label: tp.Hashable,
+            *,
+            config: tp.Optional[StoreConfig] = None,
+            axis: int = 0,
+            container_type: tp.Type[Frame] = Frame,
+            ) -> IndexBase:
+        '''Read the index (``axis`` 0) or columns (``axis`` 1) of a single Frame, given by `label`, from the Store. This is a convenience method using ``read_labels_many``.
+        '''
+        index, columns = next(self.read_labels_many((label,),
+                config=config,
+                container_type=container_type,
+                ))
+        if axis == 0:
+            return index
+        if axis == 1:
+            return columns
+        raise AxisInvalid(f'invalid axis {axis}')
+
     def write(self,
             items: tp.Iterable[tp.Tuple[str, Frame]],
             *,
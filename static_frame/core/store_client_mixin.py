@@ -8,6 +8,7 @@ from static_frame.core.store_hdf5 import StoreHDF5
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
 from static_frame.core.store_zip import StoreZipCSV
+from static_frame.core.store_zip import StoreZipNPY
 from static_frame.core.store_zip import StoreZipParquet
 from static_frame.core.store_zip import StoreZipPickle
 from static_frame.core.store_zip import StoreZipTSV
@@ -79,6 +80,20 @@ class StoreClientMixin:
         # config must be None for pickels, will raise otherwise
         store.write(self._items_store(), config=config)
 
+    @doc_inject(selector='store_client_exporter')
+    def to_zip_npy(self,
+            fp: PathSpecifier,
+            *,
+            config: StoreConfigMapInitializer = None
+            ) -> None:
+        '''
+        Write the complete :obj:`Bus` as a zipped archive of NPY files.
+
+        {args}
+        '''
+        store = StoreZipNPY(fp)
+        store.write(self._items_store(), config=config)
+
     @doc_inject(selector='store_client_exporter')
     def to_zip_parquet(self,
             fp: PathSpecifier,
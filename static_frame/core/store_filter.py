@@ -5,7 +5,9 @@ import numpy as np
 
 from static_frame.core.interface_meta import InterfaceMeta
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_COMPLEX_DEFAULT
 from static_frame.core.util import DTYPE_COMPLEX_KIND
+from static_frame.core.util import DTYPE_DATETIME_KIND
 from static_frame.core.util import DTYPE_INT_KINDS
 from static_frame.core.util import DTYPE_INEXACT_KINDS
 from static_frame.core.util import DTYPE_NAT_KINDS
@@ -16,6 +18,7 @@ from static_frame.core.util import FLOAT_TYPES
 from static_frame.core.util import COMPLEX_TYPES
 from static_frame.core.util import EMPTY_TUPLE
 from static_frame.core.util import DTYPE_OBJECT_KIND
+from static_frame.core.util import DTYPE_FLOAT_DEFAULT
 from static_frame.core.util import DTYPE_FLOAT_KIND
 from static_frame.core.util import NAT
 from static_frame.core.util import NAT_STR
@@ -381,3 +384,53 @@ STORE_FILTER_DISABLE = StoreFilter(
             to_posinf=EMPTY_SET,
             to_neginf=EMPTY_SET,
             )
+
+
+def array_to_str_list(
+        array: np.ndarray,
+        store_filter: tp.Optional[StoreFilter],
+        ) -> tp.List[str]:
+    '''
+    Convert a 1D array to a list of strings, identical to formatting each element as ``f'{store_filter.from_type_filter_element(e)}'`` (or ``f'{e}'`` if ``store_filter`` is None). All dtypes but object and bytes are formatted in bulk.
+    '''
+    kind = array.dtype.kind
+    if (kind == DTYPE_OBJECT_KIND
+            or kind == 'S' # bytes are formatted with a prefix
+            or (store_filter is not None
+            and store_filter._value_format_active #pylint: disable=W0212
+            and kind in DTYPE_INEXACT_KINDS)
+            ):
+        if store_filter is None:
+            return [f'{e}' for e in array]
+        func = store_filter.from_type_filter_element
+        return [f'{func(e)}' for e in array]
+
+    # formatting a NumPy float or complex scalar converts it to a Python float or complex
+    if kind == DTYPE_FLOAT_KIND and array.dtype != DTYPE_FLOAT_DEFAULT:
+        array = array.astype(DTYPE_FLOAT_DEFAULT)
+    elif kind == DTYPE_COMPLEX_KIND and array.dtype != DTYPE_COMPLEX_DEFAULT:
+        array = array.astype(DTYPE_COMPLEX_DEFAULT)
+
+    post = array.astype(str)
+    if store_filter is None:
+        return post.tolist() #type: ignore
+
+    replacements: tp.List[tp.Tuple[np.ndarray, str]] = []
+    if kind in DTYPE_INEXACT_KINDS:
+        for func, value_replace in store_filter._FLOAT_FUNC_TO_FROM: #pylint: disable=W0212
+            if value_replace is None:
+                continue
+            # cannot use these ufuncs on complex array
+            if kind == DTYPE_COMPLEX_KIND and (func == np.isposinf or func == np.isneginf):
+                continue
+            replacements.append((func(array), value_replace))
+    elif kind == DTYPE_DATETIME_KIND and store_filter.from_nat is not None:
+        replacements.append((np.isnat(array), store_filter.from_nat))
+
+    for found, value_replace in replacements:
+        if found.any():
+            if post.dtype != DTYPE_OBJECT:
+                # replacements may be longer than the str dtype
+                post = post.astype(DTYPE_OBJECT)
+            post[found] = f'{value_replace}'
+    return post.tolist() #type: ignore
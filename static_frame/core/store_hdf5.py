@@ -4,7 +4,9 @@ import warnings
 import numpy as np
 
 # from static_frame.core.doc_str import doc_inject
+from static_frame.core.exception import ErrorInitFrame
 from static_frame.core.frame import Frame
+from static_frame.core.index_base import IndexBase
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
 from static_frame.core.store import store_coherent_write
@@ -17,6 +19,8 @@ from static_frame.core.util import DTYPE_STR_KINDS
 class StoreHDF5(Store):
 
     _EXT: tp.FrozenSet[str] =  frozenset(('.h5', '.hdf5'))
+    # PyTables does not support access from multiple threads
+    _THREAD_SAFE = False
 
     @store_coherent_write
     def write(self,
@@ -65,6 +69,65 @@ class StoreHDF5(Store):
                 table.append(tuple(values()))
                 table.flush()
 
+    @staticmethod
+    def _colnames_select(
+            colnames: tp.Sequence[str],
+            index_depth: int,
+            columns_select: tp.Optional[tp.Iterable[str]],
+            ) -> tp.Sequence[str]:
+        '''
+        Return the names of the index columns followed by those of the columns to read; if ``columns_select`` is given, only those columns are read, in that order.
+        '''
+        if not columns_select:
+            return colnames
+        columns_select = list(columns_select)
+        missing = set(columns_select) - set(colnames[index_depth:])
+        if missing:
+            raise ErrorInitFrame(f'cannot load all columns in columns_select: missing {missing}')
+        return list(colnames[:index_depth]) + columns_select
+
+    @staticmethod
+    def _rows_where_coordinates(
+            table: tp.Any,
+            rows_where: tp.Optional[tp.Tuple[tp.Tuple[str, str, tp.Any], ...]],
+            ) -> tp.Optional[np.ndarray]:
+        '''
+        Return the coordinates of rows of ``table`` for which all conditions are True, or None if there are no conditions. Conditions are evaluated by PyTables in chunks, without reading the table.
+        '''
+        if not rows_where:
+            return None
+        conditions = []
+        condvars = {}
+        for i, (field, op, value) in enumerate(rows_where):
+            if field not in table.colpathnames:
+                raise ErrorInitFrame(f'rows_where field {field!r} is not a column of table {table.name}')
+            column = table.cols._f_col(field)
+            if column.dtype.kind == 'S' and isinstance(value, str):
+                value = value.encode() # strings are stored as bytes
+            condvars[f'c{i}'] = column
+            condvars[f'v{i}'] = value
+            conditions.append(f'(c{i} {op} v{i})')
+        return table.get_where_list(' & '.join(conditions), condvars=condvars) #type: ignore
+
+    @staticmethod
+    def _read_column(
+            table: tp.Any,
+            colname: str,
+            coordinates: tp.Optional[np.ndarray],
+            ) -> np.ndarray:
+        '''
+        Read the column ``colname``, limited to rows at ``coordinates`` if given.
+        '''
+        if coordinates is None:
+            # can also do: table.read(field=colname)
+            array = table.col(colname)
+        else:
+            array = table.read_coordinates(coordinates, field=colname)
+        if array.dtype.kind in DTYPE_STR_KINDS:
+            array = array.astype(str)
+        array.flags.writeable = False
+        return array #type: ignore
+
     @store_coherent_non_write
     def read_many(self,
             labels: tp.Iterable[tp.Hashable],
@@ -92,13 +155,12 @@ class StoreHDF5(Store):
                 table = file.get_node(f'/{label_encoded}')
                 colnames = table.cols._v_colnames
 
+                colnames = self._colnames_select(colnames, index_depth, c.columns_select)
+                coordinates = self._rows_where_coordinates(table, c.rows_where)
+
                 def blocks() -> tp.Iterator[np.ndarray]:
                     for col_idx, colname in enumerate(colnames):
-                        # can also do: table.read(field=colname)
-                        array = table.col(colname)
-                        if array.dtype.kind in DTYPE_STR_KINDS:
-                            array = array.astype(str)
-                        array.flags.writeable = False
+                        array = self._read_column(table, colname, coordinates)
 
                         if col_idx < index_depth:
                             index_arrays.append(array)
@@ -123,6 +185,55 @@ class StoreHDF5(Store):
                         name=label,
                         )
 
+    @store_coherent_non_write
+    def read_labels_many(self,
+            labels: tp.Iterable[tp.Hashable],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[Frame] = Frame,
+            ) -> tp.Iterator[tp.Tuple[IndexBase, IndexBase]]:
+        import tables
+        config_map = StoreConfigMap.from_initializer(config)
+
+        with tables.open_file(self._fp, mode='r') as file:
+            for label in labels:
+                c = config_map[label]
+                label_encoded = config_map.default.label_encode(label)
+
+                index_depth = c.index_depth
+                if c.dtypes:
+                    raise NotImplementedError('using config.dtypes on HDF5 not yet supported')
+
+                table = file.get_node(f'/{label_encoded}')
+                colnames = table.cols._v_colnames
+
+                # of values, only index columns are read
+                coordinates = self._rows_where_coordinates(table, c.rows_where)
+                index_arrays = [self._read_column(table, colname, coordinates)
+                        for colname in colnames[:index_depth]]
+                count = table.nrows if coordinates is None else len(coordinates)
+
+                # create Frame without values to use the same label construction as read_many
+                index = container_type._from_data_index_arrays_column_labels(
+                        data=TypeBlocks.from_blocks((), shape_reference=(count, 0)),
+                        index_depth=index_depth,
+                        index_arrays=index_arrays,
+                        columns_depth=0,
+                        columns_labels=(),
+                        name=label,
+                        ).index
+                columns_labels = self._colnames_select(colnames, index_depth, c.columns_select)[index_depth:]
+                columns = container_type._from_data_index_arrays_column_labels(
+                        data=TypeBlocks.from_blocks(np.empty((0, len(columns_labels)))),
+                        index_depth=0,
+                        index_arrays=(),
+                        columns_depth=c.columns_depth,
+                        columns_labels=columns_labels,
+                        name=label,
+                        ).columns
+
+                yield index, columns
+
     @store_coherent_non_write
     def labels(self, *,
             config: StoreConfigMapInitializer = None,
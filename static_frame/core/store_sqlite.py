@@ -7,7 +7,9 @@ import numpy as np
 
 
 # from static_frame.core.doc_str import doc_inject
+from static_frame.core.exception import ErrorInitFrame
 from static_frame.core.frame import Frame
+from static_frame.core.index_base import IndexBase
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
 from static_frame.core.store import store_coherent_write
@@ -137,6 +139,25 @@ class StoreSQLite(Store):
 
             conn.commit()
 
+    @staticmethod
+    def _rows_where_to_sql(
+            rows_where: tp.Optional[tp.Tuple[tp.Tuple[str, str, tp.Any], ...]],
+            field_names: tp.Sequence[str],
+            ) -> tp.Tuple[str, tp.Tuple[tp.Any, ...]]:
+        '''
+        Return a WHERE clause, with a placeholder for each value, and the values to bind.
+        '''
+        if not rows_where:
+            return '', ()
+        for field, _, _ in rows_where:
+            # SQLite reads a quoted identifier that is not a field name as a string literal
+            if field not in field_names:
+                raise ErrorInitFrame(f'rows_where field {field!r} is not a field of the table')
+        conditions = ' AND '.join(
+                '"{}" {} ?'.format(field.replace('"', '""'), op)
+                for field, op, _ in rows_where)
+        return f' WHERE {conditions}', tuple(value for _, _, value in rows_where)
+
     @store_coherent_non_write
     def read_many(self,
             labels: tp.Iterable[tp.Hashable],
@@ -161,9 +182,18 @@ class StoreSQLite(Store):
                     label_encoded = config_map.default.label_encode(label)
 
                 query = f'SELECT * from "{label_encoded}"'
+                parameters: tp.Tuple[tp.Any, ...] = ()
+                if c.rows_where:
+                    cursor = conn.execute(f'{query} LIMIT 0')
+                    field_names = [name for (name, *_) in cursor.description]
+                    cursor.close()
+                    where, parameters = self._rows_where_to_sql(c.rows_where, field_names)
+                    # an index may be used for the conditions; ordering by rowid keeps the row order of a full read
+                    query += where + ' ORDER BY rowid'
 
                 yield tp.cast(Frame, container_type.from_sql(query=query,
                         connection=conn,
+                        parameters=parameters,
                         index_depth=c.index_depth,
                         columns_depth=c.columns_depth,
                         columns_select=c.columns_select,
@@ -172,6 +202,58 @@ class StoreSQLite(Store):
                         consolidate_blocks=c.consolidate_blocks
                         ))
 
+    @store_coherent_non_write
+    def read_labels_many(self,
+            labels: tp.Iterable[tp.Hashable],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[Frame] = Frame,
+            ) -> tp.Iterator[tp.Tuple[IndexBase, IndexBase]]:
+
+        config_map = StoreConfigMap.from_initializer(config)
+        sqlite3.register_converter('BOOLEAN', lambda x: x == self._BYTES_ONE)
+
+        with sqlite3.connect(self._fp,
+                detect_types=sqlite3.PARSE_DECLTYPES
+                ) as conn:
+
+            for label in labels:
+                c = config_map[label]
+
+                if label is STORE_LABEL_DEFAULT:
+                    label_encoded = 'None'
+                else:
+                    label_encoded = config_map.default.label_encode(label)
+
+                # columns are found from the field names of an empty query
+                columns = container_type.from_sql(
+                        query=f'SELECT * from "{label_encoded}" LIMIT 0',
+                        connection=conn,
+                        index_depth=c.index_depth,
+                        columns_depth=c.columns_depth,
+                        columns_select=c.columns_select,
+                        dtypes=c.dtypes,
+                        ).columns
+
+                # of values, only index fields are read; a constant field is selected as a Frame needs at least one column; ordering by rowid keeps the row order of a full read, rather than that of the primary key
+                cursor = conn.execute(f'SELECT * from "{label_encoded}" LIMIT 0')
+                field_names = [name for (name, *_) in cursor.description]
+                cursor.close()
+                fields = [f'"{name}"' for name in field_names[:c.index_depth]]
+                fields.append('0')
+
+                where, parameters = self._rows_where_to_sql(c.rows_where, field_names)
+                index = container_type.from_sql(
+                        query=f'SELECT {", ".join(fields)} from "{label_encoded}"{where} ORDER BY rowid',
+                        connection=conn,
+                        parameters=parameters,
+                        index_depth=c.index_depth,
+                        columns_depth=0,
+                        dtypes=c.dtypes,
+                        ).index
+
+                yield index, columns
+
     @store_coherent_non_write
     def labels(self, *,
             config: StoreConfigMapInitializer = None,
@@ -1,11 +1,31 @@
+import contextlib
+import os
 import typing as tp
 import zipfile
 import pickle
+import hashlib
+import threading
+import mmap
+import struct
 from io import StringIO
 from io import BytesIO
+from collections import deque
+from concurrent.futures import Future
 from concurrent.futures import ProcessPoolExecutor
-
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from static_frame.core.archive_npy import NPY_HEADER
+from static_frame.core.archive_npy import ArrayReader
+from static_frame.core.archive_npy import frame_from_npy
+from static_frame.core.archive_npy import frame_labels_from_npy
+from static_frame.core.archive_npy import frame_to_npy
+from static_frame.core.archive_npy import npy_array_from_buffer
+from static_frame.core.archive_npy import npy_array_to_bytes
+from static_frame.core.exception import ErrorInitFrame
 from static_frame.core.frame import Frame
+from static_frame.core.index_base import IndexBase
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
 from static_frame.core.store import store_coherent_write
@@ -13,7 +33,12 @@ from static_frame.core.store import StoreConfigMap
 from static_frame.core.store import StoreConfig
 from static_frame.core.store import StoreConfigHE
 from static_frame.core.store import StoreConfigMapInitializer
+from static_frame.core.store import StoreManifest
+from static_frame.core.store import manifest_from_json
+from static_frame.core.store import manifest_to_json
 from static_frame.core.util import AnyCallable
+from static_frame.core.util import mmap_close
+from static_frame.core.util import path_replace_manager
 from static_frame.core.container_util import container_to_exporter_attr
 
 
@@ -24,6 +49,9 @@ from static_frame.core.container_util import container_to_exporter_attr
 FrameExporter = AnyCallable # Protocol not supported yet...
 FrameConstructor = tp.Callable[[tp.Any], Frame]
 LabelAndBytes = tp.Tuple[tp.Hashable, tp.Union[str, bytes]]
+MemberReader = tp.Callable[[zipfile.ZipFile, str], tp.Union[bytes, memoryview]]
+
+ZIP_MANIFEST = '__manifest__.json'
 
 class PayloadBytesToFrame(tp.NamedTuple):
     '''
@@ -49,6 +77,13 @@ class _StoreZip(Store):
     _EXT: tp.FrozenSet[str] = frozenset(('.zip',))
     _EXT_CONTAINED: str = ''
     _EXPORTER: AnyCallable
+    # if Frames are read exactly as written, independent of config, all fields of the manifest are valid
+    _MANIFEST_EXACT: bool = False
+    _COMPRESSION: int = zipfile.ZIP_DEFLATED
+
+    # ZIP local file headers are 30 bytes followed by the file name and extra field; the lengths of each are stored at these offsets
+    _LOCAL_HEADER_SIZE = 30
+    _LOCAL_HEADER_NAME_LENGTH = 26
 
     @classmethod
     def _container_type_to_constructor(cls, container_type: tp.Type[Frame]) -> FrameConstructor:
@@ -77,6 +112,67 @@ class _StoreZip(Store):
                 constructor=payload.constructor,
         )
 
+    @classmethod
+    def _member_offset(cls,
+            buffer: mmap.mmap,
+            info: zipfile.ZipInfo,
+            ) -> int:
+        '''
+        Return the offset of the data of the member described by ``info``; as the extra field of the local header can differ from that in the central directory, both lengths are read from the local header.
+        '''
+        start = info.header_offset + cls._LOCAL_HEADER_NAME_LENGTH
+        name_size, extra_size = struct.unpack('<HH', buffer[start: start + 4])
+        return info.header_offset + cls._LOCAL_HEADER_SIZE + name_size + extra_size
+
+    @contextlib.contextmanager
+    def _member_reader(self) -> tp.Iterator[MemberReader]:
+        '''
+        Provide a function that returns the data of a member, given a ZipFile of this Store and the member name. Stores that can read part of a member return a view of it without reading it; resources for such views are held for the life of the context.
+        '''
+        yield lambda zf, name: zf.read(name)
+
+    def _manifest_read(self,
+            zf: zipfile.ZipFile,
+            ) -> tp.Optional[tp.Dict[str, StoreManifest]]:
+        '''
+        Return the manifest, keyed by encoded label, or None if the archive was written without one. The manifest is read once per version of the file.
+        '''
+        if self._manifest is None and ZIP_MANIFEST in zf.NameToInfo:
+            self._manifest = manifest_from_json(zf.read(ZIP_MANIFEST).decode())
+        return self._manifest
+
+    def _manifest_write(self,
+            zf: zipfile.ZipFile,
+            manifest: tp.Dict[str, StoreManifest],
+            ) -> None:
+        zf.writestr(ZIP_MANIFEST, manifest_to_json(manifest))
+
+    @store_coherent_non_write
+    def manifest(self, *,
+            config: StoreConfigMapInitializer = None,
+            ) -> tp.Optional[tp.Dict[tp.Hashable, StoreManifest]]:
+
+        config_map = StoreConfigMap.from_initializer(config)
+
+        with zipfile.ZipFile(self._fp) as zf:
+            manifest = self._manifest_read(zf)
+        if manifest is None:
+            return None
+
+        post = {}
+        for name, m in manifest.items():
+            label = config_map.default.label_decode(name)
+            if not self._MANIFEST_EXACT:
+                c = config_map[label]
+                if (c.index_depth != m.index_depth
+                        or c.columns_depth != m.columns_depth
+                        or c.columns_select):
+                    continue
+                # the shape is as written, but dtypes (and thus nbytes) may change in reading
+                m = m._replace(dtypes=None, nbytes=None)
+            post[label] = m
+        return post
+
     @store_coherent_non_write
     def labels(self, *,
             config: StoreConfigMapInitializer = None,
@@ -86,12 +182,25 @@ class _StoreZip(Store):
         config_map = StoreConfigMap.from_initializer(config)
 
         with zipfile.ZipFile(self._fp) as zf:
-            for name in zf.namelist():
-                if strip_ext:
-                    name = name.replace(self._EXT_CONTAINED, '')
+            manifest = self._manifest_read(zf)
+            if manifest is not None:
+                names: tp.Iterable[str] = (name if strip_ext else name + self._EXT_CONTAINED
+                        for name in manifest)
+            else:
+                names = self._labels_from_names(zf.namelist(), strip_ext)
+            for name in names:
                 # always use default decoder
                 yield config_map.default.label_decode(name)
 
+    def _labels_from_names(self,
+            names: tp.Iterable[str],
+            strip_ext: bool,
+            ) -> tp.Iterator[str]:
+        for name in names:
+            if strip_ext:
+                name = name.replace(self._EXT_CONTAINED, '')
+            yield name
+
     @store_coherent_non_write
     def read_many(self,
             labels: tp.Iterable[tp.Hashable],
@@ -101,27 +210,32 @@ class _StoreZip(Store):
             ) -> tp.Iterator[Frame]:
 
         config_map = StoreConfigMap.from_initializer(config)
-        multiprocess: bool = config_map.default.read_max_workers is not None
         constructor: FrameConstructor = self._container_type_to_constructor(container_type)
 
+        if config_map.default.read_use_threads:
+            yield from self._read_many_threads(labels, config_map, constructor)
+            return
+
+        multiprocess: bool = config_map.default.read_max_workers is not None
+
         def gen() -> tp.Iterable[tp.Union[PayloadBytesToFrame, Frame]]:
-            with zipfile.ZipFile(self._fp) as zf:
+            with zipfile.ZipFile(self._fp) as zf, self._member_reader() as read_member:
                 for label in labels:
                     c: StoreConfig = config_map[label]
 
                     label_encoded: str = config_map.default.label_encode(label)
-                    src: bytes = zf.read(label_encoded + self._EXT_CONTAINED)
+                    name = label_encoded + self._EXT_CONTAINED
 
                     if multiprocess:
                         yield PayloadBytesToFrame( # pylint: disable=no-value-for-parameter
-                                src=src,
+                                src=bytes(read_member(zf, name)),
                                 name=label,
                                 config=c.to_store_config_he(),
                                 constructor=constructor,
                         )
                     else:
                         yield self._build_frame(
-                                src=src,
+                                src=read_member(zf, name),
                                 name=label,
                                 config=c,
                                 constructor=constructor,
@@ -135,6 +249,54 @@ class _StoreZip(Store):
         else:
             yield from gen() # type: ignore
 
+    def _read_many_threads(self,
+            labels: tp.Iterable[tp.Hashable],
+            config_map: StoreConfigMap,
+            constructor: FrameConstructor,
+            ) -> tp.Iterator[Frame]:
+        '''
+        Read and build each Frame in a pool of threads; decompression and most parsing release the GIL, and Frames are returned without pickling. As a ZipFile cannot be read concurrently, each thread opens its own.
+        '''
+        local = threading.local()
+        zip_files: tp.List[zipfile.ZipFile] = []
+        read_member: MemberReader
+
+        def read(label: tp.Hashable) -> Frame:
+            zf = getattr(local, 'zf', None)
+            if zf is None:
+                zf = local.zf = zipfile.ZipFile(self._fp)
+                zip_files.append(zf)
+            label_encoded: str = config_map.default.label_encode(label)
+            return self._build_frame(
+                    src=read_member(zf, label_encoded + self._EXT_CONTAINED),
+                    name=label,
+                    config=config_map[label],
+                    constructor=constructor,
+                    )
+
+        max_workers = config_map.default.read_max_workers
+        # reads are submitted no more than twice the number of workers ahead of the consumer, such that abandoning iteration does not wait on reading all labels
+        window = 2 * (max_workers or os.cpu_count() or 1)
+        futures: tp.Deque['Future[Frame]'] = deque()
+
+        try:
+            with self._member_reader() as read_member, \
+                    ThreadPoolExecutor(max_workers=max_workers) as executor:
+                try:
+                    for label in labels:
+                        futures.append(executor.submit(read, label))
+                        if len(futures) >= window:
+                            yield futures.popleft().result()
+                    while futures:
+                        yield futures.popleft().result()
+                finally:
+                    # only reads already started are waited on when the executor shuts down
+                    for future in futures:
+                        future.cancel()
+        finally:
+            for zf in zip_files:
+                zf.close()
+
     # --------------------------------------------------------------------------
 
     @staticmethod
@@ -150,12 +312,21 @@ class _StoreZip(Store):
         config_map = StoreConfigMap.from_initializer(config)
         multiprocess = (config_map.default.write_max_workers is not None and
                         config_map.default.write_max_workers > 1)
+        write_manifest = config_map.default.write_manifest
+
+        manifest: tp.Dict[tp.Hashable, StoreManifest] = {}
 
         def gen() -> tp.Iterable[PayloadFrameToBytes]:
             for label, frame in items:
+                c = config_map[label]
+                if write_manifest:
+                    manifest[label] = StoreManifest.from_frame(frame,
+                            include_index=c.include_index or self._MANIFEST_EXACT,
+                            include_columns=c.include_columns or self._MANIFEST_EXACT,
+                            )
                 yield PayloadFrameToBytes( # pylint: disable=no-value-for-parameter
                         name=label,
-                        config=config_map[label].to_store_config_he(),
+                        config=c.to_store_config_he(),
                         frame=frame,
                         exporter=self.__class__._EXPORTER,
                         )
@@ -169,11 +340,21 @@ class _StoreZip(Store):
         else:
             label_and_bytes = lambda: (self._payload_to_bytes(x) for x in gen())
 
-        with zipfile.ZipFile(self._fp, 'w', zipfile.ZIP_DEFLATED) as zf:
+        manifest_encoded = {}
+        # the archive is replaced, not overwritten, as Frames read from it may view its memory map
+        with path_replace_manager(self._fp) as fp_temp, \
+                zipfile.ZipFile(fp_temp, 'w', self._COMPRESSION) as zf:
             for label, frame_bytes in label_and_bytes():
                 label_encoded = config_map.default.label_encode(label)
                 # this will write it without a container
                 zf.writestr(label_encoded + self._EXT_CONTAINED, frame_bytes)
+                if write_manifest:
+                    if isinstance(frame_bytes, str):
+                        frame_bytes = frame_bytes.encode('utf-8')
+                    manifest_encoded[label_encoded] = manifest[label]._replace(
+                            digest=hashlib.sha256(frame_bytes).hexdigest())
+            if write_manifest:
+                self._manifest_write(zf, manifest_encoded)
 
 
 class _StoreZipDelimited(_StoreZip):
@@ -243,6 +424,7 @@ class StoreZipPickle(_StoreZip):
     '''
     _EXT_CONTAINED = '.pickle'
     _EXPORTER = pickle.dumps
+    _MANIFEST_EXACT = True
 
     @classmethod
     def _container_type_to_constructor(cls, container_type: tp.Type[Frame]) -> FrameConstructor:
@@ -289,20 +471,44 @@ class StoreZipParquet(_StoreZip):
     '''
     _EXT_CONTAINED = '.parquet'
     _EXPORTER = Frame.to_parquet
+    # parquet files are compressed by column; storing them uncompressed permits reading only selected columns
+    _COMPRESSION = zipfile.ZIP_STORED
 
     @classmethod
     def _container_type_to_constructor(cls, container_type: tp.Type[Frame]) -> FrameConstructor:
         return container_type.from_parquet
 
+    @contextlib.contextmanager
+    def _member_reader(self) -> tp.Iterator[MemberReader]:
+        # one memory map is used for all members read; a view of it is read only where parquet column chunks are decoded
+        with open(self._fp, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(buffer)
+
+        def read_member(zf: zipfile.ZipFile, name: str) -> tp.Union[bytes, memoryview]:
+            info = zf.getinfo(name)
+            if info.compress_type != zipfile.ZIP_STORED:
+                return zf.read(info)
+            start = self._member_offset(buffer, info)
+            return view[start: start + info.file_size]
+
+        try:
+            yield read_member
+        finally:
+            view.release()
+            mmap_close(buffer)
+
     @staticmethod
     def _build_frame(
-            src: bytes,
+            src: tp.Union[bytes, memoryview],
             name: tp.Hashable,
             config: tp.Union[StoreConfigHE, StoreConfig],
             constructor: FrameConstructor,
         ) -> Frame:
+        import pyarrow as pa #type: ignore
+
         return constructor( # type: ignore
-            BytesIO(src),
+            pa.py_buffer(src),
             index_depth=config.index_depth,
             index_name_depth_level=config.index_name_depth_level,
             columns_depth=config.columns_depth,
@@ -313,6 +519,52 @@ class StoreZipParquet(_StoreZip):
             consolidate_blocks=config.consolidate_blocks,
             )
 
+    @store_coherent_non_write
+    def read_labels_many(self,
+            labels: tp.Iterable[tp.Hashable],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[Frame] = Frame,
+            ) -> tp.Iterator[tp.Tuple[IndexBase, IndexBase]]:
+        import pyarrow as pa #type: ignore
+        import pyarrow.parquet as pq #type: ignore
+
+        config_map = StoreConfigMap.from_initializer(config)
+
+        with zipfile.ZipFile(self._fp) as zf, self._member_reader() as read_member:
+            for label in labels:
+                c = config_map[label]
+                label_encoded = config_map.default.label_encode(label)
+
+                # columns are found in the schema, and of values, only index columns are parsed
+                src = pa.py_buffer(read_member(zf, label_encoded + self._EXT_CONTAINED))
+                schema = pq.read_schema(src)
+                names_index = schema.names[:c.index_depth]
+                table_index = pq.read_table(src,
+                        columns=names_index,
+                        use_pandas_metadata=False,
+                        )
+                table_columns = schema.empty_table()
+                if c.columns_select:
+                    columns_select = list(c.columns_select)
+                    missing = set(columns_select) - set(schema.names)
+                    if missing:
+                        raise ErrorInitFrame(f'cannot load all columns in columns_select: missing {missing}')
+                    table_columns = table_columns.select(names_index + columns_select)
+
+                index, columns = (container_type.from_arrow(table,
+                        index_depth=c.index_depth,
+                        index_name_depth_level=c.index_name_depth_level,
+                        columns_depth=columns_depth,
+                        columns_name_depth_level=c.columns_name_depth_level,
+                        dtypes=c.dtypes,
+                        name=label,
+                        ) for table, columns_depth in (
+                                (table_index, 0),
+                                (table_columns, c.columns_depth),
+                                ))
+                yield index.index, columns.columns
+
     @staticmethod
     def _payload_to_bytes(payload: PayloadFrameToBytes) -> LabelAndBytes:
         c = payload.config
@@ -326,3 +578,123 @@ class StoreZipParquet(_StoreZip):
                 include_columns_name=c.include_columns_name,
                 )
         return payload.name, dst.getvalue()
+
+
+#-------------------------------------------------------------------------------
+
+class StoreZipNPY(_StoreZip):
+    '''A zip of uncompressed NPY files, one directory per Frame, permitting incremental loading of Frames without decompression or parsing.
+    '''
+    _EXT_CONTAINED = '/' + NPY_HEADER
+    _MANIFEST_EXACT = True
+
+    # an extra field identifier reserved for alignment padding
+    _EXTRA_ID_ALIGN = 0xD935
+    _ALIGN = 64
+
+    def _labels_from_names(self,
+            names: tp.Iterable[str],
+            strip_ext: bool,
+            ) -> tp.Iterator[str]:
+        for name in names:
+            # only the header identifies a Frame; the arrays are in the same directory
+            if not name.endswith(self._EXT_CONTAINED):
+                continue
+            if strip_ext:
+                name = name[:-len(self._EXT_CONTAINED)]
+            yield name
+
+    def _read_npy(self,
+            labels: tp.Iterable[tp.Hashable],
+            config: StoreConfigMapInitializer,
+            ) -> tp.Iterator[tp.Tuple[str, ArrayReader]]:
+        '''
+        For each label, yield the header and a function to read arrays of that label's directory; stored arrays are read from a memory map without a copy.
+        '''
+        config_map = StoreConfigMap.from_initializer(config)
+
+        with open(self._fp, 'rb') as f:
+            # arrays retain a reference to the map, which remains open after the file is closed
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            with zipfile.ZipFile(self._fp) as zf:
+                for label in labels:
+                    prefix = config_map.default.label_encode(label) + '/'
+
+                    def read_array(file_name: str) -> np.ndarray:
+                        info = zf.getinfo(prefix + file_name)
+                        if info.compress_type != zipfile.ZIP_STORED:
+                            return np.load(BytesIO(zf.read(info)), allow_pickle=False)
+                        return npy_array_from_buffer(buffer,
+                                self._member_offset(buffer, info))
+
+                    yield zf.read(prefix + NPY_HEADER).decode(), read_array
+        finally:
+            mmap_close(buffer)
+
+    @store_coherent_non_write
+    def read_many(self,
+            labels: tp.Iterable[tp.Hashable],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[Frame] = Frame,
+            ) -> tp.Iterator[Frame]:
+
+        for header, read_array in self._read_npy(labels, config):
+            yield frame_from_npy(container_type, header, read_array)
+
+    @store_coherent_non_write
+    def read_labels_many(self,
+            labels: tp.Iterable[tp.Hashable],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[Frame] = Frame,
+            ) -> tp.Iterator[tp.Tuple[IndexBase, IndexBase]]:
+
+        for header, read_array in self._read_npy(labels, config):
+            yield frame_labels_from_npy(header, read_array)
+
+    @store_coherent_write
+    def write(self,
+            items: tp.Iterable[tp.Tuple[tp.Hashable, Frame]],
+            *,
+            config: StoreConfigMapInitializer = None
+            ) -> None:
+        config_map = StoreConfigMap.from_initializer(config)
+        write_manifest = config_map.default.write_manifest
+        manifest = {}
+
+        # the archive is replaced, not overwritten, as Frames read from it may view its memory map
+        with path_replace_manager(self._fp) as fp_temp, \
+                zipfile.ZipFile(fp_temp, 'w', zipfile.ZIP_STORED) as zf:
+            for label, frame in items:
+                label_encoded = config_map.default.label_encode(label)
+                prefix = label_encoded + '/'
+                digest = hashlib.sha256()
+
+                def write_array(file_name: str, array: np.ndarray) -> None:
+                    data = npy_array_to_bytes(array)
+                    if write_manifest:
+                        digest.update(data)
+                    info = zipfile.ZipInfo(prefix + file_name)
+                    info.compress_type = zipfile.ZIP_STORED
+                    # pad the extra field so that array data, which follows a NPY header sized to a multiple of 64 bytes, is aligned in the file; large members get a 20 byte ZIP64 extra field
+                    data_offset = (zf.fp.tell() #type: ignore
+                            + self._LOCAL_HEADER_SIZE
+                            + len(info.filename.encode('utf-8'))
+                            + 4
+                            + (20 if len(data) * 1.05 > zipfile.ZIP64_LIMIT else 0))
+                    pad = -data_offset % self._ALIGN
+                    info.extra = struct.pack('<HH', self._EXTRA_ID_ALIGN, pad) + bytes(pad)
+                    zf.writestr(info, data)
+
+                header = frame_to_npy(frame, write_array)
+                zf.writestr(prefix + NPY_HEADER, header)
+                if write_manifest:
+                    digest.update(header.encode('utf-8'))
+                    manifest[label_encoded] = StoreManifest.from_frame(frame,
+                            digest=digest.hexdigest())
+
+            if write_manifest:
+                self._manifest_write(zf, manifest)
@@ -22,9 +22,12 @@ from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorInitTypeBlocks
 from static_frame.core.index_correspondence import IndexCorrespondence
 from static_frame.core.node_selector import InterfaceGetItem
+from static_frame.core.util import immutable_unpickle
+from static_frame.core.util import pickle_filter
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_to_groups_and_locations
-from static_frame.core.util import array2d_to_tuples
+from static_frame.core.util import arrays_to_codes
+from static_frame.core.util import codes_to_group_positions
 from static_frame.core.util import binary_transition
 from static_frame.core.util import column_1d_filter
 from static_frame.core.util import column_2d_filter
@@ -293,6 +296,26 @@ class TypeBlocks(ContainerOperand):
         for b in self._blocks:
             b.flags.writeable = False
 
+    def __reduce_ex__(self, protocol: int) -> tp.Tuple[tp.Any, ...]:
+        '''
+        With protocol 5 and greater, pickle only the blocks, restoring derived attributes on load; blocks are contiguous such that their buffers can be passed out-of-band. Lower protocols use default pickling, such that pickles can be read by prior versions.
+        '''
+        if protocol < 5:
+            return object.__reduce_ex__(self, protocol) #type: ignore
+        return (self.__class__._from_pickle,
+                ([pickle_filter(b, protocol) for b in self._blocks], self._shape),
+                )
+
+    @classmethod
+    def _from_pickle(cls,
+            blocks: tp.List[np.ndarray],
+            shape: tp.Tuple[int, int],
+            ) -> 'TypeBlocks':
+        return cls.from_blocks(
+                [immutable_unpickle(b) for b in blocks],
+                shape_reference=shape,
+                )
+
     def __deepcopy__(self, memo: tp.Dict[int, tp.Any]) -> 'TypeBlocks':
         obj = self.__new__(self.__class__)
         obj._blocks = [array_deepcopy(b, memo) for b in self._blocks]
@@ -782,42 +805,44 @@ class TypeBlocks(ContainerOperand):
             key: iloc selector on opposite axis
 
         Returns:
-            Generator of group, selection pairs, where selection is an np.ndarray. Returned is as an np.ndarray if key is more than one column.
+            Generator of group, selection, TypeBlocks triples, where selection is an np.ndarray of ilocs. Groups are tuples if key is more than one column.
         '''
-        # in worse case this will make a copy of the values extracted; this is probably still cheaper than iterating manually through rows/columns
-        unique_axis = None
-
         # NOTE: in axis_values we determine zero size by looking for empty _blocks; not sure if that is appropriate here.
         if self._shape[0] == 0 or self._shape[1] == 0: # zero sized
             return
 
+        key_arrays: tp.Optional[tp.List[np.ndarray]] = None
+
         if axis == 0:
             # axis 0 means we return row groups; key is a column key
-            group_source = self._extract_array(column_key=key)
-            if group_source.ndim > 1:
-                unique_axis = 0
+            if isinstance(key, INT_TYPES):
+                group_source = self._extract_array(column_key=key)
+            else: # retain the dtype of each column, avoiding a consolidated (and possibly object) copy
+                key_arrays = list(self._extract(column_key=key).axis_values(0))
         elif axis == 1:
             # axis 1 means we return column groups; key is a row key
             group_source = self._extract_array(row_key=key)
             if group_source.ndim > 1 and group_source.shape[0] > 1:
-                unique_axis = 1
+                key_arrays = list(group_source)
         else:
             raise AxisInvalid(f'invalid axis: {axis}')
 
-        groups, locations = array_to_groups_and_locations(
-                group_source,
-                unique_axis)
+        if key_arrays is None:
+            groups, codes = array_to_groups_and_locations(group_source, None)
+            count = len(groups)
+        else:
+            # factorize each key array and combine into a single code per row; then only build hashable labels once per group
+            codes, count = arrays_to_codes(key_arrays, skipna=False)
+
+        order, starts, counts = codes_to_group_positions(codes, count)
 
-        if unique_axis is not None:
-            # NOTE: this is expensive!
-            # make the groups hashable for usage in index construction
-            if axis == 0:
-                groups = array2d_to_tuples(groups)
-            elif axis == 1:
-                groups = array2d_to_tuples(groups.T)
+        if key_arrays is not None:
+            first = order[starts]
+            groups = list(zip(*(a[first] for a in key_arrays)))
 
-        for idx, g in enumerate(groups):
-            selection = locations == idx
+        for g, start, size in zip(groups, starts, counts):
+            # ilocs in ascending order
+            selection = order[start: start + size]
             if axis == 0: # return row extractions
                 yield g, selection, self._extract(row_key=selection)
             elif axis == 1: # return columns extractions
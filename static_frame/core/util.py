@@ -1,18 +1,24 @@
 from collections import abc
 from collections import defaultdict
+from collections import deque
 from collections import namedtuple
 from enum import Enum
 from functools import partial
 from functools import reduce
+from io import BytesIO
 from io import StringIO
+from io import TextIOWrapper
 from itertools import chain
+from itertools import islice
 from itertools import zip_longest
 from os import PathLike
 from urllib import request
 from copy import deepcopy
 
 import contextlib
+import csv
 import datetime
+import mmap
 import operator
 import os
 import tempfile
@@ -20,6 +26,7 @@ import typing as tp
 
 from automap import FrozenAutoMap  # pylint: disable = E0611
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
 
 
 if tp.TYPE_CHECKING:
@@ -303,6 +310,21 @@ def immutable_filter(src_array: np.ndarray) -> np.ndarray:
         return dst_array
     return src_array # keep it as is
 
+def pickle_filter(array: np.ndarray, protocol: int) -> np.ndarray:
+    '''For pickle protocol 5 and greater, return a contiguous array, such that NumPy can provide its buffer out-of-band rather than copying it into the pickle stream.
+    '''
+    if (protocol >= 5
+            and array.dtype.kind != DTYPE_OBJECT_KIND
+            and not (array.flags.c_contiguous or array.flags.f_contiguous)):
+        return np.ascontiguousarray(array)
+    return array
+
+def immutable_unpickle(array: np.ndarray) -> np.ndarray:
+    '''Set an array restored from a pickle as immutable without a copy; out-of-band buffers might be writeable.
+    '''
+    array.flags.writeable = False
+    return array
+
 def name_filter(name: NameType) -> NameType:
     '''
     For name attributes on containers, only permit recursively hashable objects.
@@ -1018,6 +1040,350 @@ def iterable_to_array_nd(
     # its an element
     return np.array(values)
 
+#-------------------------------------------------------------------------------
+# delimited text parsing
+
+DELIMITED_CHUNK_SIZE = 65_536
+DELIMITED_RANGE_SIZE_MIN = 1 << 22 # 4 MB
+_DELIMITED_BOOL_LABELS = ('TRUE', 'FALSE')
+_DELIMITED_UNDERSCORE = ord('_')
+_DELIMITED_COMPLEX = ord('j')
+# bools with missing values are evaluated as objects
+_DELIMITED_KINDS_BOOL = frozenset(('b', 'O'))
+
+def str_array_to_array(
+        array: np.ndarray,
+        ) -> tp.Optional[np.ndarray]:
+    '''
+    Given a 1D array of unparsed strings (one column of a delimited file), infer and return an array of the narrowest of bool, int, float, complex, or str. Empty strings are treated as missing: they promote ints to floats and bools to objects, filled with NaN; empty strings found among str are retained. If all values are empty, return None, permitting the caller to resolve missing values against other chunks.
+    '''
+    empty = array == ''
+    if empty.all():
+        return None
+    has_empty = empty.any()
+    values = array[~empty] if has_empty else array
+
+    def finalize(post: np.ndarray) -> np.ndarray:
+        if not has_empty:
+            return post
+        dtype = DTYPE_FLOAT_DEFAULT if post.dtype.kind in DTYPE_INT_KINDS else post.dtype
+        if dtype == DTYPE_BOOL:
+            dtype = DTYPE_OBJECT
+        final = np.empty(len(array), dtype=dtype)
+        final[empty] = np.nan
+        final[~empty] = post
+        return final
+
+    if values[0].upper() in _DELIMITED_BOOL_LABELS:
+        # labels are case insensitive; avoid an upper-case copy if labels are title case
+        is_true = values == 'True'
+        if (is_true | (values == 'False')).all():
+            return finalize(is_true)
+        upper = np.char.upper(values)
+        is_true = upper == _DELIMITED_BOOL_LABELS[0]
+        if (is_true | (upper == _DELIMITED_BOOL_LABELS[1])).all():
+            return finalize(is_true)
+        return array
+
+    # NumPy parses numbers with Python semantics, accepting underscore digit separators; these are not numbers in a delimited file
+    if (values.view(np.uint32) == _DELIMITED_UNDERSCORE).any():
+        return array
+
+    dtypes: tp.Tuple[np.dtype, ...] = (DTYPE_FLOAT_DEFAULT,)
+    try:
+        int(values[0])
+        dtypes = (DTYPE_INT_DEFAULT,) + dtypes
+    except ValueError:
+        pass
+    if (values.view(np.uint32) == _DELIMITED_COMPLEX).any():
+        dtypes = dtypes + (DTYPE_COMPLEX_DEFAULT,)
+
+    for dtype in dtypes:
+        try:
+            return finalize(values.astype(dtype))
+        except (ValueError, OverflowError, TypeError):
+            continue
+    return array
+
+
+def delimited_chunks(
+        rows: tp.Iterable[tp.Sequence[str]],
+        *,
+        count: int,
+        chunksize: int = DELIMITED_CHUNK_SIZE,
+        skip_footer: int = 0,
+        ) -> tp.Iterator[tp.List[tp.Sequence[str]]]:
+    '''
+    Group parsed rows into lists of at most ``chunksize`` rows, discarding the last ``skip_footer`` rows and then rows that do not have ``count`` fields.
+    '''
+    if chunksize <= 0:
+        raise RuntimeError(f'invalid chunksize: {chunksize}')
+
+    if skip_footer:
+        def lagged(rows: tp.Iterable[tp.Sequence[str]]) -> tp.Iterator[tp.Sequence[str]]:
+            # delay each row until skip_footer subsequent rows are found
+            pending: tp.Deque[tp.Sequence[str]] = deque()
+            for row in rows:
+                pending.append(row)
+                if len(pending) > skip_footer:
+                    yield pending.popleft()
+        rows = lagged(rows)
+
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunksize))
+        if not chunk:
+            return
+        chunk = [row for row in chunk if len(row) == count]
+        if chunk:
+            yield chunk
+
+
+def delimited_chunk_to_str_arrays(
+        chunk: tp.Sequence[tp.Sequence[str]],
+        *,
+        positions: tp.Sequence[int],
+        ) -> tp.Iterator[np.ndarray]:
+    '''
+    Transpose a chunk of rows into one unparsed str array per selected column position.
+    '''
+    if len(positions) == 1:
+        getter = operator.itemgetter(positions[0])
+        columns: tp.Iterable[tp.Sequence[str]] = ([getter(row) for row in chunk],)
+    elif len(positions) == len(chunk[0]): # all positions, in order
+        columns = zip(*chunk)
+    else:
+        columns = zip(*map(operator.itemgetter(*positions), chunk))
+
+    for values in columns:
+        yield np.array(values, dtype=DTYPE_STR)
+
+
+def delimited_chunk_to_arrays(
+        chunk: tp.Sequence[tp.Sequence[str]],
+        *,
+        positions: tp.Sequence[int],
+        str_positions: tp.AbstractSet[int] = frozenset(),
+        ) -> tp.List[tp.Optional[np.ndarray]]:
+    '''
+    Transpose a chunk of rows into one array per selected column position. Columns in ``str_positions`` are not parsed and are returned as str arrays; other columns are evaluated with ``str_array_to_array``.
+    '''
+    return [array if pos in str_positions else str_array_to_array(array)
+            for pos, array in zip(positions,
+                    delimited_chunk_to_str_arrays(chunk, positions=positions))]
+
+
+def delimited_parts_conflict(
+        parts: tp.Iterable[tp.Optional[np.ndarray]],
+        ) -> bool:
+    '''
+    Return True if arrays evaluated from separate chunks of a column have kinds that, had the column been evaluated as a whole, would have resulted in a str array: str mixed with any other kind, or bool (with or without missing values) mixed with numbers. Other combinations are resolved by promotion with the same result as evaluating the whole.
+    '''
+    kinds = {p.dtype.kind for p in parts if p is not None}
+    if 'U' in kinds:
+        return len(kinds) > 1
+    return bool(kinds & _DELIMITED_KINDS_BOOL) and bool(kinds - _DELIMITED_KINDS_BOOL)
+
+
+def delimited_parts_to_array(
+        parts: tp.Sequence[tp.Optional[np.ndarray]],
+        sizes: tp.Sequence[int],
+        ) -> np.ndarray:
+    '''
+    Combine arrays parsed from successive chunks of a column into a single, contiguous, immutable array, promoting dtypes as necessary. A None part (a chunk of only empty strings) is filled with empty strings if the column is otherwise str, NaN otherwise.
+    '''
+    arrays = [p for p in parts if p is not None]
+    if not arrays:
+        fill = np.nan
+    elif all(a.dtype.kind == 'U' for a in arrays):
+        fill = ''
+    else:
+        fill = np.nan
+
+    if len(arrays) < len(parts):
+        parts = [np.full(size, fill) if p is None else p
+                for p, size in zip(parts, sizes)]
+    if len(parts) == 1:
+        array = parts[0]
+        array.flags.writeable = False
+        return array
+
+    # resolve once for all parts, then copy each part into a single allocation
+    array = np.empty(sum(sizes), dtype=resolve_dtype_iter(p.dtype for p in parts))
+    np.concatenate(parts, out=array)
+    array.flags.writeable = False
+    return array
+
+
+def delimited_rows_to_parts(
+        rows: tp.Iterable[tp.Sequence[str]],
+        *,
+        count: int,
+        positions: tp.Sequence[int],
+        str_positions: tp.AbstractSet[int] = frozenset(),
+        chunksize: int = DELIMITED_CHUNK_SIZE,
+        skip_footer: int = 0,
+        ) -> tp.Tuple[tp.List[tp.List[tp.Optional[np.ndarray]]], tp.List[int]]:
+    '''
+    Evaluate rows in chunks, returning, for each selected position, a list of arrays (one per chunk), as well as a list of the size of each chunk. These can be combined with ``delimited_parts_to_array``. Arrays are as would be evaluated from each column as a whole, independent of chunksize.
+    '''
+    parts: tp.List[tp.List[tp.Optional[np.ndarray]]] = [[] for _ in positions]
+    # unparsed strings of each chunk are retained until a column is found to be str, or until all rows are evaluated
+    raws: tp.List[tp.List[np.ndarray]] = [[] for _ in positions]
+    is_str = [pos in str_positions for pos in positions]
+    sizes = []
+    for chunk in delimited_chunks(rows,
+            count=count,
+            chunksize=chunksize,
+            skip_footer=skip_footer,
+            ):
+        sizes.append(len(chunk))
+        for i, array in enumerate(delimited_chunk_to_str_arrays(chunk, positions=positions)):
+            if is_str[i]:
+                parts[i].append(array)
+                continue
+            parts[i].append(str_array_to_array(array))
+            raws[i].append(array)
+            if delimited_parts_conflict(parts[i]):
+                # evaluated as a whole, this column is str: use the unparsed strings of all chunks, and do not evaluate further chunks
+                parts[i] = raws[i] #type: ignore
+                raws[i] = []
+                is_str[i] = True
+    return parts, sizes
+
+
+def delimited_records(
+        f: tp.BinaryIO,
+        *,
+        quote_char: str,
+        ) -> tp.Iterator[tp.Tuple[int, bytes]]:
+    '''
+    Yield pairs of byte offset and the bytes of each record from a file opened in binary mode. A record is one or more lines with a balanced count of ``quote_char``, such that newlines in quoted fields do not end a record.
+    '''
+    quote = quote_char.encode()
+    while True:
+        offset = f.tell()
+        record = f.readline()
+        if not record:
+            return
+        while record.count(quote) % 2:
+            line = f.readline()
+            if not line:
+                break
+            record += line
+        yield offset, record
+
+
+def delimited_bytes_to_rows(
+        data: bytes,
+        *,
+        delimiter: str,
+        quote_char: str,
+        encoding: tp.Optional[str],
+        ) -> tp.Iterator[tp.List[str]]:
+    '''
+    Parse rows from the bytes of one or more records, decoding as a file opened in text mode would.
+    '''
+    return csv.reader(TextIOWrapper(BytesIO(data), encoding=encoding),
+            delimiter=delimiter,
+            quotechar=quote_char,
+            )
+
+
+def delimited_ranges(
+        fp: str,
+        *,
+        start: int,
+        count: int,
+        quote_char: str,
+        size_min: tp.Optional[int] = None,
+        ) -> tp.List[tp.Tuple[int, int]]:
+    '''
+    Divide the bytes of a file, from ``start`` to the end, into at most ``count`` ranges of similar size, where each range starts and ends on a record boundary. Newlines within quoted fields are identified by the parity of the count of ``quote_char`` from ``start``, which must be a record boundary.
+
+    Args:
+        size_min: the minimum size in bytes of each range; if None, ``DELIMITED_RANGE_SIZE_MIN`` is used.
+    '''
+    if size_min is None:
+        size_min = DELIMITED_RANGE_SIZE_MIN
+    size = os.path.getsize(fp)
+    count = max(1, min(count, (size - start) // size_min))
+    if count == 1:
+        return [(start, size)]
+
+    quote = ord(quote_char)
+    newline = ord('\n')
+    window = 1 << 20 # bytes examined at a time to bound memory
+    boundaries = [start]
+
+    with open(fp, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = np.frombuffer(mm, dtype=np.uint8)
+        block = data[:0]
+        parity = 0 # parity of quotes from the last boundary to pos
+        pos = start
+        for i in range(1, count):
+            target = start + (size - start) * i // count
+            if target <= pos:
+                continue
+            for block_start in range(pos, target, window):
+                block = data[block_start: min(block_start + window, target)]
+                parity ^= int(np.count_nonzero(block == quote)) & 1
+            pos = target
+            # find the first newline after target outside of quotes
+            boundary = -1
+            while pos < size:
+                block = data[pos: pos + window]
+                # parity after each byte
+                after = (np.cumsum(block == quote) + parity) & 1
+                found = np.nonzero((block == newline) & (after == 0))[0]
+                if len(found):
+                    boundary = pos + int(found[0]) + 1
+                    break
+                parity = int(after[-1])
+                pos += len(block)
+            if boundary < 0 or boundary >= size:
+                break
+            boundaries.append(boundary)
+            pos = boundary
+            parity = 0
+        del data, block # release views of the buffer before closing mmap
+
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def delimited_range_to_parts(
+        fp: str,
+        start: int,
+        stop: int,
+        *,
+        delimiter: str,
+        quote_char: str,
+        encoding: tp.Optional[str],
+        count: int,
+        positions: tp.Sequence[int],
+        str_positions: tp.AbstractSet[int],
+        skip_footer: int,
+        ) -> tp.Tuple[tp.List[tp.List[tp.Optional[np.ndarray]]], tp.List[int]]:
+    '''
+    Read and evaluate the records in a range of bytes of a delimited file, as returned by ``delimited_ranges``. This function is called in a process pool.
+    '''
+    with open(fp, 'rb') as f:
+        f.seek(start)
+        data = f.read(stop - start)
+
+    return delimited_rows_to_parts(
+            delimited_bytes_to_rows(data,
+                    delimiter=delimiter,
+                    quote_char=quote_char,
+                    encoding=encoding,
+                    ),
+            count=count,
+            positions=positions,
+            str_positions=str_positions,
+            skip_footer=skip_footer,
+            )
+
 #-------------------------------------------------------------------------------
 
 def slice_to_ascending_slice(
@@ -1490,6 +1856,677 @@ def array_to_duplicated(
                 exclude_last=exclude_last
                 )
 
+#-------------------------------------------------------------------------------
+# tools for factorization and joins
+
+def array_to_codes(
+        array: np.ndarray,
+        skipna: bool = True,
+        ) -> tp.Tuple[np.ndarray, int]:
+    '''
+    Factorize a 1D array into integer codes, where equal values share a code and codes ascend with the sort order of the values (or, if the values are not sortable, with the order of first appearance). NaN and NaT values, which never compare equal, are assigned -1; None is treated as a value.
+
+    Args:
+        skipna: if False, NaN and NaT values are instead assigned a shared code following the codes of all other values.
+
+    Returns:
+        A tuple of the codes array and the count of distinct values.
+    '''
+    isna = isna_array(array, include_none=False)
+    has_na = isna.any()
+    values = array[~isna] if has_na else array
+
+    try:
+        uniques, codes_valid = np.unique(values, return_inverse=True)
+        count = len(uniques)
+    except TypeError: # unorderable object arrays; must use hashing
+        code_map: tp.Dict[tp.Hashable, int] = {}
+        codes_valid = np.fromiter(
+                (code_map.setdefault(v, len(code_map)) for v in values),
+                count=len(values),
+                dtype=DTYPE_INT_DEFAULT,
+                )
+        count = len(code_map)
+
+    if not has_na:
+        return codes_valid, count
+
+    codes = np.full(len(array), -1 if skipna else count, dtype=DTYPE_INT_DEFAULT)
+    codes[~isna] = codes_valid
+    return codes, count if skipna else count + 1
+
+
+def arrays_to_codes(
+        arrays: tp.Iterable[np.ndarray],
+        skipna: bool = True,
+        ) -> tp.Tuple[np.ndarray, int]:
+    '''
+    Factorize one or more aligned 1D arrays into a single array of integer codes, one per row, such that rows share a code only if all values are equal. Codes ascend with the lexicographic order of sortable rows. A row with any NaN or NaT value is assigned -1.
+
+    Args:
+        skipna: if False, NaN and NaT values are treated as equal to each other and sort after all other values, such that every row is assigned a code.
+
+    Returns:
+        A tuple of the codes array and the count of distinct rows.
+    '''
+    codes: tp.Optional[np.ndarray] = None
+    count = 0
+
+    for array in arrays:
+        codes_array, count_array = array_to_codes(array, skipna=skipna)
+        if codes is None:
+            codes, count = codes_array, count_array
+            continue
+        # combine into a single code, then compact to keep combined codes bounded by the row count
+        valid = (codes >= 0) & (codes_array >= 0)
+        combined = codes[valid] * count_array + codes_array[valid]
+        codes = np.full(len(valid), -1, dtype=DTYPE_INT_DEFAULT)
+        uniques, codes[valid] = np.unique(combined, return_inverse=True)
+        count = len(uniques)
+
+    if codes is None:
+        raise RuntimeError('no arrays provided')
+    return codes, count
+
+
+def join_codes_to_ilocs(
+        codes_left: np.ndarray,
+        codes_right: np.ndarray,
+        count: int,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Given codes produced from a shared factorization of left and right keys, return a pair of aligned arrays of left and right iloc positions for all matches, ordered by left position and then by right position. As codes are dense integers, a count of right rows per code serves as the hash table; no Python-level iteration is done.
+    '''
+    valid_right = codes_right >= 0
+    iloc_right_valid = np.flatnonzero(valid_right)
+    codes_right_valid = codes_right[valid_right]
+    # right positions grouped by code; a stable sort retains ascending right positions within a code
+    order = iloc_right_valid[np.argsort(codes_right_valid, kind=DEFAULT_STABLE_SORT_KIND)]
+
+    counts = np.bincount(codes_right_valid, minlength=count)
+    starts = np.cumsum(counts) - counts
+
+    valid_left = codes_left >= 0
+    codes_left_valid = codes_left[valid_left]
+    matches = np.zeros(len(codes_left), dtype=DTYPE_INT_DEFAULT)
+    matches[valid_left] = counts[codes_left_valid]
+
+    iloc_left = np.repeat(np.arange(len(codes_left)), matches)
+
+    # for each pair, find the offset into order from the start of the code plus the position within the run of matches
+    total = len(iloc_left)
+    ends = np.cumsum(matches)
+    offsets = np.arange(total) - np.repeat(ends - matches, matches)
+    starts_left = np.zeros(len(codes_left), dtype=DTYPE_INT_DEFAULT)
+    starts_left[valid_left] = starts[codes_left_valid]
+    iloc_right = order[np.repeat(starts_left, matches) + offsets]
+
+    return iloc_left, iloc_right
+
+
+def array_is_sorted(array: np.ndarray) -> bool:
+    '''
+    Return True if a 1D array is sorted in non-descending order. As comparisons to NaN and NaT are False, arrays with those values (and more than one element) are never sorted.
+    '''
+    if len(array) < 2:
+        return True
+    return bool((array[1:] >= array[:-1]).all())
+
+
+def join_sorted_arrays_to_ilocs(
+        array_left: np.ndarray,
+        array_right: np.ndarray,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Given left and right 1D key arrays, both sorted in non-descending order and of the same dtype, return a pair of aligned arrays of left and right iloc positions for all equal keys, ordered by left position and then by right position. Bounds of the run of equal right keys are found for each left key with ``np.searchsorted``; no hashing or Python-level iteration is done.
+    '''
+    starts = np.searchsorted(array_right, array_left, side='left')
+    matches = np.searchsorted(array_right, array_left, side='right') - starts
+    # a single-element array might be NaN, which searchsorted will match
+    matches[isna_array(array_left, include_none=False)] = 0
+
+    iloc_left = np.repeat(np.arange(len(array_left)), matches)
+    ends = np.cumsum(matches)
+    offsets = np.arange(len(iloc_left)) - np.repeat(ends - matches, matches)
+    iloc_right = np.repeat(starts, matches) + offsets
+
+    return iloc_left, iloc_right
+
+
+def join_arrays_to_ilocs(
+        arrays_left: tp.Sequence[np.ndarray],
+        arrays_right: tp.Sequence[np.ndarray],
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Given aligned sequences of left and right 1D key arrays, return a pair of aligned arrays of left and right iloc positions for all rows where all keys are equal, ordered by left position and then by right position.
+
+    If there is a single key of a non-object dtype, and both left and right keys are already sorted (as is common with date or datetime indices), keys are merged with ``np.searchsorted``. Otherwise, each left and right key is factorized together (with dtypes resolved to avoid coercing unequal values to equality), such that the cost is O(n log n) in the sum of left and right lengths (n), dominated by the sort of factorization, not proportional to their product.
+    '''
+    if len(arrays_left) == 1:
+        array_left = arrays_left[0]
+        array_right = arrays_right[0]
+        dtype = resolve_dtype(array_left.dtype, array_right.dtype)
+        if (dtype.kind != DTYPE_OBJECT_KIND
+                and array_is_sorted(array_left)
+                and array_is_sorted(array_right)):
+            return join_sorted_arrays_to_ilocs(
+                    array_left.astype(dtype, copy=False),
+                    array_right.astype(dtype, copy=False),
+                    )
+
+    count_left = len(arrays_left[0])
+    codes, count = arrays_to_codes(
+            concat_resolved((left, right))
+            for left, right in zip(arrays_left, arrays_right)
+            )
+    return join_codes_to_ilocs(codes[:count_left], codes[count_left:], count)
+
+
+ASOF_DIRECTIONS = ('backward', 'forward', 'nearest')
+
+# kinds for which a distance between labels can be found by subtraction
+DTYPE_ASOF_DISTANCE_KINDS = frozenset(DTYPE_INT_KINDS + DTYPE_INEXACT_KINDS + DTYPE_NAT_KINDS)
+
+def asof_ilocs(
+        labels_src: np.ndarray,
+        labels_dst: np.ndarray,
+        *,
+        direction: str = 'backward',
+        tolerance: tp.Any = None,
+        ) -> np.ndarray:
+    '''
+    For each label in ``labels_dst``, return the iloc position in the sorted ``labels_src`` of the last label less than or equal to it (backward), the first label greater than or equal to it (forward), or the closest label (nearest, preferring the backward label on ties); -1 is returned where there is no such label, or where its distance exceeds ``tolerance``. All positions are found with ``np.searchsorted``; neither a union of labels nor a per-label lookup is needed.
+
+    Args:
+        tolerance: The maximum distance between labels, as a ``np.timedelta64`` or ``datetime.timedelta`` for datetime labels, or a number otherwise. If None, distance is not limited.
+    '''
+    if direction not in ASOF_DIRECTIONS:
+        raise RuntimeError(f'direction must be one of {ASOF_DIRECTIONS}')
+    if labels_src.dtype.kind == DTYPE_OBJECT_KIND or labels_dst.dtype.kind == DTYPE_OBJECT_KIND:
+        raise RuntimeError('labels must be of a sortable, non-object dtype.')
+    if not array_is_sorted(labels_src):
+        raise RuntimeError('labels to be searched must be sorted and have no missing values.')
+
+    dtype = resolve_dtype(labels_src.dtype, labels_dst.dtype)
+    if ((direction == 'nearest' or tolerance is not None)
+            and dtype.kind not in DTYPE_ASOF_DISTANCE_KINDS):
+        raise RuntimeError(f'labels of dtype {dtype} have no distance; direction "nearest" and tolerance require numeric, datetime, or timedelta labels.')
+    labels_src = labels_src.astype(dtype, copy=False)
+    labels_dst = labels_dst.astype(dtype, copy=False)
+    count = len(labels_src)
+
+    if direction == 'forward':
+        ilocs = np.searchsorted(labels_src, labels_dst, side='left')
+        ilocs[ilocs == count] = -1
+    else:
+        ilocs = np.searchsorted(labels_src, labels_dst, side='right') - 1
+        if direction == 'nearest':
+            ilocs_after = np.searchsorted(labels_src, labels_dst, side='left')
+            has_after = ilocs_after < count
+            # an exact match is found as the backward label; otherwise, compare distances
+            is_after = has_after.copy()
+            has_before = ilocs >= 0
+            is_both = has_before & has_after
+            is_after[is_both] = (
+                    (labels_src[ilocs_after[is_both]] - labels_dst[is_both])
+                    < (labels_dst[is_both] - labels_src[ilocs[is_both]])
+                    )
+            ilocs[is_after] = ilocs_after[is_after]
+
+    # NaN and NaT labels never match
+    ilocs[isna_array(labels_dst)] = -1
+
+    if tolerance is not None:
+        if isinstance(tolerance, datetime.timedelta):
+            tolerance = to_timedelta64(tolerance)
+        found = np.flatnonzero(ilocs >= 0)
+        distance = np.abs(labels_dst[found] - labels_src[ilocs[found]])
+        ilocs[found[distance > tolerance]] = -1
+
+    return ilocs
+
+
+# the maximum number of values gathered at once when reducing windows that cannot be reduced with accumulations
+WINDOW_GATHER_ELEMENTS = 2 ** 20
+
+GROUP_REDUCE_FUNCS = ('sum', 'mean', 'min', 'max', 'count', 'first', 'last')
+WINDOW_REDUCE_FUNCS = ('sum', 'mean', 'std', 'min', 'max', 'count', 'first', 'last')
+
+def codes_to_group_positions(
+        codes: np.ndarray,
+        count: int,
+        ) -> tp.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''
+    Given codes from a factorization, return the ilocs that order rows by group (retaining the original order within a group), as well as the start and size of each group within that ordering. Rows with a code of -1 are excluded.
+    '''
+    valid = codes >= 0
+    codes_valid = codes[valid]
+    order = np.flatnonzero(valid)[np.argsort(codes_valid, kind=DEFAULT_STABLE_SORT_KIND)]
+    counts = np.bincount(codes_valid, minlength=count)
+    starts = np.cumsum(counts) - counts
+    return order, starts, counts
+
+
+def _array_group_reduce_masked(
+        values: np.ndarray,
+        isna: np.ndarray,
+        counts: np.ndarray,
+        ufunc: np.ufunc,
+        ) -> np.ndarray:
+    '''
+    Apply ``ufunc.reduceat`` to grouped values after removing NA values, one column at a time; groups without any values are filled with NaN.
+    '''
+    group_ids = np.repeat(np.arange(len(counts)), counts)
+    columns = values.reshape(len(values), -1)
+    isna = isna.reshape(len(values), -1)
+    post = np.full((len(counts), columns.shape[1]), np.nan, dtype=DTYPE_OBJECT)
+
+    for i in range(columns.shape[1]):
+        keep = ~isna[:, i]
+        counts_valid = np.bincount(group_ids[keep], minlength=len(counts))
+        has_values = counts_valid > 0
+        starts_valid = (np.cumsum(counts_valid) - counts_valid)[has_values]
+        if len(starts_valid):
+            post[has_values, i] = ufunc.reduceat(columns[keep, i], starts_valid)
+
+    return post.reshape((len(counts),) + values.shape[1:])
+
+
+def array_group_reduce(
+        array: np.ndarray,
+        order: np.ndarray,
+        starts: np.ndarray,
+        counts: np.ndarray,
+        *,
+        func: str,
+        skipna: bool = True,
+        ) -> np.ndarray:
+    '''
+    Reduce the rows of a 1D or 2D array by group, as described by the ``order``, ``starts``, and ``counts`` returned from ``codes_to_group_positions``. All groups are reduced at once with ``ufunc.reduceat`` on a single grouped copy of the array.
+
+    Args:
+        func: one of ``GROUP_REDUCE_FUNCS``.
+        skipna: if True, NaN, NaT, and None values are excluded from sum, mean, min, max, and count.
+    '''
+    if func not in GROUP_REDUCE_FUNCS:
+        raise RuntimeError(f'invalid reduction function: {func}')
+
+    values = array[order]
+
+    if func == 'first':
+        post = values[starts]
+    elif func == 'last':
+        post = values[starts + counts - 1]
+    else:
+        shape_group = (len(counts),) + values.shape[1:]
+        if not len(counts):
+            dtype = array.dtype if func in ('min', 'max') else (
+                    DTYPE_INT_DEFAULT if func == 'count' else DTYPE_FLOAT_DEFAULT)
+            post = np.empty(shape_group, dtype=dtype)
+            post.flags.writeable = False
+            return post
+
+        is_str = values.dtype.kind in DTYPE_STR_KINDS
+        if is_str: # ufuncs only have object loops for strings
+            values = values.astype(DTYPE_OBJECT)
+
+        isna = isna_array(values) if skipna else None
+        has_na = isna is not None and isna.any()
+        counts_shaped = counts.reshape((-1,) + (1,) * (values.ndim - 1))
+
+        if func in ('count', 'mean'):
+            if has_na:
+                counts_valid = np.add.reduceat(
+                        (~isna).astype(DTYPE_INT_DEFAULT),
+                        starts,
+                        axis=0,
+                        )
+            else:
+                counts_valid = np.broadcast_to(counts_shaped, shape_group)
+
+        if func == 'count':
+            # a broadcast view must be copied to be contiguous
+            post = counts_valid if has_na else counts_valid.copy()
+        elif func in ('sum', 'mean'):
+            if values.dtype == DTYPE_BOOL:
+                values = values.astype(DTYPE_INT_DEFAULT)
+            elif has_na:
+                values[isna] = 0
+            post = np.add.reduceat(values, starts, axis=0)
+            if func == 'mean':
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    post = post / counts_valid
+        else: # min, max
+            if values.dtype.kind == DTYPE_OBJECT_KIND:
+                ufunc = np.minimum if func == 'min' else np.maximum
+                if has_na:
+                    post = _array_group_reduce_masked(values, isna, counts, ufunc)
+                else:
+                    post = ufunc.reduceat(values, starts, axis=0)
+                if is_str:
+                    post = post.astype(array.dtype)
+            else:
+                # fmin and fmax ignore NaN and NaT unless all values are NaN or NaT
+                if skipna:
+                    ufunc = np.fmin if func == 'min' else np.fmax
+                else:
+                    ufunc = np.minimum if func == 'min' else np.maximum
+                post = ufunc.reduceat(values, starts, axis=0)
+
+    post.flags.writeable = False
+    return post
+
+
+def window_positions(
+        count: int,
+        *,
+        size: int,
+        step: int = 1,
+        window_sized: bool = True,
+        label_shift: int = 0,
+        start_shift: int = 0,
+        ) -> tp.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''
+    For windows over ``count`` positions, return the start and stop (exclusive) positions of all valid windows, as well as the position of the label of each window. These are the same windows, in the same order, as yielded by ``axis_window_items`` when window size is constant.
+    '''
+    if size <= 0:
+        raise RuntimeError('window size must be greater than 0')
+    if step < 0:
+        raise RuntimeError('window step cannot be less than than 0')
+
+    count_window_max = count if start_shift >= 0 else count + abs(start_shift)
+    idx_left_max = count_window_max - 1
+
+    # the first window is always evaluated
+    if step == 0:
+        count_window = count_window_max + 1
+    else:
+        count_window = max(min(count_window_max, (idx_left_max - start_shift) // step), 0) + 1
+
+    idx_left = start_shift + step * np.arange(count_window)
+    idx_right = idx_left + size - 1
+
+    starts = np.clip(idx_left, 0, count)
+    stops = np.maximum(np.clip(idx_right + 1, 0, count), starts)
+    ilocs_label = idx_right + label_shift
+
+    valid = (ilocs_label >= 0) & (ilocs_label < count)
+    if window_sized:
+        valid &= (stops - starts) == size
+
+    return starts[valid], stops[valid], ilocs_label[valid]
+
+
+def _sliding_window_view(
+        array: np.ndarray,
+        size: int,
+        axis: int,
+        ) -> np.ndarray:
+    '''
+    Return a read-only view of all windows of ``size`` along ``axis``, where window positions are added as the last axis. Uses ``sliding_window_view`` where available (NumPy 1.20 and greater), and ``as_strided`` otherwise.
+    '''
+    try:
+        from numpy.lib.stride_tricks import sliding_window_view
+    except ImportError: #pragma: no cover
+        return _sliding_window_view_strided(array, size, axis)
+    return sliding_window_view(array, size, axis=axis) #type: ignore
+
+def _sliding_window_view_strided(
+        array: np.ndarray,
+        size: int,
+        axis: int,
+        ) -> np.ndarray:
+    '''
+    An implementation of ``_sliding_window_view`` with ``as_strided``, for NumPy before 1.20.
+    '''
+    if not 0 < size <= array.shape[axis]:
+        raise ValueError('size must be greater than zero and no greater than the length of the axis')
+    shape = list(array.shape)
+    shape[axis] -= size - 1
+    return as_strided(array, #type: ignore
+            shape=tuple(shape) + (size,),
+            strides=array.strides + (array.strides[axis],),
+            writeable=False,
+            )
+
+
+def array_window_view(
+        array: np.ndarray,
+        starts: np.ndarray,
+        *,
+        size: int,
+        axis: int = 0,
+        ) -> np.ndarray:
+    '''
+    Return a read-only array of windows of ``size`` along ``axis``, one for each position in ``starts``, where the first axis is windows and each window has the shape of a slice of ``array``. When ``starts`` are evenly spaced, windows are strided views and no values are copied.
+    '''
+    if not len(starts):
+        shape = (size,) + array.shape[1:] if axis == 0 else (array.shape[0], size)
+        post = np.empty((0,) + shape, dtype=array.dtype)
+        post.flags.writeable = False
+        return post
+
+    # window positions are added as the last axis; move them to follow windows
+    view = _sliding_window_view(array, size, axis=axis)
+    if array.ndim == 2:
+        view = np.moveaxis(view, -1, 1) if axis == 0 else np.moveaxis(view, 1, 0)
+
+    steps = np.diff(starts)
+    if not len(steps):
+        return view[starts[0]: starts[0] + 1]
+    if steps[0] > 0 and (steps == steps[0]).all():
+        return view[starts[0]: starts[-1] + 1: steps[0]]
+
+    post = view[starts] # a copy
+    post.flags.writeable = False
+    return post
+
+
+def _window_sum(
+        values: np.ndarray,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        size: int,
+        ) -> np.ndarray:
+    '''
+    Sum all windows in linear time (independent of window size) by combining cumulative sums within fixed blocks of ``size`` rows: a window is either a prefix or suffix of one block, or a suffix of one block and a prefix of the next. As only values within a window contribute to its sum, non-finite values do not propagate to other windows, and precision is not lost to the magnitude of values outside the window. Windows shorter than size must be clipped at the start or end of the array.
+    '''
+    dtype = np.result_type(values.dtype, DTYPE_INT_DEFAULT)
+    count = len(values)
+    # windows longer than the array are all clipped at the start or end
+    size = max(min(size, count), 1)
+    count_block = max(-(-count // size), 1)
+    # zeros used for padding do not change any sum
+    padded = np.zeros((count_block * size,) + values.shape[1:], dtype=dtype)
+    padded[:count] = values
+    blocks = padded.reshape((count_block, size) + values.shape[1:])
+    prefix = np.cumsum(blocks, axis=1).reshape(padded.shape)
+    suffix = np.cumsum(blocks[:, ::-1], axis=1)[:, ::-1].reshape(padded.shape)
+
+    post = np.zeros((len(starts),) + values.shape[1:], dtype=dtype)
+    is_filled = stops > starts
+    starts = starts[is_filled]
+    lasts = stops[is_filled] - 1
+
+    is_split = (starts // size) != (lasts // size)
+    is_prefix = ~is_split & (starts % size == 0)
+    # all other windows are a suffix of a block
+    post_filled = suffix[starts]
+    post_filled[is_prefix] = prefix[lasts[is_prefix]]
+    post_filled[is_split] += prefix[lasts[is_split]]
+    post[is_filled] = post_filled
+    return post
+
+
+def _window_deviation_squares(
+        values: np.ndarray,
+        isna: tp.Optional[np.ndarray],
+        starts: np.ndarray,
+        stops: np.ndarray,
+        size: int,
+        means: np.ndarray,
+        ) -> np.ndarray:
+    '''
+    For each window, sum the squared deviations of its values from its mean. Unlike differencing sums of squares, this is exact for windows of large values with small variance. Windows are gathered in chunks to bound memory; NA values, where ``isna`` is True, are excluded.
+    '''
+    post = np.zeros((len(starts),) + values.shape[1:], dtype=DTYPE_FLOAT_DEFAULT)
+    if not len(values):
+        return post
+
+    size = min(size, len(values))
+    shape_extra = (1,) * (values.ndim - 1)
+    width = max(int(np.prod(values.shape[1:])), 1) * size
+    chunk = max(WINDOW_GATHER_ELEMENTS // width, 1)
+    offsets = np.arange(size)
+
+    for start in range(0, len(starts), chunk):
+        sl = slice(start, start + chunk)
+        positions = starts[sl, np.newaxis] + offsets
+        is_valid = (positions < stops[sl, np.newaxis]).reshape(positions.shape + shape_extra)
+        positions = np.minimum(positions, len(values) - 1)
+        if isna is not None:
+            is_valid = is_valid & ~isna[positions]
+        with np.errstate(invalid='ignore'):
+            deviations = np.abs(values[positions] - means[sl, np.newaxis]) ** 2
+        post[sl] = np.where(is_valid, deviations, 0).sum(axis=1)
+    return post
+
+
+def _window_extreme(
+        values: np.ndarray,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        size: int,
+        ufunc: np.ufunc,
+        ) -> np.ndarray:
+    '''
+    Find the minimum or maximum of all windows in linear time (independent of window size) by combining accumulations within fixed blocks of ``size`` rows (van Herk / Gil-Werman). Windows shorter than size, clipped at the start or end of the array, are taken from accumulations of the entire array.
+    '''
+    count = len(values)
+    lengths = stops - starts
+    post = np.empty((len(starts),) + values.shape[1:], dtype=values.dtype)
+
+    is_full = lengths == size
+    if is_full.any():
+        count_block = -(-count // size)
+        padding = count_block * size - count
+        # values used for padding only inform accumulations that no full window reads
+        padded = np.concatenate((values, np.repeat(values[-1:], padding, axis=0)))
+        blocks = padded.reshape((count_block, size) + values.shape[1:])
+        prefix = ufunc.accumulate(blocks, axis=1).reshape(padded.shape)
+        suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(padded.shape)
+        post[is_full] = ufunc(suffix[starts[is_full]], prefix[stops[is_full] - 1])
+
+    is_head = ~is_full & (starts == 0) & (lengths > 0)
+    if is_head.any():
+        post[is_head] = ufunc.accumulate(values, axis=0)[stops[is_head] - 1]
+
+    is_tail = ~is_full & ~is_head & (lengths > 0)
+    if is_tail.any():
+        post[is_tail] = ufunc.accumulate(values[::-1], axis=0)[::-1][starts[is_tail]]
+
+    return post
+
+
+def array_window_reduce(
+        array: np.ndarray,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        *,
+        size: int,
+        func: str,
+        skipna: bool = True,
+        ddof: int = 0,
+        ) -> np.ndarray:
+    '''
+    Reduce windows of rows of a 1D or 2D array, as described by the ``starts`` and ``stops`` returned from ``window_positions``. Sum, mean, count, min, and max are found with block accumulations in linear time; std sums the squared deviations of each window from its mean. No work is done per window in Python.
+
+    Args:
+        size: the size of all windows not clipped at the start or end of the array.
+        func: one of ``WINDOW_REDUCE_FUNCS``.
+        skipna: if True, NaN, NaT, and None values are excluded from sum, mean, std, min, max, and count.
+        ddof: delta degrees of freedom for std.
+    '''
+    if func not in WINDOW_REDUCE_FUNCS:
+        raise RuntimeError(f'invalid reduction function: {func}')
+
+    values = array
+    lengths = (stops - starts).reshape((-1,) + (1,) * (values.ndim - 1))
+    is_empty = (stops - starts) == 0
+
+    if func in ('first', 'last', 'min', 'max'):
+        # positions of empty windows are clamped, then filled below
+        if func == 'first':
+            post = values[np.minimum(starts, len(values) - 1)]
+        elif func == 'last':
+            post = values[np.maximum(stops - 1, 0)]
+        else:
+            if values.dtype.kind in DTYPE_STR_KINDS:
+                values = values.astype(DTYPE_OBJECT)
+            if skipna:
+                ufunc = np.fmin if func == 'min' else np.fmax
+            else:
+                ufunc = np.minimum if func == 'min' else np.maximum
+            post = _window_extreme(values, starts, stops, size, ufunc)
+            if values is not array: # restore strings
+                post = post.astype(array.dtype)
+
+        if is_empty.any():
+            filled = full_for_fill(post.dtype,
+                    post.shape,
+                    dtype_kind_to_na(post.dtype.kind),
+                    )
+            filled[~is_empty] = post[~is_empty]
+            post = filled
+    else:
+        isna = isna_array(values) if values.dtype.kind not in DTYPE_STR_KINDS else None
+        has_na = isna is not None and isna.any()
+
+        if has_na:
+            counts_na = _window_sum(isna, starts, stops, size)
+            counts_valid = lengths - counts_na
+        else:
+            counts_valid = np.broadcast_to(lengths, (len(starts),) + values.shape[1:])
+
+        if func == 'count':
+            post = np.array(counts_valid if skipna else np.broadcast_to(lengths, counts_valid.shape))
+        else:
+            if values.dtype == DTYPE_BOOL:
+                values = values.astype(DTYPE_INT_DEFAULT)
+            if func == 'std':
+                # differences of means of equal values may not be zero; windows of equal values must have zero variance
+                is_constant = (_window_extreme(values, starts, stops, size, np.fmin)
+                        == _window_extreme(values, starts, stops, size, np.fmax))
+            if has_na:
+                values = values.copy() if values is array else values
+                values[isna] = 0
+
+            post = _window_sum(values, starts, stops, size)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                if func == 'mean':
+                    post = post / counts_valid
+                elif func == 'std':
+                    squares = _window_deviation_squares(values,
+                            isna if has_na else None,
+                            starts,
+                            stops,
+                            size,
+                            post / counts_valid,
+                            )
+                    variance = squares / (counts_valid - ddof)
+                    # windows of equal infinite values have no mean
+                    variance = np.where(is_constant & ~np.isnan(squares), 0, variance)
+                    variance[counts_valid - ddof <= 0] = np.nan
+                    post = np.sqrt(variance)
+
+            if has_na and not skipna:
+                post = post.astype(np.result_type(post.dtype, DTYPE_FLOAT_DEFAULT))
+                post[counts_na > 0] = np.nan
+
+    post.flags.writeable = False
+    return post
+
 
 #-------------------------------------------------------------------------------
 def array_shift(*,
@@ -2460,6 +3497,41 @@ def file_like_manager(
         if is_file:
             f.close()
 
+
+def mmap_close(buffer: mmap.mmap) -> None:
+    '''
+    Close ``buffer`` if no arrays or views use it; otherwise, it is closed when the last of them is released.
+    '''
+    try:
+        buffer.close()
+    except BufferError:
+        pass
+
+
+# the permission bits of files created with the process umask at import; os.umask can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE_DEFAULT = 0o666 & ~_UMASK
+
+@contextlib.contextmanager
+def path_replace_manager(fp: str) -> tp.Iterator[str]:
+    '''
+    Yield a temporary path, unique to this call and in the same directory as ``fp``, to write to; when the context exits without error, ``fp`` is replaced with it. Memory maps of a previous file at ``fp`` continue to view that file, rather than a file truncated or rewritten in place.
+    '''
+    fd, fp_temp = tempfile.mkstemp(suffix='.tmp',
+            prefix=f'{os.path.basename(fp)}.',
+            dir=os.path.dirname(fp) or None,
+            )
+    os.close(fd)
+    try:
+        # mkstemp creates files readable only by the owner; keep the permissions of a previous file, or of a new one
+        os.chmod(fp_temp, os.stat(fp).st_mode & 0o7777 if os.path.exists(fp) else _FILE_MODE_DEFAULT)
+        yield fp_temp
+        os.replace(fp_temp, fp)
+    finally:
+        if os.path.exists(fp_temp):
+            os.remove(fp_temp)
+
 #-------------------------------------------------------------------------------
 # trivial, non NP util
 
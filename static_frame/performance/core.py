@@ -1,4 +1,5 @@
 
+from io import StringIO
 import typing as tp
 import itertools as it
 import string
@@ -1338,3 +1339,241 @@ class FrameFrame_clip(PerfTest):
         np.clip(np_frame, 0, 1)
 
 
+
+class FrameInt_join_inner(PerfTest):
+    '''Inner join on an integer key column, with many left rows per right row. Scaling is O(n log n) in the sum of left and right lengths, not proportional to their product.
+    '''
+
+    NUMBER = 5
+
+    _lower = 2
+    _upper = 6
+
+    @staticmethod
+    def _get_frames(exponent: int) -> tp.Tuple[sf.Frame, sf.Frame]:
+        size = 10 ** exponent
+        f1 = sf.Frame.from_fields(
+                (np.arange(size) % (size // 10), np.arange(size) * 0.5),
+                columns=('key', 'a'),
+                )
+        f2 = sf.Frame.from_fields(
+                (np.arange(size // 10), np.arange(size // 10).astype(str)),
+                columns=('key', 'b'),
+                )
+        return f1, f2
+
+    @classmethod
+    def pd(cls) -> None:
+        for i in range(cls._lower, cls._upper):
+            f1, f2 = cls._get_frames(i)
+            f1.to_pandas().merge(f2.to_pandas(), on='key', how='inner')
+
+    @classmethod
+    def sf(cls) -> None:
+        for i in range(cls._lower, cls._upper):
+            f1, f2 = cls._get_frames(i)
+            f1.join_inner(f2, left_columns='key', right_columns='key', right_template='{}_right')
+
+class FrameDate_join_left(PerfTest):
+    '''Left join on sorted date indices, which merges keys without factorization.
+    '''
+
+    NUMBER = 5
+
+    _lower = 2
+    _upper = 6
+
+    @staticmethod
+    def _get_frames(exponent: int) -> tp.Tuple[sf.Frame, sf.Frame]:
+        size = 10 ** exponent
+        dates = np.arange(size).astype('datetime64[D]')
+        f1 = sf.Frame.from_fields(
+                (np.arange(size) * 0.5,),
+                columns=('a',),
+                index=sf.IndexDate(dates),
+                )
+        f2 = sf.Frame.from_fields(
+                (np.arange(size // 2),),
+                columns=('b',),
+                index=sf.IndexDate(dates[::2]),
+                )
+        return f1, f2
+
+    @classmethod
+    def pd(cls) -> None:
+        for i in range(cls._lower, cls._upper):
+            f1, f2 = cls._get_frames(i)
+            f1.to_pandas().join(f2.to_pandas(), how='left')
+
+    @classmethod
+    def sf(cls) -> None:
+        for i in range(cls._lower, cls._upper):
+            f1, f2 = cls._get_frames(i)
+            f1.join_left(f2,
+                    left_depth_level=0,
+                    right_depth_level=0,
+                    composite_index=False,
+                    )
+
+class FrameSecond_join_asof(PerfTest):
+    '''As-of join of trades to the prior quote, without creating a union of the indices.
+    '''
+
+    NUMBER = 5
+
+    _quotes = sf.Frame.from_fields(
+            (np.arange(100_000) * 0.5,),
+            columns=('bid',),
+            index=sf.IndexSecond(np.arange(0, 300_000, 3).astype('datetime64[s]')),
+            )
+    _trades = sf.Frame.from_fields(
+            (np.arange(200_000) * 0.25,),
+            columns=('px',),
+            index=sf.IndexSecond(np.arange(1, 400_001, 2).astype('datetime64[s]')),
+            )
+
+    @classmethod
+    def pd(cls) -> None:
+        pd.merge_asof(cls._trades.to_pandas(),
+                cls._quotes.to_pandas(),
+                left_index=True,
+                right_index=True,
+                )
+
+    @classmethod
+    def sf(cls) -> None:
+        cls._trades.join_asof(cls._quotes)
+
+
+class FrameMixed_iter_group_reduce(PerfTest):
+    '''Sum of many groups with vectorized reduction, without creating a Frame per group.
+    '''
+
+    NUMBER = 5
+
+    _frame = sf.Frame.from_fields(
+            (np.arange(1_000_000) % 100_000,
+            np.arange(1_000_000) * 0.5,
+            np.arange(1_000_000),
+            np.arange(1_000_000) % 3 == 0),
+            columns=('key', 'a', 'b', 'c'),
+            )
+
+    @classmethod
+    def pd(cls) -> None:
+        cls._frame.to_pandas().groupby('key').sum()
+
+    @classmethod
+    def sf(cls) -> None:
+        cls._frame.iter_group('key').reduce.sum()
+
+
+class FrameMixed_iter_group_multi_key(PerfTest):
+    '''Grouping on multiple columns of different types, factorizing each key column rather than creating a consolidated object array.
+    '''
+
+    NUMBER = 5
+
+    _frame = sf.Frame.from_fields(
+            (np.arange(200_000) % 50,
+            (np.arange(200_000) % 7).astype(str),
+            np.arange(200_000) % 3 == 0,
+            np.arange(200_000) * 0.5),
+            columns=('a', 'b', 'c', 'd'),
+            )
+
+    @classmethod
+    def pd(cls) -> None:
+        for _ in cls._frame.to_pandas().groupby(['a', 'b', 'c']):
+            pass
+
+    @classmethod
+    def sf(cls) -> None:
+        for _ in cls._frame.iter_group(['a', 'b', 'c']):
+            pass
+
+
+class SeriesFloat_iter_window_reduce(PerfTest):
+    '''Rolling mean and max over a long Series, without creating an array per window.
+    '''
+
+    NUMBER = 2
+
+    _series = sf.Series(np.arange(2_000_000) % 997 * 0.5)
+
+    @classmethod
+    def pd(cls) -> None:
+        s = cls._series.to_pandas()
+        s.rolling(250).mean()
+        s.rolling(250).max()
+
+    @classmethod
+    def sf(cls) -> None:
+        cls._series.iter_window(size=250).reduce.mean()
+        cls._series.iter_window(size=250).reduce.max()
+
+
+class SeriesFloat_iter_window_array_apply(PerfTest):
+    '''Percentile of large windows, given to a vectorized function as a single array of strided views rather than one array per window.
+    '''
+
+    NUMBER = 1
+
+    _series = sf.Series(np.arange(100_000) % 997 * 0.5)
+
+    @classmethod
+    def pd(cls) -> None:
+        cls._series.to_pandas().rolling(1000).quantile(0.9)
+
+    @classmethod
+    def sf(cls) -> None:
+        cls._series.iter_window_array(size=1000).reduce.apply(
+                lambda w: np.quantile(w, 0.9, axis=1))
+
+
+class FrameMixed_from_csv(PerfTest):
+    '''Loading a mixed-type CSV, evaluating each column in chunks rather than creating a structured array from all rows.
+    '''
+
+    NUMBER = 2
+
+    _sio = StringIO()
+    sf.Frame.from_fields(
+            (np.arange(200_000),
+            np.arange(200_000) * 0.5,
+            (np.arange(200_000) % 7).astype(str),
+            np.arange(200_000) % 3 == 0),
+            columns=('a', 'b', 'c', 'd'),
+            ).to_csv(_sio, include_index=False)
+    _text = _sio.getvalue()
+
+    @classmethod
+    def pd(cls) -> None:
+        pd.read_csv(StringIO(cls._text))
+
+    @classmethod
+    def sf(cls) -> None:
+        sf.Frame.from_csv(StringIO(cls._text))
+
+
+class FrameMixed_to_csv(PerfTest):
+    '''Writing a mixed-type CSV, formatting each column in bulk rather than each element.
+    '''
+
+    NUMBER = 2
+
+    _frame = sf.Frame.from_fields(
+            (np.arange(200_000),
+            np.arange(200_000) * 0.5,
+            (np.arange(200_000) % 7).astype(str),
+            np.arange(200_000) % 3 == 0),
+            columns=('a', 'b', 'c', 'd'),
+            )
+
+    @classmethod
+    def pd(cls) -> None:
+        cls._frame.to_pandas().to_csv(StringIO())
+
+    @classmethod
+    def sf(cls) -> None:
+        cls._frame.to_csv(StringIO())
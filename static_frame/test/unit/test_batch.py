@@ -1,10 +1,14 @@
+import os
+import sys
 import unittest
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import frame_fixtures as ff
 
 from static_frame.core.frame import Frame
+from static_frame.core.series import Series
 from static_frame.core.batch import Batch
 from static_frame.test.test_case import TestCase
 from static_frame.core.index_auto import IndexAutoFactory
@@ -21,6 +25,29 @@ def func1(f: Frame) -> Frame:
 def func2(label: tp.Hashable, f: Frame) -> Frame:
     return f.loc['q']
 
+def func3(label: tp.Hashable, f: Frame) -> Frame:
+    # the returned Frame cannot be pickled
+    return f.rename(lambda: label)
+
+def func4(f: Frame) -> Frame:
+    return f.rename(f.name())
+
+def func5(f1: Frame, f2: Frame) -> Frame:
+    return f1 + f2
+
+def func6(f: Frame) -> Series:
+    return f.sum()
+
+def func7(f: Frame) -> Frame:
+    if f.name == 'f2':
+        raise ValueError('f2')
+    return f
+
+def func8(f: Frame) -> Series:
+    if f.name == 'f3':
+        raise ValueError('f3')
+    return f.sum()
+
 class TestUnit(TestCase):
 
     def test_batch_slotted_a(self) -> None:
@@ -358,6 +385,231 @@ class TestUnit(TestCase):
         self.assertEqual(post.to_pairs(),
                 (('d', (('f3', 20),)), ('b', (('f3', 60),))))
 
+    @unittest.skipIf(sys.version_info < (3, 8), 'requires Python 3.8 shared memory')
+    def test_batch_apply_except_e(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=('x', 'y'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(d=(10,20), b=(50,60)),
+                index=('x', 'q'),
+                name='f2')
+
+        post = Batch.from_frames((f1, f2), max_workers=2, use_shared_memory=True
+                ).apply_except(func1, KeyError).to_frame()
+        self.assertEqual(post.to_pairs(),
+                (('d', (('f2', 20),)), ('b', (('f2', 60),))))
+
+    def test_batch_apply_except_f(self) -> None:
+
+        f1 = ff.parse('s(2,2)|v(int)').rename('f1')
+        f2 = ff.parse('s(2,2)|v(int)').rename('f2')
+        f3 = ff.parse('s(2,2)|v(int)').rename('f3')
+
+        for max_workers in (None, 2):
+            # only exceptions raised by the last stage are silenced
+            post = Batch.from_frames((f1, f3), max_workers=max_workers
+                    ).apply(func7).apply_except(func8, ValueError).to_frame()
+            self.assertEqual(post.index.values.tolist(), ['f1'])
+
+            with self.assertRaises(ValueError):
+                Batch.from_frames((f1, f2, f3), max_workers=max_workers
+                        ).apply(func7).apply_except(func8, ValueError).to_frame()
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'requires Python 3.8 shared memory')
+    def test_batch_use_shared_memory_a(self) -> None:
+
+        f1 = ff.parse('s(20,4)|v(int,float)|i(I,str)').rename('f1')
+        f2 = ff.parse('s(20,4)|v(str,bool)|i(I,str)').rename('f2')
+
+        b1 = Batch.from_frames((f1, f2), max_workers=2, use_shared_memory=True)
+        post = dict(b1.iloc[2:8].items())
+
+        self.assertTrue(post['f1'].equals(f1.iloc[2:8], compare_dtype=True, compare_class=True))
+        self.assertTrue(post['f2'].equals(f2.iloc[2:8], compare_dtype=True, compare_class=True))
+        self.assertFalse(post['f1']._blocks._blocks[0].flags.writeable)
+
+        post = Batch.from_frames((f1, f2), max_workers=2, use_shared_memory=True
+                ).sum().to_frame()
+        self.assertTrue(post.equals(
+                Batch.from_frames((f1, f2)).sum().to_frame()))
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'requires Python 3.8 shared memory')
+    def test_batch_use_shared_memory_b(self) -> None:
+        from multiprocessing.shared_memory import SharedMemory
+        from static_frame.core.shared_memory import shared_memory_decode
+        from static_frame.core.shared_memory import shared_memory_encode
+
+        f1 = ff.parse('s(20,4)|v(int,float,str)|i(I,str)').rename('f1')
+        payload, shm = shared_memory_encode(f1)
+        self.assertIsNotNone(payload.name)
+        shm.close()
+
+        f2 = shared_memory_decode(payload, unlink=True)
+        # the segment is released on restoration, and the restored Frame does not depend on it
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(payload.name)
+        self.assertTrue(f2.equals(f1, compare_dtype=True, compare_class=True))
+
+    @unittest.skipIf(sys.version_info < (3, 8) or not os.path.isdir('/dev/shm'),
+            'requires POSIX shared memory')
+    def test_batch_use_shared_memory_c(self) -> None:
+
+        def segments() -> tp.Set[str]:
+            return {n for n in os.listdir('/dev/shm') if n.startswith('psm_')}
+
+        frames = [ff.parse('s(20,4)|v(int,float)').rename(f'f{i}') for i in range(8)]
+        initial = segments()
+
+        # when a worker raises, no segments of arguments or results remain
+        with self.assertRaises(ValueError):
+            Batch.from_frames(frames, max_workers=2, use_shared_memory=True
+                    ).apply(func7).to_frame()
+        self.assertEqual(segments() - initial, set())
+
+        with self.assertRaises(ValueError):
+            Batch.from_frames(frames, max_workers=2, use_shared_memory=True
+                    ).apply_except(func7, KeyError).to_frame()
+        self.assertEqual(segments() - initial, set())
+
+        # nor when results are not fully consumed
+        b1 = Batch.from_frames(frames, max_workers=2, chunksize=3, use_shared_memory=True)
+        with b1.pool() as b2:
+            items = b2.apply(func6).items()
+            self.assertEqual(next(items)[0], 'f0')
+            items.close()
+        self.assertEqual(segments() - initial, set())
+
+    def test_batch_pool_a(self) -> None:
+
+        f1 = ff.parse('s(20,4)|v(int,float)|i(I,str)').rename('f1')
+        f2 = ff.parse('s(20,4)|v(int,bool)|i(I,str)').rename('f2')
+
+        b1 = Batch((('f1', f1), ('f2', f2)), max_workers=2)
+        with b1.pool() as b2:
+            self.assertIsNotNone(b2._executor)
+            post1 = b2.iloc[2:8].sum().to_frame()
+            # derived Batch share the executor
+            b3 = b2.apply(lambda f: f.iloc[:4])
+            self.assertIs(b3._executor, b2._executor)
+            post2 = b2.iloc[2:8].sum().to_frame()
+            # nested use does not create a new executor
+            with b2.pool() as b4:
+                self.assertIs(b4, b2)
+
+        self.assertTrue(post1.equals(post2))
+        self.assertTrue(post1.equals(
+                Batch.from_frames((f1, f2)).iloc[2:8].sum().to_frame()))
+
+    def test_batch_pool_b(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=('x', 'y'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(d=(10,20), b=(50,60)),
+                index=('x', 'q'),
+                name='f2')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            b1 = Batch((('f1', f1), ('f2', f2)), executor=executor, use_shared_memory=True)
+            self.assertFalse(b1._use_shared_memory_active())
+            post = b1.apply_except(func1, KeyError).to_frame()
+            self.assertEqual(post.to_pairs(),
+                    (('d', (('f2', 20),)), ('b', (('f2', 60),))))
+            # the executor remains available
+            post = b1.apply(lambda f: f.sum()).to_frame()
+            self.assertEqual(post['b'].to_pairs(), (('f1', 7), ('f2', 110)))
+
+    def test_batch_fusion_a(self) -> None:
+
+        f1 = ff.parse('s(20,4)|v(int,float)|i(I,str)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(20,4)|v(int,bool)|i(I,str)|c(I,str)').rename('f2')
+
+        b1 = Batch((('f1', f1), ('f2', f2)), max_workers=2)
+        b2 = b1.apply_items(func3).apply(func4).iloc[2:8].sum()
+        self.assertEqual(len(b2._source_stages[1]), 4)
+
+        # intermediate results are never pickled
+        post = b2.to_frame()
+        self.assertTrue(post.equals(
+                Batch((('f1', f1), ('f2', f2))).iloc[2:8].sum().to_frame()))
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'requires Python 3.8 shared memory')
+    def test_batch_fusion_b(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=('x', 'y'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(d=(10,20), b=(50,60)),
+                index=('x', 'q'),
+                name='f2')
+
+        b1 = Batch((('f1', f1), ('f2', f2)), max_workers=2, use_shared_memory=True)
+        post = (b1 * 2).apply_except(func1, KeyError).to_frame()
+        self.assertEqual(post.to_pairs(),
+                (('d', (('f2', 40),)), ('b', (('f2', 120),))))
+
+        # evaluated Batch do not extend stages
+        b2 = Batch(tuple((b1 * 2).items()), max_workers=2)
+        self.assertIs(b2._source_stages, None)
+        self.assertEqual((b2 + 1).to_frame().sum().sum(), 308)
+
+    def test_batch_reduce_a(self) -> None:
+
+        f = ff.parse('s(6,3)|v(int)')
+        frames = [(f * i).rename(str(i)) for i in range(5)]
+        b1 = Batch(tuple((f.name, f) for f in frames))
+        post1 = b1.reduce(func5)
+        self.assertTrue(post1.equals(f * 10))
+
+        b2 = Batch(tuple((f.name, f) for f in frames), max_workers=2)
+        post2 = b2.reduce(func5)
+        self.assertTrue(post1.equals(post2, compare_dtype=True))
+
+        post3 = b2.reduce(func5, initial=frames[0])
+        self.assertTrue(post3.equals(func5(post1, frames[0])))
+
+        # fused stages are evaluated within the pool
+        post4 = b2.iloc[:2].reduce(func5)
+        self.assertEqual(post4.to_pairs(),
+                b1.iloc[:2].reduce(func5).to_pairs())
+
+    def test_batch_reduce_b(self) -> None:
+
+        with self.assertRaises(RuntimeError):
+            Batch(()).reduce(func5)
+        with self.assertRaises(RuntimeError):
+            Batch((), max_workers=2).reduce(func5)
+
+        self.assertEqual(Batch(()).reduce(func5, initial=0), 0)
+        self.assertEqual(Batch((), max_workers=2).reduce(func5, initial=0), 0)
+
+        f1 = ff.parse('s(3,2)|v(int)').rename('a')
+        post = Batch((('a', f1),), max_workers=2).apply(func6).reduce(func5)
+        self.assertEqual(post.to_pairs(), f1.sum().to_pairs())
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'requires Python 3.8 shared memory')
+    def test_batch_map_reduce_a(self) -> None:
+
+        f = ff.parse('s(6,3)|v(int)')
+        frames = [(f * i).rename(str(i)) for i in range(7)]
+        b1 = Batch(tuple((f.name, f) for f in frames))
+        post1 = b1.map_reduce(func6, func5)
+        self.assertEqual(post1.to_pairs(), (f.sum() * 21).to_pairs())
+
+        b2 = Batch(tuple((f.name, f) for f in frames),
+                max_workers=3,
+                use_shared_memory=True,
+                )
+        post2 = b2.map_reduce(func6, func5, initial=1)
+        self.assertEqual(post2.to_pairs(), (post1 + 1).to_pairs())
+
     #---------------------------------------------------------------------------
     def test_batch_apply_items_a(self) -> None:
 
@@ -1,9 +1,12 @@
 import unittest
+import os
+import threading
 from datetime import date
 from datetime import datetime
 # from io import StringIO
 import typing as tp
 import numpy as np
+import frame_fixtures as ff
 
 from static_frame.core.frame import Frame
 from static_frame.core.bus import Bus
@@ -188,6 +191,52 @@ class TestUnit(TestCase):
                     (('f1', None), ('f2', (3, 2)), ('f3', (2, 2 )))
                     )
 
+    def test_bus_shapes_b(self) -> None:
+        f1 = ff.parse('s(2,2)').rename('f1')
+        f2 = ff.parse('s(3,2)').rename('f2')
+
+        with temp_file('.zip') as fp:
+            Bus.from_frames((f1, f2)).to_zip_pickle(fp,
+                    config=StoreConfig(write_manifest=True))
+            b1 = Bus.from_zip_pickle(fp)
+
+            # shapes of unloaded Frame are read from the manifest
+            self.assertEqual(b1.shapes.to_pairs(),
+                    (('f1', (2, 2)), ('f2', (3, 2))))
+            self.assertFalse(b1._loaded.any())
+
+    def test_bus_from_zip_npy_a(self) -> None:
+        f1 = ff.parse('s(4,4)|v(int,float)').rename('f1')
+        f2 = ff.parse('s(4,4)|v(str)|i(ID,dtD)').rename('f2')
+        f3 = ff.parse('s(2,4)|v(bool)|c(IH,(str,int))').rename('f3')
+
+        b1 = Bus.from_frames((f1, f2, f3))
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npy(fp)
+            b2 = Bus.from_zip_npy(fp, max_persist=2)
+
+            self.assertTrue(b2['f2'].equals(f2, compare_dtype=True, compare_class=True))
+            self.assertTrue(b2['f3'].equals(f3, compare_dtype=True, compare_class=True))
+            self.assertTrue(b2['f1'].equals(f1, compare_dtype=True, compare_class=True))
+            self.assertEqual(b2.status['loaded'].to_pairs(),
+                    (('f1', True), ('f2', False), ('f3', True)))
+
+    def test_bus_from_zip_npy_b(self) -> None:
+        f1 = Frame(np.arange(100_000).reshape(10_000, 10), name='f1')
+        f2 = Frame(np.arange(4).reshape(2, 2), name='f2')
+
+        with temp_file('.zip') as fp:
+            Bus.from_frames((f1,)).to_zip_npy(fp)
+            f3 = Bus.from_zip_npy(fp)['f1']
+            # writing to the same path replaces the archive that f3 views
+            Bus.from_frames((f2,)).to_zip_npy(fp)
+            self.assertEqual(f3.values.sum(), f1.values.sum())
+            self.assertTrue(Bus.from_zip_npy(fp)['f2'].equals(f2))
+            dir_name, base_name = os.path.split(fp)
+            self.assertFalse(any(name.startswith(base_name) and name.endswith('.tmp')
+                    for name in os.listdir(dir_name)))
+
     @skip_win # type: ignore
     def test_bus_nbytes_a(self) -> None:
         f1 = Frame.from_dict(
@@ -257,6 +306,23 @@ class TestUnit(TestCase):
                     (('b', (('f1', None), ('f2', np.dtype('int64')), ('f3', np.dtype('int64')))), ('c', (('f1', None), ('f2', np.dtype('int64')), ('f3', None))), ('d', (('f1', None), ('f2', None), ('f3', np.dtype('int64')))))
                     )
 
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp, config=StoreConfig(write_manifest=True))
+            b2 = Bus.from_zip_pickle(fp)
+
+            # dtypes of unloaded Frame are read from the manifest
+            post = b2.dtypes.to_pairs(0)
+            self.assertEqual(post,
+                    (('a', (('f1', np.dtype('int64')), ('f2', None), ('f3', None))), ('b', (('f1', np.dtype('int64')), ('f2', np.dtype('int64')), ('f3', np.dtype('int64')))), ('c', (('f1', None), ('f2', np.dtype('int64')), ('f3', None))), ('d', (('f1', None), ('f2', None), ('f3', np.dtype('int64')))))
+                    )
+            self.assertFalse(b2._loaded.any())
+
+            f2_loaded = b2['f2']
+            self.assertEqual(b2.dtypes.to_pairs(0), post)
+
+            f3_loaded = b2['f3']
+            self.assertEqual(b2.dtypes.to_pairs(0), post)
+
 
     @skip_win # type: ignore
     def test_bus_status_a(self) -> None:
@@ -288,6 +354,37 @@ class TestUnit(TestCase):
                     b2.status.to_pairs(0),                                                           (('loaded', (('f1', True), ('f2', True), ('f3', True))), ('size', (('f1', 4.0), ('f2', 6.0), ('f3', 4.0))), ('nbytes', (('f1', 32.0), ('f2', 48.0), ('f3', 32.0))),('shape', (('f1', (2, 2)), ('f2', (3, 2)), ('f3', (2, 2)))))
             )
 
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp, config=StoreConfig(write_manifest=True))
+            b2 = Bus.from_zip_pickle(fp)
+
+            # unloaded Frame are described by the manifest
+            self.assertEqual(b2.status.drop['loaded'].to_pairs(0),
+                    (('size', (('f1', 4.0), ('f2', 6.0), ('f3', 4.0))), ('nbytes', (('f1', 32.0), ('f2', 48.0), ('f3', 32.0))),('shape', (('f1', (2, 2)), ('f2', (3, 2)), ('f3', (2, 2)))))
+            )
+
+    def test_bus_status_b(self) -> None:
+        f1 = ff.parse('s(2,3)|v(int,str,bool)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(4,3)|v(int,str,bool)|c(I,str)').rename('f2')
+        config = StoreConfig(index_depth=1, columns_depth=1, include_index=True,
+                write_manifest=True)
+
+        with temp_file('.zip') as fp:
+            Bus.from_frames((f1, f2)).to_zip_parquet(fp, config=config)
+
+            # only shapes are valid for Frame as read from parquet
+            b1 = Bus.from_zip_parquet(fp, config=config)
+            status = b1.status
+            self.assertEqual(status['shape'].to_pairs(), (('f1', (2, 3)), ('f2', (4, 3))))
+            self.assertEqual(status['size'].values.tolist(), [6.0, 12.0])
+            self.assertTrue(status['nbytes'].isna().all())
+            self.assertEqual(b1.dtypes.shape, (2, 0))
+
+            # a config that reads a differently shaped Frame does not use the manifest
+            b2 = Bus.from_zip_parquet(fp, config=StoreConfig(index_depth=0))
+            self.assertEqual(b2.shapes.to_pairs(), (('f1', None), ('f2', None)))
+            self.assertEqual(b2['f1'].shape, (2, 4))
+
 
     def test_bus_keys_a(self) -> None:
         f1 = Frame.from_dict(
@@ -1420,7 +1517,168 @@ class TestUnit(TestCase):
             self.assertEqual(b2._loaded.tolist(),
                     [False, False, False, False, True])
 
+    def test_bus_max_persist_bytes_a(self) -> None:
+        def items() -> tp.Iterator[tp.Tuple[str, Frame]]:
+            for i in range(1, 7):
+                yield str(i), Frame(np.arange(i * 10).reshape(i * 2, 5))
+
+        b1 = Bus(Series.from_items(items(), dtype=object))
+        nbytes = {label: f.nbytes for label, f in b1.items()}
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+
+            b2 = Bus.from_zip_pickle(fp, max_persist_bytes=nbytes['4'])
+            _ = b2['1']
+            _ = b2['2']
+            self.assertEqual(b2.nbytes, nbytes['1'] + nbytes['2'])
+
+            # the least-recently accessed are evicted until within the budget
+            _ = b2['3']
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, True, False, False, False])
+            _ = b2['1']
+            self.assertEqual(b2._loaded.tolist(),
+                    [True, False, True, False, False, False])
+            self.assertEqual(b2.nbytes, b2._persist_bytes)
+
+            # a Frame larger than the budget is retained alone
+            _ = b2['6']
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, False, False, True])
+            self.assertEqual(b2.nbytes, nbytes['6'])
+
+            # iteration loads one Frame at a time
+            post = b2.values
+            self.assertTrue(all(isinstance(f, Frame) for f in post))
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, False, False, True])
+
+    def test_bus_max_persist_bytes_b(self) -> None:
+        def items() -> tp.Iterator[tp.Tuple[str, Frame]]:
+            for i in range(1, 7):
+                yield str(i), Frame(np.arange(i * 10).reshape(i * 2, 5))
+
+        b1 = Bus(Series.from_items(items(), dtype=object))
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+
+            b2 = Bus.from_zip_pickle(fp, max_persist=2, max_persist_bytes=10_000)
+            b3 = b2.iloc[2:]
+            self.assertEqual(b3._max_persist_bytes, 10_000)
+            self.assertEqual(b2._loaded.sum(), 2)
+
+            _ = b2['1']
+            _ = b2['2']
+            _ = b2['3']
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, True, True, False, False, False])
+
+
+    def test_bus_prefetch_a(self) -> None:
+        def items() -> tp.Iterator[tp.Tuple[str, Frame]]:
+            for i in range(8):
+                yield str(i), Frame(np.arange(i, i+10).reshape(2, 5))
+
+        b1 = Bus(Series.from_items(items(), dtype=object))
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
 
+            b2 = Bus.from_zip_pickle(fp, max_persist=3, prefetch=2)
+            _ = b2['1']
+            for (label, f1), (_, f2) in zip(b2.items(), b1.items()):
+                self.assertTrue(f1.equals(f2))
+                self.assertTrue(b2._loaded.sum() <= 3)
+                self.assertTrue(b2[label] is f1)
+
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, False, False, True, True, True])
+
+            # iteration of elements does not load Frame
+            post = list(b2.iter_element())
+            self.assertEqual(sum(f is FrameDeferred for f in post), 5)
+
+            b3 = Bus.from_zip_pickle(fp, prefetch=4)
+            self.assertEqual(b3.rename('x')._prefetch, 4)
+            # stopping iteration early stops reading
+            for label, _ in b3.items():
+                if label == '2':
+                    break
+            self.assertEqual(b3._loaded.tolist(),
+                    [True, True, True, False, False, False, False, False])
+            self.assertEqual(len(b3.values), 8)
+            self.assertTrue(b3._loaded_all)
+
+    def test_bus_prefetch_b(self) -> None:
+        with self.assertRaises(ErrorInitBus):
+            Bus(Series((ff.parse('s(2,2)'),), dtype=object), prefetch=0)
+
+        f1 = ff.parse('s(2,2)').rename('a')
+        f2 = ff.parse('s(2,2)').rename('b')
+        with temp_file('.zip') as fp:
+            Bus.from_frames((f1, f2)).to_zip_pickle(fp)
+            b1 = Bus.from_zip_pickle(fp, prefetch=1)
+
+        # file has been removed: the reader's exception is raised on iteration
+        with self.assertRaises(StoreFileMutation):
+            tuple(b1.items())
+
+    def test_bus_prefetch_c(self) -> None:
+        from static_frame.core.store_zip import StoreZipPickle
+        from static_frame.core.store_hdf5 import StoreHDF5
+
+        idents = []
+        labels_read: tp.List[tp.Hashable] = []
+
+        def read_many_record(cls: tp.Type[tp.Any]) -> tp.Any:
+            def func(self: tp.Any, labels: tp.Iterable[tp.Hashable], **kwargs: tp.Any) -> tp.Any:
+                idents.append(threading.get_ident())
+                labels = list(labels)
+                labels_read.extend(labels)
+                return cls.read_many(self, labels, **kwargs)
+            return func
+
+        class StoreZipPickleRecord(StoreZipPickle):
+            read_many = read_many_record(StoreZipPickle)
+
+        class StoreHDF5Record(StoreHDF5):
+            read_many = read_many_record(StoreHDF5)
+
+        b1 = Bus.from_frames([ff.parse('s(2,2)|c(I,str)').rename(str(i)) for i in range(8)])
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+            b2 = Bus._from_store(StoreZipPickleRecord(fp), max_persist=2, prefetch=2)
+            _ = b2.iloc[6:]
+            idents.clear()
+            labels_read.clear()
+            # Frames loaded when iteration starts are evicted before being reached; no read is made outside of the reader thread
+            post = [label for label, _ in b2.items()]
+            self.assertEqual(len(post), 8)
+            self.assertTrue(idents)
+            self.assertNotIn(threading.get_ident(), idents)
+            # each Frame is read once
+            self.assertEqual(sorted(labels_read), [str(i) for i in range(8)])
+
+            # only Frames deferred when iteration starts are read if none are evicted
+            b4 = Bus._from_store(StoreZipPickleRecord(fp), max_persist=8, prefetch=2)
+            _ = b4.iloc[2:]
+            labels_read.clear()
+            post = [label for label, _ in b4.items()]
+            self.assertEqual(len(post), 8)
+            self.assertEqual(labels_read, ['0', '1'])
+            self.assertTrue(b4._loaded_all)
+
+        idents.clear()
+        with temp_file('.h5') as fp:
+            b1.to_hdf5(fp)
+            b3 = Bus._from_store(StoreHDF5Record(fp), max_persist=2, prefetch=2)
+            post = [label for label, _ in b3.items()]
+            self.assertEqual(len(post), 8)
+            # prefetch is not used with stores that are not thread safe
+            self.assertEqual(set(idents), {threading.get_ident()})
 
     #---------------------------------------------------------------------------
     def test_bus_sort_index_a(self) -> None:
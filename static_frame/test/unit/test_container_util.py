@@ -16,6 +16,7 @@ from static_frame.core.container_util import pandas_to_numpy
 from static_frame.core.container_util import pandas_version_under_1
 from static_frame.core.container_util import apex_to_name
 from static_frame.core.container_util import apply_binary_operator_blocks_columnar
+from static_frame.core.container_util import index_to_ilocs
 
 from static_frame.test.test_case import TestCase
 
@@ -625,5 +626,21 @@ class TestUnit(TestCase):
                 [[0, 0, 1, 0], [0, 0, 0, 0], [2, 4, 5, 20]])
 
 
+    #---------------------------------------------------------------------------
+    def test_index_to_ilocs_a(self) -> None:
+        idx1 = IndexDate(('2021-01-01', '2021-01-03', '2021-01-04'))
+        idx2 = IndexDate(('2021-01-03', '2021-01-02', '2021-01-01'))
+        self.assertEqual(index_to_ilocs(idx1, idx2).tolist(), [1, -1, 0])
+        self.assertEqual(index_to_ilocs(idx1, Index(())).tolist(), [])
+
+    def test_index_to_ilocs_b(self) -> None:
+        ih1 = IndexHierarchy.from_product(('a', 'b'), (1, 2))
+        ih2 = IndexHierarchy.from_labels((('b', 2), ('c', 1), ('a', 2)))
+        self.assertEqual(index_to_ilocs(ih1, ih2).tolist(), [3, -1, 1])
+
+        idx = Index((('b', 2), 'x', ('a', 1)))
+        self.assertEqual(index_to_ilocs(ih1, idx).tolist(), [3, -1, 0])
+
+
 if __name__ == '__main__':
     unittest.main()
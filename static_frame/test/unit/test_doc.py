@@ -2439,6 +2439,7 @@ to_hdf5(fp, *, config)        Bus      Exporter Write the complet...
 to_sqlite(fp, *, config)      Bus      Exporter Write the complet...
 to_xlsx(fp, *, config)        Bus      Exporter Write the complet...
 to_zip_csv(fp, *, config)     Bus      Exporter Write the complet...
+to_zip_npy(fp, *, config)     Bus      Exporter Write the complet...
 to_zip_parquet(fp, *, config) Bus      Exporter Write the complet...
 to_zip_pickle(fp, *, config)  Bus      Exporter Write the complet...
 to_zip_tsv(fp, *, config)     Bus      Exporter Write the complet...
@@ -11,6 +11,7 @@ import typing as tp
 import unittest
 import os
 import io
+import tempfile
 
 import numpy as np
 import frame_fixtures as ff
@@ -35,12 +36,15 @@ from static_frame import TypeBlocks
 from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorInitFrame
 from static_frame.core.exception import ErrorInitIndex
+from static_frame.core.exception import ErrorNPYEncode
 from static_frame.core.frame import FrameAssignILoc
 from static_frame.core.frame import FrameAssignBLoc
 from static_frame.core.store import StoreConfig
 from static_frame.core.store_filter import StoreFilter
 from static_frame.core.store_xlsx import StoreXLSX
 from static_frame.core.util import STORE_LABEL_DEFAULT
+from static_frame.core.util import delimited_ranges
+from static_frame.core import util
 from static_frame.test.test_case import skip_pylt37
 from static_frame.test.test_case import skip_win
 from static_frame.test.test_case import temp_file
@@ -1194,11 +1198,15 @@ class TestUnit(TestCase):
         with temp_file('.parquet') as fp:
             f1.to_parquet(fp)
 
-            with self.assertRaises(ErrorInitFrame):
-                _ = Frame.from_parquet(fp,
-                        index_depth=1, # cannot use with columns_selectg
-                        columns_select=('d', 'a'),
-                        columns_depth=1)
+            # index fields are read with the selected columns
+            f3 = Frame.from_parquet(fp,
+                    index_depth=1,
+                    columns_select=('d', 'a'),
+                    columns_depth=1)
+            self.assertEqual(f3.to_pairs(0),
+                    (('d', ((0, False), (1, True), (2, False), (3, True))), ('a', ((0, 1), (1, 30), (2, 54), (3, 65))))
+                    )
+            self.assertTrue(f3.index._map is not None)
 
             f2 = Frame.from_parquet(fp,
                     index_depth=0,
@@ -5450,7 +5458,7 @@ class TestUnit(TestCase):
                 )
 
         self.assertEqual(f1.dtypes.values.tolist(),
-                [np.dtype('int64'), np.dtype('<U21'), np.dtype('int64')]
+                [np.dtype('int64'), np.dtype('<U1'), np.dtype('int64')]
                 )
 
     def test_frame_from_csv_j(self) -> None:
@@ -5469,11 +5477,164 @@ class TestUnit(TestCase):
 
     def test_frame_from_csv_k(self) -> None:
         s1 = StringIO('1\t2\t3\t4\n')
-        f1 = Frame.from_csv(s1, index_depth=0, columns_depth=0)
+        f1 = Frame.from_tsv(s1, index_depth=0, columns_depth=0)
         self.assertEqual(f1.to_pairs(0),
                 ((0, ((0, 1),)), (1, ((0, 2),)), (2, ((0, 3),)), (3, ((0, 4),)))
                 )
 
+        # the delimiter of a CSV is not a tab
+        s2 = StringIO('1\t2\t3\t4\n')
+        f2 = Frame.from_csv(s2, index_depth=0, columns_depth=0)
+        self.assertEqual(f2.to_pairs(0),
+                ((0, ((0, '1\t2\t3\t4'),)),)
+                )
+
+    def test_frame_from_csv_l(self) -> None:
+        s1 = StringIO('a,b,c,d\n1,"x,y",001,\n2,z,002,\n')
+        f1 = Frame.from_csv(s1, dtypes=dict(c=str))
+        self.assertEqual(f1.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype('<U3'), np.dtype('<U3'), np.dtype(float)])
+        self.assertEqual(f1['c'].values.tolist(), ['001', '002'])
+        self.assertEqual(f1['b'].values.tolist(), ['x,y', 'z'])
+
+    def test_frame_from_csv_m(self) -> None:
+        s1 = StringIO('a,b,c,d\n1,x,True,0.5\n2,y,False,1.5\n')
+        f1 = Frame.from_csv(s1,
+                index_depth=1,
+                index_column_first='b',
+                columns_select=('d', 'a'),
+                )
+        self.assertEqual(f1.to_pairs(0),
+                (('a', (('x', 1), ('y', 2))), ('d', (('x', 0.5), ('y', 1.5))))
+                )
+
+        s2 = StringIO('a,b\n1,2\n')
+        with self.assertRaises(ErrorInitFrame):
+            Frame.from_csv(s2, columns_select=('a', 'c'))
+
+        s3 = StringIO('1,2\n')
+        with self.assertRaises(ErrorInitFrame):
+            Frame.from_csv(s3, columns_depth=0, columns_select=('a',))
+
+    def test_frame_from_csv_n(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,str,bool,float)')
+        with temp_file('.csv') as fp:
+            with open(fp, 'w') as f:
+                f.write('junk\n')
+                f1.to_csv(f, include_index=False)
+                f.write('junk\n')
+
+            f2 = Frame.from_csv(fp, skip_header=1, skip_footer=1, max_workers=2)
+            f3 = Frame.from_csv(fp, skip_header=1, skip_footer=1)
+            self.assertTrue(f2.equals(f3, compare_dtype=True))
+            self.assertEqual(f2.shape, (20, 4))
+
+            f4 = Frame.from_csv(fp, skip_header=1, skip_footer=1, max_workers=2, columns_select=(3,))
+            self.assertEqual(f4.columns.values.tolist(), [3])
+
+    def test_frame_from_csv_o(self) -> None:
+        # most newlines are within quoted fields, such that range boundaries must be found with quote parity
+        rows = [f'{i},"a,\n""{i}""\nb\nc\nd",{i * 0.5}\n' for i in range(200)]
+        with temp_file('.csv') as fp:
+            with open(fp, 'w') as f:
+                f.write('junk\nx,y,z\n' + ''.join(rows) + 'junk\n"junk\njunk"\n')
+
+            f1 = Frame.from_csv(fp, skip_header=1, skip_footer=2)
+            self.assertEqual(f1.shape, (200, 3))
+            self.assertEqual(f1['y'].values.tolist(), [f'a,\n"{i}"\nb\nc\nd' for i in range(200)])
+
+            # ranges are at least 4 MB by default; use small ranges to parse this file in parts
+            size_min = util.DELIMITED_RANGE_SIZE_MIN
+            util.DELIMITED_RANGE_SIZE_MIN = 64
+            try:
+                for max_workers in (2, 3, 7):
+                    self.assertEqual(len(delimited_ranges(fp,
+                            start=14,
+                            count=max_workers,
+                            quote_char='"',
+                            )), max_workers)
+                    f2 = Frame.from_csv(fp, skip_header=1, skip_footer=2, max_workers=max_workers)
+                    self.assertTrue(f2.equals(f1, compare_dtype=True))
+            finally:
+                util.DELIMITED_RANGE_SIZE_MIN = size_min
+
+    def test_frame_from_csv_p(self) -> None:
+        # column types are evaluated independently of where rows are broken into chunks
+        count = util.DELIMITED_CHUNK_SIZE + 10
+        s1 = StringIO('a,b\n' + '1,True\n' * count + 'x,a\n')
+        f1 = Frame.from_csv(s1)
+        self.assertEqual(f1.dtypes.values.tolist(), [np.dtype('<U1'), np.dtype('<U4')])
+        self.assertEqual(f1['a'].values[[0, -2, -1]].tolist(), ['1', '1', 'x'])
+        self.assertEqual(f1['b'].values[[0, -1]].tolist(), ['True', 'a'])
+
+        s2 = StringIO('a\n' + '1\n' * count + '1.5\n')
+        f2 = Frame.from_csv(s2)
+        self.assertEqual(f2.dtypes.values.tolist(), [np.dtype(float)])
+
+    def test_frame_from_csv_q(self) -> None:
+        # column types are evaluated independently of where the file is broken into ranges
+        rows = ['1,True,1,\n'] * 100 + ['2,True,,\n'] * 100 + ['a,1.5,1.5,\n']
+        with temp_file('.csv') as fp:
+            with open(fp, 'w') as f:
+                f.write('w,x,y,z\n' + ''.join(rows))
+
+            f1 = Frame.from_csv(fp)
+            self.assertEqual(f1.dtypes.values.tolist(),
+                    [np.dtype('<U1'), np.dtype('<U4'), np.dtype(float), np.dtype(float)])
+
+            size_min = util.DELIMITED_RANGE_SIZE_MIN
+            util.DELIMITED_RANGE_SIZE_MIN = 64
+            try:
+                for max_workers in (2, 3):
+                    f2 = Frame.from_csv(fp, max_workers=max_workers)
+                    self.assertTrue(f2.equals(f1, compare_dtype=True))
+            finally:
+                util.DELIMITED_RANGE_SIZE_MIN = size_min
+
+    def test_frame_from_delimited_iter_a(self) -> None:
+        s1 = StringIO('a,b,c\n' + '\n'.join(
+                f'{i},{i * 0.5},{"x" * (i % 3 + 1)}' for i in range(10)))
+        frames = list(Frame.from_delimited_iter(s1, delimiter=',', chunksize=4))
+        self.assertEqual([f.shape for f in frames], [(4, 3), (4, 3), (2, 3)])
+        self.assertEqual([f.name for f in frames], [0, 1, 2])
+        self.assertEqual(frames[2].index.values.tolist(), [8, 9])
+        self.assertEqual(frames[2].dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(float), np.dtype('<U3')])
+
+        s1.seek(0)
+        f1 = Frame.from_csv(s1)
+        f2 = Frame.from_concat(frames)
+        self.assertTrue(f1.equals(f2, compare_dtype=False))
+
+        s1.seek(0)
+        b1 = sf.Batch.from_frames(Frame.from_delimited_iter(s1,
+                delimiter=',',
+                chunksize=4,
+                columns_select=('a',),
+                ))
+        self.assertEqual(b1.sum().to_frame().to_pairs(0),
+                (('a', ((0, 6), (1, 22), (2, 17))),))
+
+    def test_frame_from_delimited_iter_b(self) -> None:
+        s1 = StringIO('a,b\n1,2\n3,4\n5,\n')
+        with self.assertRaises(ErrorInitFrame):
+            # later chunk cannot be an int
+            _ = list(Frame.from_delimited_iter(s1, delimiter=',', chunksize=2))
+
+        s1.seek(0)
+        frames = list(Frame.from_delimited_iter(s1,
+                delimiter=',',
+                chunksize=2,
+                dtypes=dict(b=float),
+                index_depth=1,
+                ))
+        self.assertEqual([f.dtypes.values.tolist() for f in frames],
+                [[np.dtype(float)], [np.dtype(float)]])
+        self.assertEqual(frames[1].index.values.tolist(), [5])
+
+        s2 = StringIO('a,b\n')
+        self.assertEqual(list(Frame.from_delimited_iter(s2, delimiter=',')), [])
+
     #---------------------------------------------------------------------------
 
     @skip_win  # type: ignore
@@ -6780,6 +6941,76 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
+    def test_frame_to_npy_dir_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,float,bool,str)|i(IH,(str,int))|c(ID,dtD)').rename(('a', 1))
+
+        with tempfile.TemporaryDirectory() as fp:
+            f1.to_npy_dir(fp)
+            f2 = Frame.from_npy_dir(fp)
+            self.assertTrue(f1.equals(f2, compare_name=True, compare_dtype=True, compare_class=True))
+
+            f3 = Frame.from_npy_dir(fp, memory_map=True)
+            self.assertTrue(f1.equals(f3, compare_name=True, compare_dtype=True, compare_class=True))
+            self.assertEqual(f3.name, ('a', 1))
+            self.assertFalse(f3._blocks._blocks[0].flags.writeable)
+            self.assertEqual(f3._blocks._blocks[0].__class__, np.ndarray)
+            del f3
+
+    def test_frame_to_npy_dir_b(self) -> None:
+        f1 = FrameGO(np.arange(12).reshape(3, 4), columns=('a', 'b', 'c', 'd'))
+
+        with tempfile.TemporaryDirectory() as fp:
+            f1.to_npy_dir(fp)
+            f2 = FrameGO.from_npy_dir(fp, memory_map=True)
+            self.assertIs(f2.index._map, None) # auto index is not hashed
+            f2['e'] = -1
+            self.assertEqual(f2.to_pairs(0)[-1], ('e', ((0, -1), (1, -1), (2, -1))))
+
+            f3 = Frame.from_npy_dir(fp)
+            self.assertEqual(f3.columns.__class__, Index)
+            self.assertEqual(f3.shape, (3, 4))
+
+    def test_frame_to_npy_dir_d(self) -> None:
+        f1 = Frame(np.arange(100_000).reshape(10_000, 10))
+        f2 = Frame(np.arange(4).reshape(2, 2))
+
+        with tempfile.TemporaryDirectory() as fp:
+            f1.to_npy_dir(fp)
+            f3 = Frame.from_npy_dir(fp, memory_map=True)
+            # memory mapped files are replaced, not truncated
+            f2.to_npy_dir(fp)
+            self.assertEqual(f3.values.sum(), f1.values.sum())
+            self.assertTrue(Frame.from_npy_dir(fp).equals(f2, compare_dtype=True))
+            self.assertFalse(any(name.endswith('.tmp') for name in os.listdir(fp)))
+            del f3
+
+    def test_frame_to_npy_dir_e(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1.0, 2.0, 3.0), b=(1, 2, 3)))
+        f2 = Frame.from_dict(dict(a=f1['a'].values + 100, b=(1, 'x', 3)))
+
+        with tempfile.TemporaryDirectory() as fp:
+            f1.to_npy_dir(fp)
+            with self.assertRaises(ErrorNPYEncode):
+                f2.to_npy_dir(fp)
+            # a failed write leaves the existing files unchanged
+            self.assertTrue(Frame.from_npy_dir(fp).equals(f1, compare_dtype=True))
+            self.assertFalse(any(name.endswith('.tmp') for name in os.listdir(fp)))
+
+    def test_frame_to_npy_dir_c(self) -> None:
+        with tempfile.TemporaryDirectory() as fp:
+            with self.assertRaises(ErrorNPYEncode):
+                Frame.from_elements((None, 'a')).to_npy_dir(fp)
+            with self.assertRaises(ErrorNPYEncode):
+                Frame.from_elements((1, 2), name=datetime.date(2020, 1, 1)).to_npy_dir(fp)
+            with self.assertRaises(ErrorInitFrame):
+                Frame.from_npy_dir(os.path.join(fp, 'missing'))
+
+            f1 = Frame(index=('a', 'b'))
+            f1.to_npy_dir(fp)
+            self.assertEqual(Frame.from_npy_dir(fp).shape, (2, 0))
+
+    #---------------------------------------------------------------------------
+
     def test_frame_and_a(self) -> None:
 
         records = (
@@ -8447,6 +8678,33 @@ class TestUnit(TestCase):
         self.assertEqual([b.flags.writeable for b in f2._blocks._blocks],
                 [False, False, False, False, False])
 
+    def test_frame_pickle_b(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,float,str)|i(I,str)|c(I,str)').rename('foo')
+        f1 = FrameGO(f1.iloc[::2])
+
+        buffers: tp.List[pickle.PickleBuffer] = []
+        pbytes = pickle.dumps(f1, protocol=5, buffer_callback=buffers.append)
+        f2 = pickle.loads(pbytes, buffers=buffers)
+
+        self.assertTrue(f1.equals(f2, compare_name=True, compare_dtype=True, compare_class=True))
+        # blocks are views of the out-of-band buffers
+        self.assertTrue(np.shares_memory(f2._blocks._blocks[0], np.asarray(buffers[0])))
+        self.assertFalse(f2.index.values.flags.writeable)
+
+        f2['a'] = -1
+        self.assertEqual(f2.shape, (10, 5))
+        self.assertEqual(f1.shape, (10, 4))
+
+    def test_frame_pickle_c(self) -> None:
+        f1 = ff.parse('s(6,3)|v(int,str)|i(I,str)|c(I,str)').rename('foo')
+        # below protocol 5, pickles do not depend on private constructors, and can be read by prior versions
+        for protocol in range(2, 5):
+            pbytes = pickle.dumps(f1, protocol=protocol)
+            self.assertNotIn(b'_from_pickle', pbytes)
+            self.assertTrue(pickle.loads(pbytes).equals(f1, compare_name=True, compare_dtype=True, compare_class=True))
+
+        self.assertIn(b'_from_pickle', pickle.dumps(f1, protocol=5))
+
     def test_frame_set_index_hierarchy_a(self) -> None:
 
         records = (
@@ -9219,6 +9477,19 @@ class TestUnit(TestCase):
                 )
 
 
+    def test_frame_from_sql_parameters_a(self) -> None:
+
+        conn: sqlite3.Connection = self.get_test_db_b()
+
+        f1 = sf.Frame.from_sql(
+                'select * from events where identifier = ?',
+                connection=conn,
+                index_depth=1,
+                parameters=('b2',),
+        )
+        self.assertEqual(f1.index.values.tolist(), [2, 3])
+        self.assertEqual(set(f1['identifier'].values.tolist()), {'b2'})
+
     def test_frame_from_sql_columns_select_w_col_h(self) -> None:
 
         conn: sqlite3.Connection = self.get_test_db_c()
@@ -11086,6 +11357,85 @@ class TestUnit(TestCase):
         with self.assertRaises(NotImplementedError):
             f1._join(f2, join_type=None, left_depth_level=0, right_depth_level=0)
 
+    def test_frame_join_l(self) -> None:
+        # right columns retain their dtypes where no fill is needed
+        f1 = sf.Frame.from_dict(dict(a=(1, 2, 2, 3), b=('p', 'q', 'r', 's')),
+                index=('w', 'x', 'y', 'z'))
+        f2 = sf.Frame.from_dict(dict(c=(2, 3, 3), d=(True, False, True)),
+                index=('u', 'v', 'w'))
+
+        f3 = f1.join_inner(f2, left_columns='a', right_columns='c')
+        self.assertEqual(f3.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype('<U1'), np.dtype(int), np.dtype(bool)])
+        self.assertEqual(f3.to_pairs(0),
+                (('a', ((('x', 'u'), 2), (('y', 'u'), 2), (('z', 'v'), 3), (('z', 'w'), 3))), ('b', ((('x', 'u'), 'q'), (('y', 'u'), 'r'), (('z', 'v'), 's'), (('z', 'w'), 's'))), ('c', ((('x', 'u'), 2), (('y', 'u'), 2), (('z', 'v'), 3), (('z', 'w'), 3))), ('d', ((('x', 'u'), True), (('y', 'u'), True), (('z', 'v'), False), (('z', 'w'), True))))
+                )
+
+        f4 = f1.join_outer(f2, left_columns='a', right_columns='c', fill_value=None)
+        self.assertEqual(f4.index.values.tolist(),
+                [('x', 'u'), ('y', 'u'), ('z', 'v'), ('z', 'w'), ('w', None)])
+        self.assertEqual(f4['d'].values.tolist(),
+                [True, True, False, True, None])
+
+    def test_frame_join_m(self) -> None:
+        # joining sorted date indices
+        f1 = sf.Frame.from_dict(dict(a=(1, 2, 3, 4)),
+                index=sf.IndexDate.from_date_range('2021-01-01', '2021-01-04'))
+        f2 = sf.Frame.from_dict(dict(b=(10, 20, 30)),
+                index=sf.IndexDate(('2021-01-02', '2021-01-04', '2021-01-05')))
+
+        f3 = f1.join_inner(f2,
+                left_depth_level=0,
+                right_depth_level=0,
+                composite_index=False,
+                )
+        self.assertEqual(f3.index.values.tolist(),
+                [datetime.date(2021, 1, 2), datetime.date(2021, 1, 4)])
+        self.assertEqual(f3['b'].values.tolist(), [10, 20])
+
+        f4 = f1.join_left(f2,
+                left_depth_level=0,
+                right_depth_level=0,
+                composite_index=False,
+                )
+        self.assertEqual(f4.fillna(-1)['b'].values.tolist(), [-1, 10, -1, 20])
+
+    def test_frame_join_asof_a(self) -> None:
+        f1 = sf.Frame.from_dict(dict(px=(1.2, 2.7, 3.1, 0.9)),
+                index=sf.IndexSecond(('2021-01-01T09:00:01', '2021-01-01T09:00:06', '2021-01-01T09:00:14', '2021-01-01T08:59:59')))
+        f2 = sf.Frame.from_dict(dict(bid=(1.0, 2.0, 3.0), size=(10, 20, 30)),
+                index=sf.IndexSecond(('2021-01-01T09:00:00', '2021-01-01T09:00:05', '2021-01-01T09:00:10')))
+
+        f3 = f1.join_asof(f2, right_template='quote_{}')
+        self.assertIs(f3.index, f1.index)
+        self.assertEqual(f3.columns.values.tolist(), ['px', 'quote_bid', 'quote_size'])
+        self.assertEqual(f3.fillna(-1).values.tolist(),
+                [[1.2, 1.0, 10.0], [2.7, 2.0, 20.0], [3.1, 3.0, 30.0], [0.9, -1.0, -1.0]])
+
+        f4 = f1.join_asof(f2, direction='forward', fill_value=None)
+        self.assertEqual(f4['size'].values.tolist(), [20, 30, None, 10])
+
+        f5 = f1.join_asof(f2,
+                direction='nearest',
+                tolerance=np.timedelta64(2, 's'),
+                fill_value=0,
+                )
+        self.assertEqual(f5['size'].values.tolist(), [10, 20, 0, 10])
+        self.assertEqual(f5['size'].dtype, np.dtype(int))
+
+    def test_frame_join_asof_b(self) -> None:
+        f1 = sf.Frame.from_dict(dict(a=(1, 2)),
+                index=sf.IndexHierarchy.from_labels(((1, 2), (3, 4))))
+        with self.assertRaises(RuntimeError):
+            f1.join_asof(f1)
+
+        f2 = sf.Frame.from_dict(dict(b=(1, 2)), index=(3, 1))
+        with self.assertRaises(RuntimeError):
+            sf.Frame.from_dict(dict(a=(1, 2)), index=(1, 2)).join_asof(f2)
+
+
+
+
 
     #---------------------------------------------------------------------------
     def test_frame_append_a(self) -> None:
@@ -1,3 +1,4 @@
+import sys
 import unittest
 import typing as tp
 
@@ -164,6 +165,16 @@ class TestUnit(TestCase):
         post = list(f.iter_array(axis=1))
         self.assertEqual([x.tolist() for x in post], [[], [], []])
 
+    @unittest.skipIf(sys.version_info < (3, 8), 'requires Python 3.8 shared memory')
+    def test_frame_iter_array_h(self) -> None:
+
+        arrays = list(np.random.rand(1000) for _ in range(100))
+        f1 = Frame.from_items(
+                zip(range(100), arrays)
+                )
+        post = f1.iter_array(axis=0).apply_pool(np.sum, max_workers=4, use_shared_memory=True)
+        self.assertEqual(post.shape, (100,))
+        self.assertAlmostEqual(f1.sum().sum(), post.sum())
 
     #---------------------------------------------------------------------------
     def test_frame_iter_tuple_a(self) -> None:
@@ -619,6 +630,81 @@ class TestUnit(TestCase):
                 (('a', ((2, 5),)), ('b', ((2, 6),)), ('c', ((2, obj_b),))))
 
 
+    #---------------------------------------------------------------------------
+    def test_frame_iter_group_reduce_a(self) -> None:
+        f = Frame.from_records(
+                (('a', 1, 2.5, True),
+                ('b', 2, np.nan, False),
+                ('a', 3, 1.0, True),
+                ('b', 4, 4.0, True),
+                ('c', 5, np.nan, False)),
+                columns=('k', 'i', 'f', 'b'),
+                )
+        self.assertEqual(f.iter_group('k').reduce.sum().to_pairs(0),
+                (('i', (('a', 4), ('b', 6), ('c', 5))), ('f', (('a', 3.5), ('b', 4.0), ('c', 0.0))), ('b', (('a', 2), ('b', 1), ('c', 0))))
+                )
+        self.assertEqual(f.iter_group('k').reduce.mean().fillna(-1).to_pairs(0),
+                (('i', (('a', 2.0), ('b', 3.0), ('c', 5.0))), ('f', (('a', 1.75), ('b', 4.0), ('c', -1.0))), ('b', (('a', 1.0), ('b', 0.5), ('c', 0.0))))
+                )
+        self.assertEqual(f.iter_group('k').reduce.count().to_pairs(0),
+                (('i', (('a', 2), ('b', 2), ('c', 1))), ('f', (('a', 2), ('b', 1), ('c', 0))), ('b', (('a', 2), ('b', 2), ('c', 1))))
+                )
+        self.assertEqual(f.iter_group('k').reduce.count(skipna=False)['f'].values.tolist(),
+                [2, 2, 1])
+        self.assertEqual(f.iter_group('k').reduce.min()['f'].fillna(-1).values.tolist(),
+                [1.0, 4.0, -1])
+        self.assertEqual(f.iter_group('k').reduce.max(skipna=False)['f'].fillna(-1).values.tolist(),
+                [2.5, -1, -1])
+        self.assertEqual(f.iter_group('k').reduce.first().fillna(-1).to_pairs(0),
+                (('i', (('a', 1), ('b', 2), ('c', 5))), ('f', (('a', 2.5), ('b', -1.0), ('c', -1.0))), ('b', (('a', True), ('b', False), ('c', False))))
+                )
+        self.assertEqual(f.iter_group('k').reduce.last()['i'].to_pairs(),
+                (('a', 3), ('b', 4), ('c', 5)))
+        self.assertEqual(f.iter_group('k').reduce.sum().dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(float), np.dtype(int)])
+
+    def test_frame_iter_group_reduce_b(self) -> None:
+        f = ff.parse('s(20,4)|v(int,str,bool,float)|c(I,str)').assign['zZbu'](
+                lambda s: s % 3)
+        for func in ('sum', 'min', 'max'):
+            post = getattr(f.iter_group('zZbu').reduce, func)()
+            for label, group in f.iter_group_items('zZbu'):
+                expected = getattr(group.drop['zZbu'], func)()
+                self.assertEqual(post.loc[label].values.tolist(),
+                        expected.values.tolist())
+
+        for func, iloc in (('first', 0), ('last', -1)):
+            post = getattr(f.iter_group('zZbu').reduce, func)()
+            for label, group in f.iter_group_items('zZbu'):
+                self.assertEqual(post.loc[label].values.tolist(),
+                        group.drop['zZbu'].iloc[iloc].values.tolist())
+
+        # multiple columns form tuple labels
+        post = f.iter_group(['zZbu', 'zUvW']).reduce.count()
+        self.assertEqual(post.index.values.tolist(),
+                list(f.iter_group(['zZbu', 'zUvW']).apply(lambda g: len(g)).index))
+        self.assertEqual(post['ztsv'].values.tolist(),
+                list(f.iter_group(['zZbu', 'zUvW']).apply(lambda g: len(g)).values))
+
+    def test_frame_iter_group_reduce_c(self) -> None:
+        f = FrameGO.from_records(
+                ((1, 2, 3, 4), (10, 20, 30, 40), ('x', 'y', 'x', 'y')),
+                index=('p', 'q', 'r'),
+                columns=('a', 'b', 'c', 'd'),
+                )
+        post = f.iter_group_items('r', axis=1).reduce.sum()
+        self.assertEqual(post.__class__, FrameGO)
+        self.assertEqual(post.to_pairs(0),
+                (('x', (('p', 4), ('q', 40))), ('y', (('p', 6), ('q', 60))))
+                )
+        with self.assertRaises(AxisInvalid):
+            f.iter_group('r', axis=2).reduce.sum()
+        with self.assertRaises(RuntimeError):
+            f.iter_group('r', axis=1).reduce._func_reduce(func='median')
+
+        f2 = Frame(columns=('a', 'b'))
+        self.assertEqual(f2.iter_group('a').reduce.mean().shape, (0, 1))
+
     #---------------------------------------------------------------------------
     def test_frame_iter_group_index_a(self) -> None:
 
@@ -801,6 +887,42 @@ class TestUnit(TestCase):
         self.assertEqual(len(post), 18)
         self.assertTrue(all(f.shape == (3, 4) for f in post))
 
+    def test_frame_iter_window_reduce_a(self) -> None:
+        f1 = FrameGO.from_fields(
+                (np.arange(6), np.array([0.5, np.nan, 1.5, 2.0, 2.5, 3.0]), np.array(list('fedcba'))),
+                columns=('a', 'b', 'c'),
+                index=tuple('pqrstu'),
+                )
+        post1 = f1.iter_window(size=3).reduce.max()
+        self.assertEqual(post1.__class__, FrameGO)
+        self.assertEqual(post1.to_pairs(0),
+                (('a', (('r', 2), ('s', 3), ('t', 4), ('u', 5))), ('b', (('r', 1.5), ('s', 2.0), ('t', 2.5), ('u', 3.0))), ('c', (('r', 'f'), ('s', 'e'), ('t', 'd'), ('u', 'c'))))
+                )
+        post2 = f1[['a', 'b']].iter_window_items(size=2, step=2, label_shift=-1).reduce.mean()
+        self.assertEqual(post2.to_pairs(0),
+                (('a', (('p', 0.5), ('r', 2.5), ('t', 4.5))), ('b', (('p', 0.5), ('r', 1.75), ('t', 2.75))))
+                )
+        post3 = f1[['a', 'b']].iter_window_array(size=2, axis=1).reduce.sum(skipna=False)
+        self.assertEqual(post3.columns.values.tolist(), ['b'])
+        self.assertEqual(post3.fillna(-1).to_pairs(0),
+                (('b', (('p', 0.5), ('q', -1.0), ('r', 3.5), ('s', 5.0), ('t', 6.5), ('u', 8.0))),)
+                )
+        post4 = f1[['a', 'b']].iter_window_array(size=3).reduce.apply(lambda w: w.max(axis=1))
+        self.assertEqual(post4.__class__, FrameGO)
+        self.assertEqual(post4.fillna(-1).to_pairs(0),
+                (('a', (('r', 2.0), ('s', 3.0), ('t', 4.0), ('u', 5.0))), ('b', (('r', -1.0), ('s', -1.0), ('t', 2.5), ('u', 3.0))))
+                )
+        windows = list(f1[['a', 'b']].astype(float).iter_window_array(size=2, axis=1))
+        self.assertEqual(windows[0].shape, (6, 2))
+        self.assertFalse(windows[0].flags.writeable)
+
+        with self.assertRaises(RuntimeError):
+            f1.iter_window(size=2, size_increment=1).reduce.sum()
+        with self.assertRaises(RuntimeError):
+            f1.iter_window(size=2, window_func=lambda f: f).reduce.sum()
+        with self.assertRaises(AxisInvalid):
+            f1.iter_window(size=2, axis=2).reduce.sum()
+
 
 
     #---------------------------------------------------------------------------
@@ -614,6 +614,22 @@ class TestUnit(TestCase):
                 self.assertFalse(index_new._labels.flags.writeable)
                 self.assertEqual(index_new.loc[v], index.loc[v])
 
+    def test_index_pickle_b(self) -> None:
+        a = Index(('a', 'b', 'c'), name='foo')
+        b = IndexGO(range(4), loc_is_iloc=True)
+        c = IndexYear.from_date_range('2014-12-15', '2018-03-15')
+
+        # NumPy pickles datetime64 arrays in-band
+        for index, count in ((a, 1), (b, 1), (c, 0)):
+            buffers: tp.List[pickle.PickleBuffer] = []
+            pbytes = pickle.dumps(index, protocol=5, buffer_callback=buffers.append)
+            self.assertEqual(len(buffers), count)
+            index_new = pickle.loads(pbytes, buffers=buffers)
+
+            self.assertTrue(index_new.equals(index, compare_class=True, compare_name=True))
+            self.assertFalse(index_new._labels.flags.writeable)
+            self.assertEqual(index_new._map is None, index._map is None)
+
     def test_index_drop_a(self) -> None:
 
         index = Index(list('abcdefg'))
@@ -674,6 +674,47 @@ class TestUnit(TestCase):
             self.assertEqual(q1.loc[:, :].to_pairs(0),
                     (('a', ((('f1', 'x'), 1), (('f1', 'y'), 2), (('f2', 'x'), 1), (('f2', 'y'), 2), (('f2', 'z'), 3), (('f3', 'p'), 10), (('f3', 'q'), 20))), ('b', ((('f1', 'x'), 3), (('f1', 'y'), 4), (('f2', 'x'), 4), (('f2', 'y'), 5), (('f2', 'z'), 6), (('f3', 'p'), 50), (('f3', 'q'), 60)))))
 
+    def test_quilt_from_zip_npy_a(self) -> None:
+        f1 = ff.parse('s(4,4)|v(int,float)').rename('f1')
+        f2 = ff.parse('s(4,4)|v(int,float)').rename('f2')
+
+        with temp_file('.zip') as fp:
+            Batch.from_frames((f1, f2)).to_zip_npy(fp)
+            q1 = Quilt.from_zip_npy(fp, max_persist=1, retain_labels=True)
+            self.assertEqual(q1.shape, (8, 4))
+            self.assertTrue(q1.to_frame().equals(
+                    Frame.from_concat_items((('f1', f1), ('f2', f2)))))
+
+    def test_quilt_from_zip_pickle_c(self) -> None:
+        f1 = ff.parse('s(4,4)|v(int,float)').rename('f1')
+        f2 = ff.parse('s(4,4)|v(int,float)').rename('f2')
+        f3 = ff.parse('s(4,4)|v(int,float)').rename('f3')
+
+        with temp_file('.zip') as fp:
+            Batch.from_frames((f1, f2, f3)).to_zip_pickle(fp)
+            q1 = Quilt.from_zip_pickle(fp, max_persist_bytes=f1.nbytes, retain_labels=True)
+            self.assertEqual(q1._bus._max_persist_bytes, f1.nbytes)
+            self.assertTrue(q1.to_frame().equals(
+                    Frame.from_concat_items((('f1', f1), ('f2', f2), ('f3', f3)))))
+            self.assertEqual(q1._bus._loaded.sum(), 1)
+
+    def test_quilt_from_zip_npy_a(self) -> None:
+        f1 = ff.parse('s(4,4)|v(int,float)').rename('f1')
+        f2 = ff.parse('s(4,4)|v(str)').rename('f2')
+        f3 = ff.parse('s(4,4)|v(bool)').rename('f3')
+
+        with temp_file('.zip') as fp:
+            Batch.from_frames((f1, f2, f3)).to_zip_npy(fp)
+            q1 = Quilt.from_zip_npy(fp, retain_labels=True)
+            # axis labels are read without loading Frame
+            self.assertEqual(q1.shape, (12, 4))
+            self.assertEqual(q1._bus._loaded.sum(), 0)
+            self.assertEqual(q1.index.values_at_depth(0).tolist(),
+                    ['f1'] * 4 + ['f2'] * 4 + ['f3'] * 4)
+
+            self.assertTrue(q1.to_frame().equals(
+                    Frame.from_concat_items((('f1', f1), ('f2', f2), ('f3', f3)))))
+
     def test_quilt_from_zip_pickle_b(self) -> None:
 
         f1 = ff.parse('s(4,4)|v(int,float)').rename('f1')
@@ -676,6 +676,41 @@ class TestUnit(TestCase):
         s2 = s1.reindex(index) # same values, different class
         self.assertTrue(s2.index.__class__, index.__class__)
 
+    #---------------------------------------------------------------------------
+    def test_series_reindex_asof_a(self) -> None:
+
+        s1 = Series((10, 20, 30),
+                index=IndexDate(('2020-03-02', '2020-03-05', '2020-03-09')),
+                name='foo')
+        s2 = s1.reindex_asof(('2020-03-04', '2020-03-01', '2020-03-05', '2020-03-12'))
+        self.assertIs(s2.index.__class__, IndexDate)
+        self.assertEqual(s2.name, 'foo')
+        self.assertEqual(s2.fillna(-1).values.tolist(), [10, -1, 20, 30])
+
+        s3 = s1.reindex_asof(IndexDate(('2020-03-04', '2020-03-10')),
+                direction='nearest',
+                fill_value=0,
+                )
+        self.assertEqual(s3.values.tolist(), [20, 30])
+        self.assertEqual(s3.dtype, np.dtype(int))
+
+        s4 = s1.reindex_asof(IndexDate(('2020-03-04', '2020-03-12')),
+                direction='forward',
+                tolerance=datetime.timedelta(days=1),
+                fill_value=None,
+                )
+        self.assertEqual(s4.values.tolist(), [20, None])
+
+    def test_series_reindex_asof_b(self) -> None:
+
+        s1 = Series((1, 2), index=IndexHierarchy.from_labels(((1, 2), (3, 4))))
+        with self.assertRaises(RuntimeError):
+            s1.reindex_asof(((1, 2),))
+
+        s2 = Series((1, 2), index=(3, 1))
+        with self.assertRaises(RuntimeError):
+            s2.reindex_asof((2,))
+
     #---------------------------------------------------------------------------
     def test_series_isnull_a(self) -> None:
 
@@ -2388,6 +2423,17 @@ class TestUnit(TestCase):
                 self.assertFalse(series_new.values.flags.writeable)
                 self.assertEqual(series_new.loc[v], series.loc[v])
 
+    def test_series_pickle_b(self) -> None:
+        s1 = Series(np.arange(12)[::3], index=list('abcd'), name='foo')
+
+        buffers: tp.List[pickle.PickleBuffer] = []
+        pbytes = pickle.dumps(s1, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 2) # values and index labels
+
+        s2 = pickle.loads(pbytes, buffers=[bytearray(b.raw()) for b in buffers])
+        self.assertTrue(s2.equals(s1, compare_name=True, compare_dtype=True))
+        self.assertFalse(s2.values.flags.writeable)
+
 
     #---------------------------------------------------------------------------
 
@@ -3236,6 +3282,85 @@ class TestUnit(TestCase):
         self.assertEqual(post2.to_pairs(),
                 ((4, 2.0), (5, 3.0), (6, 4.0), (7, 5.0), (8, 6.0), (9, 7.0), (10, 8.0), (11, 9.0)))
 
+    def test_series_iter_window_reduce_a(self) -> None:
+        s1 = sf.Series((1.0, 2.0, np.nan, 4.0, 5.0, 5.0, 5.0), index=tuple('abcdefg'))
+
+        for kwargs in (
+                dict(size=3),
+                dict(size=3, step=2),
+                dict(size=4, window_sized=False, start_shift=-2),
+                dict(size=2, label_shift=1),
+                dict(size=10, window_sized=False),
+                ):
+            for func, ref in (
+                    ('sum', np.nansum),
+                    ('mean', np.nanmean),
+                    ('std', np.nanstd),
+                    ('min', np.nanmin),
+                    ('max', np.nanmax),
+                    ('count', lambda a: (~np.isnan(a)).sum()),
+                    ('first', lambda a: a[0]),
+                    ('last', lambda a: a[-1]),
+                    ):
+                post = getattr(s1.iter_window(**kwargs).reduce, func)()
+                expected = s1.iter_window_array(**kwargs).apply(ref)
+                self.assertEqual(post.index.values.tolist(), expected.index.values.tolist())
+                self.assertTrue(np.allclose(post.values, expected.values, equal_nan=True))
+
+        # windows of equal values have no variance
+        self.assertEqual(s1.iter_window(size=3).reduce.std().values.tolist()[-1], 0.0)
+        self.assertEqual(s1.iter_window(size=2).reduce.max(skipna=False).fillna(-1).values.tolist(),
+                [2.0, -1, -1, 5.0, 5.0, 5.0])
+
+    def test_series_iter_window_reduce_c(self) -> None:
+        s1 = sf.Series(np.arange(10.0), index=tuple('abcdefghij'))
+
+        post1 = s1.iter_window_array(size=3, step=2).reduce.apply(
+                lambda w: np.median(w, axis=1))
+        self.assertEqual(post1.to_pairs(),
+                (('c', 1.0), ('e', 3.0), ('g', 5.0), ('i', 7.0)))
+
+        post2 = s1.iter_window(size=4, label_shift=-3).reduce.apply(
+                lambda w: np.stack((w.min(axis=1), w.max(axis=1)), axis=1))
+        self.assertEqual(post2.shape, (7, 2))
+        self.assertEqual(post2.loc['a'].values.tolist(), [0.0, 3.0])
+
+        with self.assertRaises(RuntimeError):
+            s1.iter_window(size=3, window_sized=False, start_shift=-1).reduce.apply(lambda w: w.sum(axis=1))
+        with self.assertRaises(RuntimeError):
+            s1.iter_window(size=3).reduce.apply(lambda w: w.sum())
+
+    def test_series_iter_window_reduce_d(self) -> None:
+        # non-finite values only affect the windows that contain them
+        s1 = sf.Series((1.0, 2.0, np.inf, 3.0, 4.0, 5.0, 6.0))
+        self.assertEqual(s1.iter_window(size=2).reduce.sum().values.tolist(),
+                [3.0, np.inf, np.inf, 7.0, 9.0, 11.0])
+        self.assertEqual(s1.iter_window(size=2).reduce.mean().values.tolist(),
+                [1.5, np.inf, np.inf, 3.5, 4.5, 5.5])
+        post1 = s1.iter_window(size=2).reduce.std().values
+        self.assertEqual(np.isnan(post1).tolist(), [False, True, True, False, False, False])
+        self.assertEqual(post1[~np.isnan(post1)].tolist(), [0.5, 0.5, 0.5, 0.5])
+
+        # precision is not lost to large values outside of a window
+        values = np.concatenate((np.full(100_000, 1e12), np.linspace(0, 0.9, 10)))
+        s2 = sf.Series(values)
+        window = values[-5:]
+        self.assertAlmostEqual(s2.iter_window(size=5).reduce.mean().values[-1], window.mean())
+        self.assertAlmostEqual(s2.iter_window(size=5).reduce.std().values[-1], window.std())
+        self.assertAlmostEqual(s2.iter_window(size=5).reduce.std(ddof=1).values[-1], window.std(ddof=1))
+
+    def test_series_iter_window_reduce_b(self) -> None:
+        s1 = sf.Series(np.array(['2020-01-03', 'NaT', '2020-01-01'], dtype='datetime64[D]'))
+
+        post1 = s1.iter_window_items(size=2, start_shift=-1, window_sized=False).reduce.min()
+        self.assertEqual(post1.values.tolist(),
+                [datetime.date(2020, 1, 3), datetime.date(2020, 1, 3), datetime.date(2020, 1, 1)])
+        self.assertEqual(post1.dtype, np.dtype('datetime64[D]'))
+
+        post2 = s1.iter_window(size=2, start_shift=-5, label_shift=4, window_sized=False).reduce.first()
+        self.assertEqual(post2.index.values.tolist(), [0, 1, 2])
+        self.assertTrue(np.isnat(post2.values).all())
+
 
     #---------------------------------------------------------------------------
     def test_series_bool_a(self) -> None:
@@ -116,6 +116,29 @@ class TestUnit(TestCase):
         sc1m = StoreConfigMap(maps2, default=default)
         self.assertEqual(sc1m.default.write_chunksize, 2)
 
+    def test_store_config_map_init_g(self) -> None:
+        maps1 = {'a': StoreConfig(read_use_threads=True),
+                'b': StoreConfig(read_use_threads=True)}
+
+        with self.assertRaises(ErrorInitStoreConfig):
+            StoreConfigMap(maps1) # Default is False
+
+        sc1m = StoreConfigMap(maps1, default=StoreConfig(read_use_threads=True))
+        self.assertTrue(sc1m.default.read_use_threads)
+
+    def test_store_config_rows_where_a(self) -> None:
+        sc1 = StoreConfig(rows_where=[('a', '>', np.int64(3)), ('b', '==', 'x')])
+        self.assertEqual(sc1.rows_where, (('a', '>', 3), ('b', '==', 'x')))
+        self.assertIs(sc1.rows_where[0][2].__class__, int)
+        self.assertIsNone(StoreConfig(rows_where=()).rows_where)
+
+        with self.assertRaises(ErrorInitStoreConfig):
+            StoreConfig(rows_where=(('a', 'in', 3),))
+        with self.assertRaises(ErrorInitStoreConfig):
+            StoreConfig(rows_where=(('a', '>'),))
+        with self.assertRaises(ErrorInitStoreConfig):
+            StoreConfig(rows_where=((0, '>', 3),))
+
     #---------------------------------------------------------------------------
     def test_store_config_he_a(self) -> None:
         he_kwargs = dict(
@@ -132,8 +155,11 @@ class TestUnit(TestCase):
                 merge_hierarchical_labels=True,
                 read_max_workers=1,
                 read_chunksize=1,
+                read_use_threads=True,
+                rows_where=(('a', '>', 1),),
                 write_max_workers=1,
                 write_chunksize=1,
+                write_manifest=True,
         )
 
         kwargs = dict(**he_kwargs,
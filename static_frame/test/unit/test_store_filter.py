@@ -7,6 +7,7 @@ import numpy as np
 from static_frame.core.store_filter import STORE_FILTER_DEFAULT
 from static_frame.core.store_filter import STORE_FILTER_DISABLE
 from static_frame.core.store_filter import StoreFilter
+from static_frame.core.store_filter import array_to_str_list
 from static_frame.test.test_case import TestCase
 from static_frame.core.util import DTYPE_OBJECT_KIND
 from static_frame.core.util import DTYPE_COMPLEX_KIND
@@ -339,6 +340,36 @@ class TestUnit(TestCase):
         self.assertEqual(post2.tolist(),
                 ['0.413-0.000j', '0.412-0.593j', 'foo', False, 100, '0.833', '20.000+3.000j'])
 
+    #---------------------------------------------------------------------------
+    def test_array_to_str_list_a(self) -> None:
+        sfd = STORE_FILTER_DEFAULT
+
+        a1 = np.array([0.1, np.nan, np.inf, -np.inf], dtype=np.float32)
+        self.assertEqual(array_to_str_list(a1, sfd),
+                ['0.10000000149011612', '', 'inf', '-inf'])
+
+        a2 = np.array(['2020-01', None], dtype='datetime64[M]')
+        self.assertEqual(array_to_str_list(a2, sfd), ['2020-01', ''])
+
+        a3 = np.array([1j, np.nan], dtype=np.complex64)
+        self.assertEqual(array_to_str_list(a3, sfd), ['1j', ''])
+
+        self.assertEqual(array_to_str_list(a1, None),
+                ['0.10000000149011612', 'nan', 'inf', '-inf'])
+
+    def test_array_to_str_list_b(self) -> None:
+        sfd = STORE_FILTER_DEFAULT
+
+        a1 = np.array([b'a', b'bc'])
+        self.assertEqual(array_to_str_list(a1, sfd), ["b'a'", "b'bc'"])
+
+        a2 = np.array([None, np.nan, 'x', 3], dtype=object)
+        self.assertEqual(array_to_str_list(a2, sfd), ['None', '', 'x', '3'])
+
+        sf = StoreFilter(value_format_float_positional='{:.2f}')
+        a3 = np.array([0.125, np.nan])
+        self.assertEqual(array_to_str_list(a3, sf), ['0.12', ''])
+
 
 
 if __name__ == '__main__':
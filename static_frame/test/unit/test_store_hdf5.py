@@ -2,6 +2,8 @@
 import unittest
 import typing as tp
 
+import frame_fixtures as ff
+
 from static_frame.core.frame import Frame
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.test.test_case import TestCase
@@ -9,6 +11,7 @@ from static_frame.test.test_case import temp_file
 from static_frame.core.store_hdf5 import StoreHDF5
 from static_frame.core.store import StoreConfigMap
 from static_frame.core.store import StoreConfig
+from static_frame.core.exception import ErrorInitFrame
 
 
 class TestUnit(TestCase):
@@ -195,6 +198,83 @@ class TestUnit(TestCase):
                 self.assertEqualFrames(f_src, f_loaded, compare_dtype=False)
 
 
+    def test_store_hdf5_read_labels_a(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1,2,3), b=(4,5,6)),
+                index=('z', 'x', 'y'),
+                name='f1')
+        f2 = Frame.from_records(
+                ((10.4, 20.1, 50, 60), (50.1, 60.4, -50, -60)),
+                index=IndexHierarchy.from_labels((('q', 2), ('p', 1))),
+                columns=IndexHierarchy.from_product(('I', 'II'), ('a', 'b')),
+                name='f2')
+        frames = (f1, f2)
+        config = StoreConfigMap.from_frames(frames)
+
+        with temp_file('.hdf5') as fp:
+            st1 = StoreHDF5(fp)
+            st1.write(((f.name, f) for f in frames), config=config)
+
+            for f_stored, (index, columns) in zip(
+                    st1.read_many(('f1', 'f2'), config=config),
+                    st1.read_labels_many(('f1', 'f2'), config=config),
+                    ):
+                self.assertTrue(index.equals(f_stored.index, compare_dtype=True))
+                self.assertTrue(columns.equals(f_stored.columns, compare_dtype=True))
+
+            self.assertEqual(st1.read_labels('f1', config=config['f1']).values.tolist(),
+                    ['z', 'x', 'y'])
+
+    def test_store_hdf5_columns_select_a(self) -> None:
+
+        f1 = ff.parse('s(4,6)|v(int,str,bool,float)|c(I,str)|i(I,str)').rename('f1')
+        config_write = StoreConfig(include_index=True, include_columns=True)
+        config = StoreConfig(index_depth=1, columns_select=('zUvW', 'zZbu'))
+
+        with temp_file('.hdf5') as fp:
+            st1 = StoreHDF5(fp)
+            st1.write(((f1.name, f1),), config=config_write)
+
+            f2 = st1.read('f1', config=config)
+            self.assertTrue(f2.equals(f1[['zUvW', 'zZbu']], compare_dtype=True))
+            self.assertEqual(st1.read_labels('f1', config=config, axis=1).values.tolist(),
+                    ['zUvW', 'zZbu'])
+
+            with self.assertRaises(ErrorInitFrame):
+                st1.read('f1', config=StoreConfig(index_depth=1, columns_select=('zUvW', 'foo')))
+
+    def test_store_hdf5_rows_where_a(self) -> None:
+
+        f1 = ff.parse('s(6,4)|v(int,str,bool,float)|c(I,str)|i(I,str)').rename('f1')
+        config_write = StoreConfig(include_index=True, include_columns=True)
+
+        with temp_file('.hdf5') as fp:
+            st1 = StoreHDF5(fp)
+            st1.write(((f1.name, f1),), config=config_write)
+
+            column = f1.columns[0]
+            config = StoreConfig(index_depth=1,
+                    rows_where=((column, '>', 0), (f1.columns[2], '==', True)))
+            f2 = st1.read('f1', config=config)
+            f3 = f1.loc[(f1[column] > 0) & f1[f1.columns[2]]]
+            self.assertTrue(len(f3) < len(f1))
+            self.assertTrue(f2.equals(f3, compare_dtype=True))
+            self.assertTrue(st1.read_labels('f1', config=config).equals(f3.index))
+
+            # strings are matched against the stored bytes
+            label = f1.index[1]
+            config = StoreConfig(index_depth=1,
+                    rows_where=(('__index0__', '==', label),),
+                    columns_select=(f1.columns[1],))
+            f4 = st1.read('f1', config=config)
+            self.assertTrue(f4.equals(f1.loc[[label], [f1.columns[1]]], compare_dtype=True))
+
+            config = StoreConfig(index_depth=1, rows_where=(('foo', '>', 0),))
+            with self.assertRaises(ErrorInitFrame):
+                st1.read('f1', config=config)
+
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import sqlite3
 from fractions import Fraction
 import typing as tp
 
@@ -11,6 +12,7 @@ from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.store import StoreConfig
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store import StoreConfigMap
+from static_frame.core.exception import ErrorInitFrame
 
 
 class TestUnit(TestCase):
@@ -218,6 +220,92 @@ class TestUnit(TestCase):
                 f_src = frames[i]
                 self.assertEqualFrames(f_src, f_loaded, compare_dtype=False)
 
+    def test_store_sqlite_read_labels_a(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1,2,3), b=(4,5,6)),
+                index=('z', 'x', 'y'),
+                name='f1')
+        f2 = Frame.from_records(
+                ((10.4, 20.1, 50, 60), (50.1, 60.4, -50, -60)),
+                index=IndexHierarchy.from_labels((('q', 2), ('p', 1))),
+                columns=IndexHierarchy.from_product(('I', 'II'), ('a', 'b')),
+                name='f2')
+        frames = (f1, f2)
+        config = StoreConfigMap.from_frames(frames)
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write(((f.name, f) for f in frames), config=config)
+
+            for f_src, (index, columns) in zip(frames,
+                    st1.read_labels_many(('f1', 'f2'), config=config)):
+                # row order is that of a full read, not that of the primary key
+                self.assertTrue(index.equals(f_src.index))
+                self.assertTrue(columns.equals(f_src.columns))
+
+            self.assertEqual(st1.read_labels('f1', config=config['f1'], axis=1).values.tolist(),
+                    ['a', 'b'])
+
+    def test_store_sqlite_rows_where_a(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(3, 1, 2, 5), b=('x', 'y', 'z', 'w'), c=(True, False, True, True)),
+                index=('q', 'p', 's', 'r'),
+                name='f1')
+        config = StoreConfig(index_depth=1, include_index=True)
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write(((f1.name, f1),), config=config)
+
+            config_where = StoreConfig(index_depth=1,
+                    rows_where=(('a', '>', np.int64(1)), ('c', '==', True)))
+            f2 = st1.read('f1', config=config_where)
+            # row order is retained
+            self.assertTrue(f2.equals(f1.loc[['q', 's', 'r']], compare_dtype=True))
+            self.assertEqual(st1.read_labels('f1', config=config_where).values.tolist(),
+                    ['q', 's', 'r'])
+
+            # values are bound as parameters, not formatted into the query
+            f3 = st1.read('f1', config=StoreConfig(index_depth=1,
+                    rows_where=(('b', '==', "x' OR 1=1 --"),)))
+            self.assertEqual(len(f3), 0)
+
+            f4 = st1.read('f1', config=StoreConfig(index_depth=1,
+                    rows_where=(('__index0__', '!=', 'p'),),
+                    columns_select=('b',)))
+            self.assertEqual(f4.to_pairs(0),
+                    (('b', (('q', 'x'), ('s', 'z'), ('r', 'w'))),))
+
+            # an unknown field is not read as a string literal
+            config_unknown = StoreConfig(index_depth=1, rows_where=(('d', '==', 'd'),))
+            with self.assertRaises(ErrorInitFrame):
+                st1.read('f1', config=config_unknown)
+            with self.assertRaises(ErrorInitFrame):
+                st1.read_labels('f1', config=config_unknown)
+
+    def test_store_sqlite_rows_where_b(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(3, 1, 2, 5), b=('x', 'y', 'z', 'w')),
+                index=('q', 'p', 's', 'r'),
+                name='f1')
+        config = StoreConfig(index_depth=1, include_index=True)
+
+        with temp_file('.sqlite') as fp:
+            StoreSQLite(fp).write(((f1.name, f1),), config=config)
+            with sqlite3.connect(fp) as conn:
+                conn.execute('CREATE INDEX "f1_a" ON "f1" ("a")')
+
+            st1 = StoreSQLite(fp)
+
+            # rows are in stored order, not that of the index used for the conditions
+            config_where = StoreConfig(index_depth=1, rows_where=(('a', '>', 1),))
+            f2 = st1.read('f1', config=config_where)
+            self.assertEqual(f2.index.values.tolist(), ['q', 's', 'r'])
+            self.assertEqual(st1.read_labels('f1', config=config_where).values.tolist(),
+                    ['q', 's', 'r'])
+
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,14 @@
 import unittest
+import gc
+import os
 import typing as tp
+import hashlib
+import pickle
+import zipfile
 # from io import StringIO
 
+import frame_fixtures as ff
+
 from static_frame.core.frame import Frame
 from static_frame.core.frame import FrameGO
 from static_frame.core.frame import FrameHE
@@ -9,19 +16,25 @@ from static_frame.core.frame import FrameHE
 # from static_frame.core.series import Series
 
 from static_frame.core.store import StoreConfig
-# from static_frame.core.store import StoreConfigMap
+from static_frame.core.store import StoreConfigMap
 
 from static_frame.core.store_zip import _StoreZip
+from static_frame.core.store_zip import PayloadFrameToBytes
 from static_frame.core.store_zip import StoreZipTSV
 from static_frame.core.store_zip import StoreZipCSV
 from static_frame.core.store_zip import StoreZipPickle
 from static_frame.core.store_zip import StoreZipParquet
+from static_frame.core.store_zip import StoreZipNPY
+from static_frame.core.store_zip import ZIP_MANIFEST
 
 from static_frame.test.test_case import TestCase
 from static_frame.test.test_case import temp_file
 
 # from static_frame.test.test_case import skip_win
+from static_frame.core.exception import AxisInvalid
+from static_frame.core.exception import ErrorInitFrame
 from static_frame.core.exception import ErrorInitStore
+from static_frame.core.exception import ErrorNPYEncode
 # from static_frame.core.exception import ErrorInitStoreConfig
 
 
@@ -182,6 +195,57 @@ class TestUnit(TestCase):
             frame_stored = st.read(f1.name)
             self.assertEqual(frame_stored.shape, f1.shape)
 
+    def test_store_zip_parquet_d(self) -> None:
+
+        f1 = ff.parse('s(4,6)|v(int,str,bool,float)|c(I,str)|i(I,str)').rename('f1')
+        config = StoreConfig(index_depth=1, include_index=True, columns_select=('zUvW', 'zZbu'))
+
+        with temp_file('.zip') as fp:
+            st = StoreZipParquet(fp)
+            st.write(((f1.name, f1),), config=config)
+            # members are stored without compression, such that only selected columns are read
+            with zipfile.ZipFile(fp) as zf:
+                self.assertEqual(zf.getinfo('f1.parquet').compress_type, zipfile.ZIP_STORED)
+
+            for read_use_threads in (False, True):
+                c = StoreConfig(index_depth=1,
+                        columns_select=('zUvW', 'zZbu'),
+                        read_use_threads=read_use_threads,
+                        )
+                f2 = st.read('f1', config=c)
+                self.assertEqual(f2.columns.values.tolist(), ['zUvW', 'zZbu'])
+                self.assertEqual(f2.index.values.tolist(), f1.index.values.tolist())
+                self.assertEqual(f2.values.tolist(), f1[['zUvW', 'zZbu']].values.tolist())
+
+            index, columns = next(st.read_labels_many(('f1',), config=config))
+            self.assertTrue(index.equals(f2.index))
+            self.assertEqual(columns.values.tolist(), ['zUvW', 'zZbu'])
+
+            c = StoreConfig(index_depth=1, columns_select=('zUvW', 'foo'))
+            with self.assertRaises(ErrorInitFrame):
+                st.read('f1', config=c)
+            with self.assertRaises(ErrorInitFrame):
+                next(st.read_labels_many(('f1',), config=c))
+
+    def test_store_zip_parquet_e(self) -> None:
+
+        f1 = ff.parse('s(4,6)|v(int,str,bool,float)|c(I,str)|i(I,str)').rename('f1')
+        config = StoreConfig(index_depth=1, include_index=True)
+
+        with temp_file('.zip') as fp:
+            # an archive with compressed members is read in full
+            with zipfile.ZipFile(fp, 'w', zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr('f1.parquet', StoreZipParquet._payload_to_bytes(
+                        PayloadFrameToBytes(
+                                name='f1',
+                                config=config.to_store_config_he(),
+                                frame=f1,
+                                exporter=StoreZipParquet._EXPORTER,
+                                ))[1])
+            st = StoreZipParquet(fp)
+            f2 = st.read('f1', config=config)
+            self.assertEqual(f2.values.tolist(), f1.values.tolist())
+
     def test_store_zip_pickle_c(self) -> None:
 
         f1 = FrameGO.from_dict(
@@ -312,6 +376,285 @@ class TestUnit(TestCase):
                 self.assertEqual(post[1].name, 'bar')
                 self.assertEqual(post[2].name, 'foo')
 
+    #---------------------------------------------------------------------------
+
+    def test_store_zip_npy_a(self) -> None:
+
+        f1 = ff.parse('s(4,6)|v(int,float,bool,str)|i(IH,(str,int))|c(ID,dtD)').rename('foo')
+        f2 = Frame.from_dict(
+                dict(a=(1,2,3), b=(4,5,6)),
+                index=('x', 'y', 'z'),
+                name='bar')
+
+        with temp_file('.zip') as fp:
+
+            st = StoreZipNPY(fp)
+            st.write((f.name, f) for f in (f1, f2))
+
+            labels = tuple(st.labels(strip_ext=False))
+            self.assertEqual(labels, ('foo/__header__.json', 'bar/__header__.json'))
+            self.assertEqual(tuple(st.labels()), ('foo', 'bar'))
+
+            for frame in (f1, f2):
+                frame_stored = st.read(frame.name)
+                self.assertTrue(frame_stored.equals(frame,
+                        compare_name=True,
+                        compare_dtype=True,
+                        compare_class=True,
+                        ))
+                # arrays view the file without a copy, aligned to the start of their data
+                for array in frame_stored._blocks._blocks:
+                    self.assertFalse(array.flags.writeable)
+                    self.assertTrue(array.flags.aligned)
+                    self.assertFalse(array.flags.owndata)
+
+                frame_stored_2 = st.read(frame.name, container_type=FrameGO)
+                self.assertEqual(frame_stored_2.__class__, FrameGO)
+                self.assertEqual(frame_stored_2.shape, frame.shape)
+
+                frame_stored_3 = st.read(frame.name, container_type=FrameHE)
+                self.assertEqual(frame_stored_3.__class__, FrameHE)
+                self.assertEqual(frame_stored_3.shape, frame.shape)
+
+    def test_store_zip_npy_b(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=('x', None)),
+                name='foo')
+        config = StoreConfig(
+                label_encoder=lambda x: x.upper(), #type: ignore
+                label_decoder=lambda x: x.lower(),
+                )
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPY(fp)
+            with self.assertRaises(ErrorNPYEncode):
+                st.write(((f1.name, f1),))
+
+            f2 = f1.astype['b'](str)
+            st.write(((f2.name, f2),), config=config)
+            self.assertEqual(tuple(st.labels()), ('FOO',))
+            self.assertEqual(tuple(st.labels(config=config)), ('foo',))
+
+            frame_stored = st.read('foo', config=config)
+            self.assertEqual(frame_stored.to_pairs(0),
+                    (('a', ((0, 1), (1, 2))), ('b', ((0, 'x'), (1, 'None')))))
+
+    def test_store_zip_npy_c(self) -> None:
+
+        f1 = ff.parse('s(4,3)|i(ID,dtD)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(2,6)|i(IH,(str,int))|c(IH,(str,str))').rename('f2')
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPY(fp)
+            st.write((f.name, f) for f in (f1, f2))
+
+            post = tuple(st.read_labels_many(('f2', 'f1')))
+            self.assertTrue(post[0][0].equals(f2.index, compare_class=True))
+            self.assertTrue(post[0][1].equals(f2.columns, compare_class=True))
+            self.assertTrue(post[1][0].equals(f1.index, compare_class=True))
+            self.assertTrue(post[1][1].equals(f1.columns, compare_class=True))
+
+            self.assertTrue(st.read_labels('f1', axis=1).equals(f1.columns))
+            with self.assertRaises(AxisInvalid):
+                st.read_labels('f1', axis=2)
+
+    def test_store_zip_parquet_c(self) -> None:
+
+        f1 = ff.parse('s(4,3)|i(ID,dtD)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(2,6)|i(IH,(str,int))|c(IH,(str,str))').rename('f2')
+        frames = (f1, f2)
+        config = StoreConfigMap.from_frames(frames)
+
+        with temp_file('.zip') as fp:
+            st = StoreZipParquet(fp)
+            st.write(((f.name, f) for f in frames), config=config)
+
+            for f_stored, (index, columns) in zip(
+                    st.read_many(('f1', 'f2'), config=config),
+                    st.read_labels_many(('f1', 'f2'), config=config),
+                    ):
+                self.assertTrue(index.equals(f_stored.index, compare_class=True))
+                self.assertTrue(columns.equals(f_stored.columns, compare_class=True))
+
+    def test_store_zip_pickle_c(self) -> None:
+
+        f1 = ff.parse('s(4,3)|i(ID,dtD)|c(I,str)').rename('f1')
+
+        with temp_file('.zip') as fp:
+            st = StoreZipPickle(fp)
+            st.write(((f1.name, f1),))
+            # labels are read from the full Frame
+            self.assertTrue(st.read_labels('f1').equals(f1.index, compare_class=True))
+
+    def test_store_zip_manifest_a(self) -> None:
+
+        f1 = ff.parse('s(4,3)|v(int,str,bool)|c(IH,(str,int))').rename('f1')
+        f2 = ff.parse('s(2,2)|c(ID,dtD)').rename('f2')
+
+        with temp_file('.zip') as fp:
+            st = StoreZipPickle(fp)
+            st.write(((f.name, f) for f in (f2, f1)),
+                    config=StoreConfig(write_manifest=True))
+            self.assertEqual(tuple(st.labels()), ('f2', 'f1'))
+
+            post = st.manifest()
+            self.assertEqual(tuple(post), ('f2', 'f1')) #type: ignore
+            self.assertEqual(post['f1'].shape, (4, 3)) #type: ignore
+            self.assertEqual(post['f1'].dtypes, tuple(zip(f1.columns, f1.dtypes.values))) #type: ignore
+            self.assertEqual(post['f1'].nbytes, f1.nbytes) #type: ignore
+            # date labels cannot be encoded as JSON
+            self.assertEqual(post['f2'].dtypes, None) #type: ignore
+
+            with zipfile.ZipFile(fp) as zf:
+                digest = hashlib.sha256(zf.read('f1.pickle')).hexdigest()
+            self.assertEqual(post['f1'].digest, digest) #type: ignore
+
+    def test_store_zip_manifest_b(self) -> None:
+
+        f1 = ff.parse('s(4,3)|v(int,str,bool)').rename('f1')
+
+        with temp_file('.zip') as fp:
+            # an archive written without a manifest
+            with zipfile.ZipFile(fp, 'w') as zf:
+                zf.writestr('f1.pickle', pickle.dumps(f1))
+
+            st = StoreZipPickle(fp)
+            self.assertEqual(tuple(st.labels()), ('f1',))
+            self.assertIsNone(st.manifest())
+
+            st.write(((f1.name, f1),), config=StoreConfig(write_manifest=True))
+            self.assertEqual(st.manifest()['f1'].shape, (4, 3)) #type: ignore
+
+    def test_store_zip_manifest_c(self) -> None:
+
+        f1 = ff.parse('s(4,3)|v(int,str,bool)').rename('f1')
+        config = StoreConfig(index_depth=1, columns_depth=1, include_index=True,
+                write_manifest=True)
+
+        with temp_file('.zip') as fp:
+            st = StoreZipCSV(fp)
+            st.write(((f1.name, f1),), config=config)
+
+            # dtypes and nbytes may change in reading
+            post = st.manifest(config=config)
+            self.assertEqual(post['f1'].shape, (4, 3)) #type: ignore
+            self.assertEqual(post['f1'].dtypes, None) #type: ignore
+            self.assertEqual(post['f1'].nbytes, None) #type: ignore
+            self.assertEqual(st.read('f1', config=config).shape, (4, 3))
+
+            # a Frame read with other depths is not described
+            self.assertEqual(st.manifest(), {})
+
+    def test_store_zip_manifest_d(self) -> None:
+
+        f1 = ff.parse('s(4,3)|v(int,str,bool)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(2,2)|v(float)|c(I,str)').rename('f2')
+        config = StoreConfig(index_depth=1, include_index=True)
+
+        for cls in (StoreZipPickle, StoreZipParquet, StoreZipNPY, StoreZipCSV):
+            with temp_file('.zip') as fp:
+                st = cls(fp)
+                st.write(((f.name, f) for f in (f2, f1)), config=config)
+
+                # by default, no manifest is written, such that archives can be read by prior versions
+                with zipfile.ZipFile(fp) as zf:
+                    self.assertNotIn(ZIP_MANIFEST, zf.namelist())
+                self.assertIsNone(st.manifest())
+
+                st = cls(fp)
+                self.assertEqual(sorted(st.labels()), ['f1', 'f2'])
+                post = st.read('f1', config=config)
+                self.assertEqual(post.shape, (4, 3))
+                self.assertEqual(post.columns.values.tolist(), f1.columns.values.tolist())
+
+    def test_store_zip_read_use_threads_a(self) -> None:
+
+        frames = tuple(ff.parse(f's({i + 2},3)|v(int,str,bool)').rename(str(i))
+                for i in range(6))
+        labels = ('3', '0', '5', '1')
+        config_write = StoreConfig(index_depth=1, include_index=True)
+
+        for cls in (StoreZipParquet, StoreZipPickle, StoreZipCSV):
+            with temp_file('.zip') as fp:
+                st = cls(fp)
+                st.write(((f.name, f) for f in frames), config=config_write)
+
+                post1 = tuple(st.read_many(labels, config=config_write))
+                for max_workers in (None, 1, 3):
+                    config = StoreConfig(index_depth=1,
+                            read_max_workers=max_workers,
+                            read_use_threads=True,
+                            )
+                    post2 = tuple(st.read_many(labels, config=config))
+                    self.assertEqual([f.name for f in post2], list(labels))
+                    for f1, f2 in zip(post1, post2):
+                        self.assertTrue(f1.equals(f2, compare_dtype=True))
+
+                # remaining reads are abandoned if not consumed
+                post3 = st.read_many(labels, config=config)
+                self.assertEqual(next(post3).name, '3')
+                post3.close()
+
+    def test_store_zip_read_use_threads_b(self) -> None:
+
+        built = []
+
+        class StoreZipPickleCount(StoreZipPickle):
+            @staticmethod
+            def _build_frame(**kwargs: tp.Any) -> Frame: #type: ignore
+                built.append(kwargs['name'])
+                return StoreZipPickle._build_frame(**kwargs)
+
+        frames = tuple(ff.parse('s(2,3)').rename(str(i)) for i in range(40))
+        config = StoreConfig(read_max_workers=2, read_use_threads=True)
+
+        with temp_file('.zip') as fp:
+            st = StoreZipPickleCount(fp)
+            st.write((f.name, f) for f in frames)
+
+            consumed = []
+            def labels() -> tp.Iterator[str]:
+                for f in frames:
+                    consumed.append(f.name)
+                    yield f.name
+
+            post = st.read_many(labels(), config=config)
+            self.assertEqual(next(post).name, '0')
+            # labels are submitted no more than twice the number of workers ahead of the consumer
+            self.assertEqual(len(consumed), 4)
+            post.close()
+            self.assertTrue(len(built) <= 4)
+
+
+    @unittest.skipIf(not os.path.exists('/proc/self/maps'), 'requires /proc/self/maps')
+    def test_store_zip_parquet_mmap_a(self) -> None:
+
+        def map_count(fp: str) -> int:
+            # a map viewed by objects in a reference cycle is released on collection
+            gc.collect()
+            with open('/proc/self/maps') as f:
+                return sum(line.rstrip().endswith(fp) for line in f)
+
+        frames = tuple(ff.parse('s(20,3)|v(int,float)').rename(str(i)) for i in range(6))
+        labels = [f.name for f in frames]
+
+        with temp_file('.zip') as fp:
+            fp = os.path.realpath(fp)
+            st = StoreZipParquet(fp)
+            st.write((f.name, f) for f in frames)
+
+            # one map is used for all members read, and is closed when reading ends
+            for read in (st.read_many, st.read_labels_many):
+                counts = [map_count(fp) for _ in read(labels)]
+                self.assertEqual(counts, [1] * len(labels))
+                self.assertEqual(map_count(fp), 0)
+
+            post = st.read_many(labels)
+            next(post)
+            post.close()
+            self.assertEqual(map_count(fp), 0)
+
 
 class TestUnitMultiProcess(TestCase):
 
@@ -360,6 +703,9 @@ class TestUnitMultiProcess(TestCase):
     def test_store_zip_parquet_mp(self) -> None:
         self.run_assertions(StoreZipParquet)
 
+    def test_store_zip_npy_mp(self) -> None:
+        self.run_assertions(StoreZipNPY)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1475,6 +1475,37 @@ class TestUnit(TestCase):
                 [[0, 0, 1, 2, True, False, True], [0, 0, 1, 1, True, False, True]])
 
 
+    def test_type_blocks_group_c(self) -> None:
+
+        a1 = np.array([10, 9, 10, 9, 10])
+        a2 = np.array(['b', 'a', 'b', 'a', 'a'])
+        a3 = np.array([np.nan, 1.5, np.nan, 1.5, 0.5])
+        tb1 = TypeBlocks.from_blocks((a1, a2, a3))
+
+        # mixed dtypes are factorized per column, ordering numerically rather than by string representation
+        groups = list(tb1.group(axis=0, key=[0, 1, 2]))
+        self.assertEqual([g for g, _, _ in groups],
+                [(9, 'a', 1.5), (10, 'a', 0.5), (10, 'b', groups[2][0][2])])
+        self.assertTrue(np.isnan(groups[2][0][2]))
+        self.assertEqual([s.tolist() for _, s, _ in groups],
+                [[1, 3], [4], [0, 2]])
+        self.assertEqual(groups[2][2].shape, (2, 3))
+
+    def test_type_blocks_group_d(self) -> None:
+
+        a1 = np.array([[1, 2, 1, 2], [0, 0, 0, 1], [5, 6, 7, 8]])
+        tb1 = TypeBlocks.from_blocks(a1)
+
+        groups = list(tb1.group(axis=1, key=[0, 1]))
+        self.assertEqual([g for g, _, _ in groups], [(1, 0), (2, 0), (2, 1)])
+        self.assertEqual(groups[0][2].values.tolist(), [[1, 1], [0, 0], [5, 7]])
+
+        groups = list(tb1.group(axis=1, key=[1]))
+        self.assertEqual([g for g, _, _ in groups], [0, 1])
+
+        with self.assertRaises(AxisInvalid):
+            list(tb1.group(axis=2, key=0))
+
     def test_type_blocks_transpose_a(self) -> None:
 
         a1 = np.array([[1, 2, 3], [4, 5, 6], [0, 0, 1]])
@@ -2848,6 +2879,27 @@ class TestUnit(TestCase):
                 [False, False, False]
                 )
 
+    def test_type_blocks_pickle_b(self) -> None:
+
+        a1 = np.arange(12).reshape(4, 3)
+        a2 = np.array(['b', 'c', 'd', 'e'])
+        tb1 = TypeBlocks.from_blocks((a1[:, 1:], a2, a1[::-1, 0]))
+
+        buffers: tp.List[pickle.PickleBuffer] = []
+        pbytes = pickle.dumps(tb1, protocol=5, buffer_callback=buffers.append)
+        # all blocks, including non-contiguous views, are out-of-band
+        self.assertEqual(len(buffers), 3)
+
+        tb2 = pickle.loads(pbytes, buffers=[bytearray(b.raw()) for b in buffers])
+        self.assertEqual(tb2.shape, (4, 4))
+        self.assertTrue((tb1.values == tb2.values).all())
+        self.assertEqual([b.flags.writeable for b in tb2._blocks],
+                [False, False, False]
+                )
+
+        tb3 = pickle.loads(pickle.dumps(tb1, protocol=2))
+        self.assertTrue((tb1.values == tb3.values).all())
+
 
     #---------------------------------------------------------------------------
     def test_type_blocks_roll_blocks_a(self) -> None:
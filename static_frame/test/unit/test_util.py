@@ -2,6 +2,8 @@
 
 import unittest
 import datetime
+import io
+import os
 import typing as tp
 from enum import Enum
 
@@ -10,6 +12,7 @@ import numpy as np
 from static_frame.core.util import _array_to_duplicated_sortable
 from static_frame.core.util import _gen_skip_middle
 from static_frame.core.util import _isin_1d
+from static_frame.core.util import _sliding_window_view_strided
 from static_frame.core.util import _isin_2d
 from static_frame.core.util import _read_url
 from static_frame.core.util import _ufunc_logical_skipna
@@ -63,9 +66,33 @@ from static_frame.core.util import duplicate_filter
 from static_frame.core.util import array_deepcopy
 from static_frame.core.util import array_from_element_apply
 from static_frame.core.util import get_tuple_constructor
+from static_frame.core.util import array_to_codes
+from static_frame.core.util import arrays_to_codes
+from static_frame.core.util import join_arrays_to_ilocs
+from static_frame.core.util import join_codes_to_ilocs
+from static_frame.core.util import join_sorted_arrays_to_ilocs
+from static_frame.core.util import array_is_sorted
+from static_frame.core.util import asof_ilocs
+from static_frame.core.util import codes_to_group_positions
+from static_frame.core.util import array_group_reduce
+from static_frame.core.util import window_positions
+from static_frame.core.util import array_window_reduce
+from static_frame.core.util import array_window_view
+from static_frame.core.util import str_array_to_array
+from static_frame.core.util import delimited_chunks
+from static_frame.core.util import delimited_chunk_to_arrays
+from static_frame.core.util import delimited_parts_to_array
+from static_frame.core.util import delimited_parts_conflict
+from static_frame.core.util import delimited_rows_to_parts
+from static_frame.core.util import delimited_records
+from static_frame.core.util import delimited_ranges
+from static_frame.core.util import delimited_range_to_parts
+from static_frame.core.util import path_replace_manager
 
 from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import temp_file
 from static_frame.test.test_case import UnHashable
+from static_frame.test.test_case import skip_win
 
 
 class TestUnit(TestCase):
@@ -1857,6 +1884,156 @@ class TestUnit(TestCase):
 
         self.assertEqual(len(iterable_to_array_nd(())), 0)
 
+    #---------------------------------------------------------------------------
+    def test_str_array_to_array_a(self) -> None:
+        self.assertEqual(str_array_to_array(np.array(['1', ' 20', '-3'])).tolist(),
+                [1, 20, -3])
+        self.assertEqual(str_array_to_array(np.array(['1', '2.5'])).dtype,
+                np.dtype(float))
+        self.assertEqual(str_array_to_array(np.array(['TRUE', 'false'])).tolist(),
+                [True, False])
+        self.assertEqual(str_array_to_array(np.array(['1+2j', '3'])).tolist(),
+                [1+2j, 3+0j])
+        # underscores are not digit separators
+        self.assertEqual(str_array_to_array(np.array(['2020_01', '3'])).tolist(),
+                ['2020_01', '3'])
+        # too large for an int64
+        self.assertEqual(str_array_to_array(np.array(['99999999999999999999'])).dtype,
+                np.dtype(float))
+        self.assertIs(str_array_to_array(np.array(['', ''])), None)
+
+    def test_str_array_to_array_b(self) -> None:
+        a1 = str_array_to_array(np.array(['1', '', '3']))
+        self.assertEqual(a1.dtype, np.dtype(float))
+        self.assertAlmostEqualValues(a1.tolist(), [1, np.nan, 3])
+
+        a2 = str_array_to_array(np.array(['True', '']))
+        self.assertEqual(a2.dtype, np.dtype(object))
+        self.assertAlmostEqualValues(a2.tolist(), [True, np.nan])
+
+        a3 = str_array_to_array(np.array(['a', '']))
+        self.assertEqual(a3.tolist(), ['a', ''])
+
+    def test_delimited_chunks_a(self) -> None:
+        rows = [['a', 'b'], ['c'], ['d', 'e'], ['f', 'g'], ['h', 'i']]
+        post1 = list(delimited_chunks(rows, count=2, chunksize=2))
+        self.assertEqual(post1,
+                [[['a', 'b']], [['d', 'e'], ['f', 'g']], [['h', 'i']]])
+
+        post2 = list(delimited_chunks(rows, count=2, chunksize=2, skip_footer=2))
+        self.assertEqual(post2, [[['a', 'b']], [['d', 'e']]])
+
+        with self.assertRaises(RuntimeError):
+            list(delimited_chunks(rows, count=2, chunksize=0))
+
+    def test_delimited_chunk_to_arrays_a(self) -> None:
+        chunk = [['1', 'a', '001'], ['2', 'b', '002']]
+        post1 = delimited_chunk_to_arrays(chunk, positions=(0, 1, 2))
+        self.assertEqual([a.tolist() for a in post1], [[1, 2], ['a', 'b'], [1, 2]])
+
+        post2 = delimited_chunk_to_arrays(chunk,
+                positions=(0, 2),
+                str_positions=frozenset((2,)),
+                )
+        self.assertEqual([a.tolist() for a in post2], [[1, 2], ['001', '002']])
+
+        post3 = delimited_chunk_to_arrays(chunk, positions=(1,))
+        self.assertEqual([a.tolist() for a in post3], [['a', 'b']])
+
+    def test_delimited_parts_to_array_a(self) -> None:
+        a1 = delimited_parts_to_array(
+                [np.array([1, 2]), np.array([0.5])], (2, 1))
+        self.assertEqual(a1.tolist(), [1.0, 2.0, 0.5])
+        self.assertFalse(a1.flags.writeable)
+
+        a2 = delimited_parts_to_array(
+                [np.array([1, 2]), None], (2, 2))
+        self.assertEqual(a2.dtype, np.dtype(float))
+        self.assertAlmostEqualValues(a2.tolist(), [1, 2, np.nan, np.nan])
+
+        a3 = delimited_parts_to_array(
+                [None, np.array(['a'])], (1, 1))
+        self.assertEqual(a3.tolist(), ['', 'a'])
+
+        a4 = delimited_parts_to_array(
+                [np.array([True]), np.array([3])], (1, 1))
+        self.assertEqual(a4.dtype, np.dtype(object))
+        self.assertEqual(a4.tolist(), [True, 3])
+
+        a5 = delimited_parts_to_array([None], (2,))
+        self.assertEqual(a5.dtype, np.dtype(float))
+
+    def test_delimited_parts_conflict_a(self) -> None:
+        self.assertFalse(delimited_parts_conflict([np.array([1]), np.array([0.5]), None]))
+        self.assertFalse(delimited_parts_conflict([np.array([True]), None]))
+        self.assertFalse(delimited_parts_conflict([np.array(['a']), None]))
+        self.assertTrue(delimited_parts_conflict([np.array([1]), np.array(['x'])]))
+        self.assertTrue(delimited_parts_conflict([np.array([True]), np.array([1.5])]))
+        self.assertTrue(delimited_parts_conflict(
+                [np.array([True, np.nan], dtype=object), np.array([1])]))
+
+    def test_delimited_rows_to_parts_a(self) -> None:
+        def to_arrays(rows, chunksize):
+            parts, sizes = delimited_rows_to_parts(rows,
+                    count=2,
+                    positions=(0, 1),
+                    str_positions=frozenset(),
+                    chunksize=chunksize,
+                    skip_footer=0,
+                    )
+            return [delimited_parts_to_array(p, sizes) for p in parts]
+
+        rows = [['1', 'True'], ['1', 'True'], ['', 'True'], ['1', 'x'], ['2', 'FALSE']]
+        post = [to_arrays(rows, chunksize) for chunksize in (1, 2, 3, 5)]
+        for arrays in post:
+            self.assertEqual(arrays[0].dtype, np.dtype(float))
+            self.assertAlmostEqualValues(arrays[0].tolist(), [1, 1, np.nan, 1, 2])
+            self.assertEqual(arrays[1].dtype, np.dtype('<U5'))
+            self.assertEqual(arrays[1].tolist(),
+                    ['True', 'True', 'True', 'x', 'FALSE'])
+
+        rows = [['1', 'True'], ['2', ''], ['x', '1.5']]
+        for chunksize in (1, 2, 3):
+            a1, a2 = to_arrays(rows, chunksize)
+            self.assertEqual(a1.tolist(), ['1', '2', 'x'])
+            self.assertEqual(a2.tolist(), ['True', '', '1.5'])
+
+    def test_delimited_records_a(self) -> None:
+        f = io.BytesIO(b'a,b\n1,"x\ny"\n2,z\n')
+        post = list(delimited_records(f, quote_char='"'))
+        self.assertEqual(post,
+                [(0, b'a,b\n'), (4, b'1,"x\ny"\n'), (12, b'2,z\n')])
+
+    def test_delimited_ranges_a(self) -> None:
+        rows = [f'{i},"a\n{i}"\n' for i in range(20)]
+        with temp_file('.csv') as fp:
+            with open(fp, 'w') as f:
+                f.write('x,y\n' + ''.join(rows))
+
+            ranges = delimited_ranges(fp, start=4, count=3, quote_char='"', size_min=10)
+            self.assertEqual(len(ranges), 3)
+            self.assertEqual(ranges[0][0], 4)
+            self.assertEqual(ranges[-1][1], os.path.getsize(fp))
+
+            post = []
+            for start, stop in ranges:
+                parts, sizes = delimited_range_to_parts(fp, start, stop,
+                        delimiter=',',
+                        quote_char='"',
+                        encoding=None,
+                        count=2,
+                        positions=(0, 1),
+                        str_positions=frozenset(),
+                        skip_footer=0,
+                        )
+                post.extend(parts[1][0].tolist())
+            # no range starts within a quoted field
+            self.assertEqual(post, [f'a\n{i}' for i in range(20)])
+
+            self.assertEqual(
+                    delimited_ranges(fp, start=4, count=3, quote_char='"'),
+                    [(4, os.path.getsize(fp))])
+
 
     #---------------------------------------------------------------------------
     def test_argmin_1d_a(self) -> None:
@@ -2415,6 +2592,337 @@ class TestUnit(TestCase):
             cls2 = get_tuple_constructor(('a ', '3*'))
 
 
+    #---------------------------------------------------------------------------
+    def test_array_to_codes_a(self) -> None:
+        codes, count = array_to_codes(np.array(['c', 'a', 'c', 'b']))
+        self.assertEqual(codes.tolist(), [2, 0, 2, 1])
+        self.assertEqual(count, 3)
+
+    def test_array_to_codes_b(self) -> None:
+        codes, count = array_to_codes(np.array([3.0, np.nan, 1.0, 3.0, np.nan]))
+        self.assertEqual(codes.tolist(), [1, -1, 0, 1, -1])
+        self.assertEqual(count, 2)
+
+    def test_array_to_codes_c(self) -> None:
+        # unorderable values fall back to hashing in order of appearance
+        codes, count = array_to_codes(np.array(['b', None, 1, 'b', True, None], dtype=object))
+        self.assertEqual(codes.tolist(), [0, 1, 2, 0, 2, 1])
+        self.assertEqual(count, 3)
+
+    def test_arrays_to_codes_a(self) -> None:
+        codes, count = arrays_to_codes((
+                np.array([1, 0, 1, 0, 1]),
+                np.array(['b', 'a', 'b', 'b', 'a']),
+                ))
+        self.assertEqual(codes.tolist(), [3, 0, 3, 1, 2])
+        self.assertEqual(count, 4)
+
+    def test_arrays_to_codes_b(self) -> None:
+        codes, count = arrays_to_codes((
+                np.array([1, 0, 1, 0]),
+                np.array([np.nan, 2.0, 1.0, 2.0]),
+                ))
+        self.assertEqual(codes.tolist(), [-1, 0, 1, 0])
+        self.assertEqual(count, 2)
+
+        with self.assertRaises(RuntimeError):
+            arrays_to_codes(())
+
+    def test_join_codes_to_ilocs_a(self) -> None:
+        iloc_left, iloc_right = join_codes_to_ilocs(
+                np.array([1, -1, 0, 2, 1]),
+                np.array([1, 0, 1, -1]),
+                3,
+                )
+        self.assertEqual(iloc_left.tolist(), [0, 0, 2, 4, 4])
+        self.assertEqual(iloc_right.tolist(), [0, 2, 1, 0, 2])
+
+    def test_join_arrays_to_ilocs_a(self) -> None:
+        iloc_left, iloc_right = join_arrays_to_ilocs(
+                (np.array([10, 20, 10, 30]),),
+                (np.array([30.0, 10.0, np.nan, 10.0]),),
+                )
+        self.assertEqual(iloc_left.tolist(), [0, 0, 2, 2, 3])
+        self.assertEqual(iloc_right.tolist(), [1, 3, 1, 3, 0])
+
+    def test_join_arrays_to_ilocs_b(self) -> None:
+        # values of different types are not matched
+        iloc_left, iloc_right = join_arrays_to_ilocs(
+                (np.array(['1', '2']), np.array([1, 2])),
+                (np.array([1, 2]), np.array([1, 2])),
+                )
+        self.assertEqual(iloc_left.tolist(), [])
+        self.assertEqual(iloc_right.tolist(), [])
+
+        iloc_left, iloc_right = join_arrays_to_ilocs(
+                (np.array(['a', 'b']), np.array([1, 2])),
+                (np.array(['b', 'a', 'b'], dtype=object), np.array([2, 1, 3])),
+                )
+        self.assertEqual(iloc_left.tolist(), [0, 1])
+        self.assertEqual(iloc_right.tolist(), [1, 0])
+
+
+    def test_array_is_sorted_a(self) -> None:
+        self.assertTrue(array_is_sorted(np.array([])))
+        self.assertTrue(array_is_sorted(np.array([np.nan])))
+        self.assertTrue(array_is_sorted(np.array([1, 1, 2, 5])))
+        self.assertFalse(array_is_sorted(np.array([1, 3, 2])))
+        self.assertFalse(array_is_sorted(np.array([1.0, 2.0, np.nan])))
+        self.assertTrue(array_is_sorted(np.array(['2021-01', '2021-03'], dtype='datetime64[M]')))
+
+    def test_join_sorted_arrays_to_ilocs_a(self) -> None:
+        iloc_left, iloc_right = join_sorted_arrays_to_ilocs(
+                np.array([1, 2, 2, 4, 5]),
+                np.array([0, 2, 2, 3, 5]),
+                )
+        self.assertEqual(iloc_left.tolist(), [1, 1, 2, 2, 4])
+        self.assertEqual(iloc_right.tolist(), [1, 2, 1, 2, 4])
+
+    def test_join_sorted_arrays_to_ilocs_b(self) -> None:
+        iloc_left, iloc_right = join_sorted_arrays_to_ilocs(
+                np.array([np.nan]),
+                np.array([np.nan]),
+                )
+        self.assertEqual(iloc_left.tolist(), [])
+        self.assertEqual(iloc_right.tolist(), [])
+
+    def test_join_arrays_to_ilocs_c(self) -> None:
+        # sorted keys of different datetime units are resolved and merged
+        iloc_left, iloc_right = join_arrays_to_ilocs(
+                (np.array(['2021-01-01', '2021-01-02', '2021-01-04'], dtype='datetime64[D]'),),
+                (np.array(['2021-01-02T00:00', '2021-01-03T00:00', '2021-01-04T00:00', '2021-01-04T01:00'], dtype='datetime64[m]'),),
+                )
+        self.assertEqual(iloc_left.tolist(), [1, 2])
+        self.assertEqual(iloc_right.tolist(), [0, 2])
+
+
+    def test_asof_ilocs_a(self) -> None:
+        src = np.array([10, 20, 30])
+        dst = np.array([5, 10, 14, 16, 30, 35])
+        self.assertEqual(asof_ilocs(src, dst).tolist(),
+                [-1, 0, 0, 0, 2, 2])
+        self.assertEqual(asof_ilocs(src, dst, direction='forward').tolist(),
+                [0, 0, 1, 1, 2, -1])
+        self.assertEqual(asof_ilocs(src, dst, direction='nearest').tolist(),
+                [0, 0, 0, 1, 2, 2])
+        self.assertEqual(asof_ilocs(src, dst, direction='nearest', tolerance=4).tolist(),
+                [-1, 0, 0, 1, 2, -1])
+        # ties prefer the backward label
+        self.assertEqual(asof_ilocs(src, np.array([15, 25]), direction='nearest').tolist(),
+                [0, 1])
+
+    def test_asof_ilocs_b(self) -> None:
+        src = np.array(['2021-01-01', '2021-01-05'], dtype='datetime64[D]')
+        dst = np.array(['2021-01-02T12:00', 'NaT', '2021-01-07T00:00'], dtype='datetime64[m]')
+        self.assertEqual(asof_ilocs(src, dst).tolist(), [0, -1, 1])
+        self.assertEqual(asof_ilocs(src, dst,
+                tolerance=datetime.timedelta(days=1)).tolist(), [-1, -1, -1])
+        self.assertEqual(asof_ilocs(src, dst,
+                tolerance=np.timedelta64(2, 'D')).tolist(), [0, -1, 1])
+
+    def test_asof_ilocs_c(self) -> None:
+        with self.assertRaises(RuntimeError):
+            asof_ilocs(np.array([3, 1]), np.array([2]))
+        with self.assertRaises(RuntimeError):
+            asof_ilocs(np.array([1, 3]), np.array([2]), direction='up')
+        with self.assertRaises(RuntimeError):
+            asof_ilocs(np.array([1, 3], dtype=object), np.array([2]))
+        with self.assertRaises(RuntimeError):
+            asof_ilocs(np.array(['a', 'c']), np.array(['b']), direction='nearest')
+        with self.assertRaises(RuntimeError):
+            asof_ilocs(np.array([False, True]), np.array([True]), direction='nearest')
+        with self.assertRaises(RuntimeError):
+            asof_ilocs(np.array(['a', 'c']), np.array(['b']), tolerance=1)
+        # backward and forward only need ordering
+        self.assertEqual(asof_ilocs(np.array(['a', 'c']), np.array(['b'])).tolist(), [0])
+
+    #---------------------------------------------------------------------------
+
+    def test_arrays_to_codes_c(self) -> None:
+        a1 = np.array([2.0, np.nan, 1.0, np.nan])
+        a2 = np.array(['b', 'a', 'b', 'a'])
+
+        codes, count = arrays_to_codes((a1, a2), skipna=False)
+        self.assertEqual(codes.tolist(), [1, 2, 0, 2])
+        self.assertEqual(count, 3)
+
+        codes, count = array_to_codes(a1, skipna=False)
+        self.assertEqual(codes.tolist(), [1, 2, 0, 2])
+        self.assertEqual(count, 3)
+
+    def test_codes_to_group_positions_a(self) -> None:
+        order, starts, counts = codes_to_group_positions(
+                np.array([1, 0, -1, 1, 0, 2]), 3)
+        self.assertEqual(order.tolist(), [1, 4, 0, 3, 5])
+        self.assertEqual(starts.tolist(), [0, 2, 4])
+        self.assertEqual(counts.tolist(), [2, 2, 1])
+
+    def test_array_group_reduce_a(self) -> None:
+        order, starts, counts = codes_to_group_positions(
+                np.array([1, 0, 1, 0, 2]), 3)
+        a1 = np.array([[1, 2.5], [2, np.nan], [3, 1.0], [4, 4.0], [5, np.nan]])
+
+        post1 = array_group_reduce(a1, order, starts, counts, func='sum')
+        self.assertEqual(post1.tolist(), [[6.0, 4.0], [4.0, 3.5], [5.0, 0.0]])
+        self.assertFalse(post1.flags.writeable)
+
+        post2 = array_group_reduce(a1, order, starts, counts, func='count')
+        self.assertEqual(post2.tolist(), [[2, 1], [2, 2], [1, 0]])
+
+        post3 = array_group_reduce(a1, order, starts, counts, func='count', skipna=False)
+        self.assertEqual(post3.tolist(), [[2, 2], [2, 2], [1, 1]])
+
+        post4 = array_group_reduce(a1[:, 1], order, starts, counts, func='min', skipna=False)
+        self.assertEqual(np.isnan(post4).tolist(), [True, False, True])
+
+        post5 = array_group_reduce(a1[:, 1], order, starts, counts, func='last')
+        self.assertEqual(post5[1], 1.0)
+
+        with self.assertRaises(RuntimeError):
+            array_group_reduce(a1, order, starts, counts, func='median')
+
+    def test_array_group_reduce_b(self) -> None:
+        order, starts, counts = codes_to_group_positions(
+                np.array([0, 1, 0, 1]), 2)
+
+        a1 = np.array([3, None, 'a', 2], dtype=object)
+        post1 = array_group_reduce(a1[[0, 1, 3]], *codes_to_group_positions(np.array([0, 1, 1]), 2), func='max')
+        self.assertEqual(post1.tolist(), [3, 2])
+
+        a2 = np.array(['b', 'c', 'a', 'd'])
+        self.assertEqual(array_group_reduce(a2, order, starts, counts, func='min').tolist(),
+                ['a', 'c'])
+        self.assertEqual(array_group_reduce(a2, order, starts, counts, func='sum').tolist(),
+                ['ba', 'cd'])
+
+        a3 = np.array(['2020-01', 'NaT', '2019-05', 'NaT'], dtype='datetime64[M]')
+        post3 = array_group_reduce(a3, order, starts, counts, func='min')
+        self.assertEqual(str(post3[0]), '2019-05')
+        self.assertTrue(np.isnat(post3[1]))
+
+        post4 = array_group_reduce(a1, order, starts, counts, func='first')
+        self.assertEqual(post4.tolist(), [3, None])
+
+    #---------------------------------------------------------------------------
+
+    def test_window_positions_a(self) -> None:
+        starts, stops, ilocs = window_positions(5, size=2)
+        self.assertEqual(starts.tolist(), [0, 1, 2, 3])
+        self.assertEqual(stops.tolist(), [2, 3, 4, 5])
+        self.assertEqual(ilocs.tolist(), [1, 2, 3, 4])
+
+        starts, stops, ilocs = window_positions(5, size=3, step=2, window_sized=False)
+        self.assertEqual(starts.tolist(), [0, 2])
+        self.assertEqual(stops.tolist(), [3, 5])
+        self.assertEqual(ilocs.tolist(), [2, 4])
+
+        starts, stops, ilocs = window_positions(4, size=2, start_shift=-2, label_shift=1, window_sized=False)
+        self.assertEqual(starts.tolist(), [0, 0, 0, 1])
+        self.assertEqual(stops.tolist(), [0, 1, 2, 3])
+        self.assertEqual(ilocs.tolist(), [0, 1, 2, 3])
+
+        with self.assertRaises(RuntimeError):
+            window_positions(4, size=0)
+        with self.assertRaises(RuntimeError):
+            window_positions(4, size=2, step=-1)
+
+    def test_array_window_reduce_a(self) -> None:
+        a1 = np.array([[3, 1], [1, 4], [4, 1], [1, 5], [5, 9]])
+        starts, stops, _ = window_positions(5, size=3, start_shift=-1, window_sized=False)
+
+        post1 = array_window_reduce(a1, starts, stops, size=3, func='min')
+        self.assertEqual(post1.tolist(), [[1, 1], [1, 1], [1, 1], [1, 1]])
+        self.assertFalse(post1.flags.writeable)
+
+        post2 = array_window_reduce(a1, starts, stops, size=3, func='sum')
+        self.assertEqual(post2.tolist(), [[4, 5], [8, 6], [6, 10], [10, 15]])
+
+        post3 = array_window_reduce(a1[:, 0], starts, stops, size=3, func='last')
+        self.assertEqual(post3.tolist(), [1, 4, 1, 5])
+
+        with self.assertRaises(RuntimeError):
+            array_window_reduce(a1, starts, stops, size=3, func='median')
+
+    def test_array_window_reduce_b(self) -> None:
+        a1 = np.array([[1.0, -np.inf], [np.inf, 2.0], [3.0, np.nan], [4.0, 5.0], [1e15, 6.0]])
+        starts, stops, _ = window_positions(5, size=2, start_shift=-1, window_sized=False)
+
+        post1 = array_window_reduce(a1, starts, stops, size=2, func='sum')
+        self.assertEqual(post1.tolist(),
+                [[1.0, -np.inf], [np.inf, -np.inf], [np.inf, 2.0], [7.0, 5.0], [1e15 + 4.0, 11.0]])
+
+        post2 = array_window_reduce(a1, starts, stops, size=2, func='std', skipna=False)
+        self.assertEqual(np.isnan(post2).tolist(),
+                [[False, True], [True, True], [True, True], [False, True], [False, False]])
+        self.assertEqual(post2[3, 0], 0.5)
+
+        with self.assertRaises(RuntimeError):
+            array_window_reduce(a1, starts, stops, size=2, func='var')
+
+    def test_array_window_view_a(self) -> None:
+        a1 = np.arange(12).reshape(6, 2)
+
+        post1 = array_window_view(a1, np.array([0, 2, 4]), size=2)
+        self.assertEqual(post1.shape, (3, 2, 2))
+        self.assertEqual(post1[1].tolist(), a1[2:4].tolist())
+        self.assertTrue(np.shares_memory(post1, a1))
+        self.assertFalse(post1.flags.writeable)
+
+        post2 = array_window_view(a1, np.array([0]), size=2, axis=1)
+        self.assertEqual(post2.tolist(), [a1.tolist()])
+
+        post3 = array_window_view(a1[:, 0], np.array([0, 1, 3]), size=3)
+        self.assertEqual(post3.tolist(), [[0, 2, 4], [2, 4, 6], [6, 8, 10]])
+        self.assertFalse(post3.flags.writeable)
+
+        post4 = array_window_view(a1, np.array([], dtype=int), size=3, axis=1)
+        self.assertEqual(post4.shape, (0, 6, 3))
+
+    def test_sliding_window_view_strided_a(self) -> None:
+        from numpy.lib.stride_tricks import sliding_window_view
+
+        a1 = np.arange(12).reshape(4, 3)
+        for array, axis, size in ((a1, 0, 2), (a1, 1, 3), (a1[:, 1], 0, 4), (a1.T, 0, 1)):
+            post = _sliding_window_view_strided(array, size, axis)
+            self.assertEqual(post.tolist(),
+                    sliding_window_view(array, size, axis=axis).tolist())
+            self.assertFalse(post.flags.writeable)
+
+        with self.assertRaises(ValueError):
+            _sliding_window_view_strided(a1, 5, 0)
+
+    #---------------------------------------------------------------------------
+    @skip_win # type: ignore
+    def test_path_replace_manager_a(self) -> None:
+        with temp_file('.bin') as fp:
+            dir_name, base_name = os.path.split(fp)
+            def temps() -> tp.List[str]:
+                return [n for n in os.listdir(dir_name)
+                        if n.startswith(base_name) and n.endswith('.tmp')]
+
+            os.chmod(fp, 0o640)
+            # concurrent writers to the same path use distinct temporary paths
+            with path_replace_manager(fp) as fp1, path_replace_manager(fp) as fp2:
+                self.assertNotEqual(fp1, fp2)
+                self.assertEqual(len(temps()), 2)
+                for fp_temp in (fp1, fp2):
+                    with open(fp_temp, 'w') as f:
+                        f.write(fp_temp)
+            with open(fp) as f:
+                self.assertEqual(f.read(), fp1) # the last to exit
+            self.assertEqual(os.stat(fp).st_mode & 0o777, 0o640)
+            self.assertEqual(temps(), [])
+
+            with self.assertRaises(ValueError):
+                with path_replace_manager(fp) as fp_temp:
+                    with open(fp_temp, 'w') as f:
+                        f.write('x')
+                    raise ValueError()
+            with open(fp) as f:
+                self.assertEqual(f.read(), fp1)
+            self.assertEqual(temps(), [])
+
+
 if __name__ == '__main__':
     unittest.main()
 